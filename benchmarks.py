@@ -0,0 +1,330 @@
+#region Import
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import scipy
+from scipy import sparse
+from mae3403.distributions import generate_data_batch
+from mae3403.equations import DEFAULT_PARAMETERS, find_intersections, track_intersections
+from mae3403.linear_solvers import FactorizationCache, solve_matrix_equation, solve_structured
+#endregion
+
+#region Constants
+# Parameter grids of the benchmark cases; QUICK_PARAMETERS is a reduced set for smoke runs
+FULL_PARAMETERS = {
+    'generate_data': {'num_points': [1_000, 100_000], 'distributions': [2, 64]},
+    'find_intersections': {'num_points': [1_000, 10_000, 100_000]},
+    'sweep_find_intersections': {'num_points': [1_000, 100_000], 'steps': [100]},
+    'sweep_track_intersections': {'num_points': [1_000, 100_000], 'steps': [100]},
+    'solve_matrix_equation': {'size': [50, 200, 800], 'density': [1.0, 0.01]},
+    'solve_structured': {'size': [50, 200, 800], 'density': [1.0, 0.01]},
+}
+QUICK_PARAMETERS = {
+    'generate_data': {'num_points': [1_000], 'distributions': [2]},
+    'find_intersections': {'num_points': [1_000]},
+    'sweep_find_intersections': {'num_points': [1_000], 'steps': [20]},
+    'sweep_track_intersections': {'num_points': [1_000], 'steps': [20]},
+    'solve_matrix_equation': {'size': [50], 'density': [1.0, 0.01]},
+    'solve_structured': {'size': [50], 'density': [1.0, 0.01]},
+}
+
+# A case regresses when its median time exceeds the baseline by more than this fraction
+DEFAULT_THRESHOLD = 0.25
+#endregion
+
+#region Functions
+def make_test_matrix(size, density, seed=0):
+    """
+    Build a reproducible, well-conditioned random test system.
+
+    A random matrix with the given fraction of non-zeros is made strictly diagonally
+    dominant, so it is non-singular for every density and every solver converges.
+
+    Parameters:
+        size (int): Number of unknowns n.
+        density (float): Fraction of non-zero off-diagonal entries.
+        seed (int): Seed of the random number generator.
+
+    Returns:
+        tuple: The dense coefficient matrix (n, n) and the constant vector (n,).
+    """
+    rng = np.random.default_rng(seed)
+    coeff_matrix = sparse.random(size, size, density=density, random_state=rng).toarray()
+    coeff_matrix += np.diag(np.abs(coeff_matrix).sum(axis=1) + 1.0)
+    return coeff_matrix, rng.standard_normal(size)
+
+
+def setup_generate_data(num_points, distributions):
+    """
+    Prepare a batched PDF/CDF evaluation of several normal distributions.
+
+    Returns:
+        tuple: The function to time and the number of values it produces per call.
+    """
+    means = np.linspace(0.0, 175.0, distributions)
+    std_devs = np.linspace(1.0, 3.0, distributions)
+    x_ranges = np.column_stack((means - 5 * std_devs, means + 5 * std_devs))
+    return lambda: generate_data_batch(means, std_devs, x_ranges, num_points=num_points), 2 * num_points * distributions
+
+
+def setup_find_intersections(num_points):
+    """
+    Prepare the intersection search of ProblemB-1.py with a given bracketing grid.
+
+    Returns:
+        tuple: The function to time and the number of problems solved per call.
+    """
+    return lambda: find_intersections(num_points=num_points), 1
+
+
+def setup_sweep_find_intersections(num_points, steps):
+    """
+    Prepare a sweep of coefficient a over [0.5, 2] that reruns the global intersection search at every step.
+
+    This is the reference for setup_sweep_track_intersections().
+
+    Returns:
+        tuple: The function to time and the number of parameter steps per call.
+    """
+    parameter_rows = [(a,) + DEFAULT_PARAMETERS[1:] for a in np.linspace(0.5, 2.0, steps)]
+    return lambda: [find_intersections(row, num_points=num_points) for row in parameter_rows], steps
+
+
+def setup_sweep_track_intersections(num_points, steps):
+    """
+    Prepare the same sweep as setup_sweep_find_intersections(), followed by continuation.
+
+    The global search with num_points grid points only runs at the start and every 10
+    steps, so the cost per step hardly depends on num_points.
+
+    Returns:
+        tuple: The function to time and the number of parameter steps per call.
+    """
+    values = np.linspace(0.5, 2.0, steps)
+    return lambda: track_intersections('a', values, num_points=num_points), steps
+
+
+def setup_solve_matrix_equation(size, density):
+    """
+    Prepare a cold solve_matrix_equation() call, which goes through the LU factorization cache.
+
+    The cache is emptied before every solve so that the factorization is timed too.
+
+    Returns:
+        tuple: The function to time and the number of systems solved per call.
+    """
+    coeff_matrix, constant_vector = make_test_matrix(size, density)
+    cache = FactorizationCache()
+
+    def run():
+        cache.clear()
+        return solve_matrix_equation(coeff_matrix, constant_vector, cache=cache)
+    return run, 1
+
+
+def setup_solve_structured(size, density):
+    """
+    Prepare a solve with automatic backend selection, passing sparse systems in CSR form.
+
+    Returns:
+        tuple: The function to time and the number of systems solved per call.
+    """
+    coeff_matrix, constant_vector = make_test_matrix(size, density)
+    if density < 0.3:
+        coeff_matrix = sparse.csr_matrix(coeff_matrix)
+    return lambda: solve_structured(coeff_matrix, constant_vector), 1
+
+
+BENCHMARKS = {
+    'generate_data': setup_generate_data,
+    'find_intersections': setup_find_intersections,
+    'sweep_find_intersections': setup_sweep_find_intersections,
+    'sweep_track_intersections': setup_sweep_track_intersections,
+    'solve_matrix_equation': setup_solve_matrix_equation,
+    'solve_structured': setup_solve_structured,
+}
+
+
+def iter_cases(parameters, pattern=None):
+    """
+    Expand the parameter grids into individual benchmark cases.
+
+    Parameters:
+        parameters (dict): Benchmark name -> {parameter name: list of values}.
+        pattern (str, optional): Only cases whose name contains this string are kept.
+
+    Yields:
+        tuple: Case name such as 'generate_data[num_points=1000,distributions=2]', the
+            benchmark name and the parameter dict of the case.
+    """
+    for benchmark, grid in parameters.items():
+        for values in itertools.product(*grid.values()):
+            params = dict(zip(grid, values))
+            case = f"{benchmark}[{','.join(f'{name}={value}' for name, value in params.items())}]"
+            if pattern is None or pattern in case:
+                yield case, benchmark, params
+
+
+def time_function(func, repeats=5, min_time=0.05):
+    """
+    Time a function like timeit: calibrate a loop count, then take several repeats.
+
+    The loop count is doubled until one repeat lasts at least min_time, so that very
+    fast functions are not dominated by timer resolution. The median over the repeats
+    is the reported time; it is less sensitive to other load on the machine than the
+    mean, and the minimum is recorded as well.
+
+    Parameters:
+        func (callable): Function without arguments to time.
+        repeats (int): Number of timed repeats.
+        min_time (float): Minimum duration of one repeat in seconds.
+
+    Returns:
+        dict: {'median', 'min', 'max'} seconds per call, 'loops' per repeat and 'repeats'.
+    """
+    func()  # Warm-up call, so that lazy imports and caches are not timed
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= min_time:
+            break
+        loops *= 2
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        times.append((time.perf_counter() - start) / loops)
+    return {'median': float(np.median(times)), 'min': min(times), 'max': max(times),
+            'loops': loops, 'repeats': repeats}
+
+
+def run_benchmarks(parameters=FULL_PARAMETERS, pattern=None, repeats=5, min_time=0.05, progress=None):
+    """
+    Run all benchmark cases and collect the timings with metadata about the environment.
+
+    Parameters:
+        parameters (dict): Parameter grids, FULL_PARAMETERS or QUICK_PARAMETERS.
+        pattern (str, optional): Only cases whose name contains this string are run.
+        repeats (int): Number of timed repeats per case.
+        min_time (float): Minimum duration of one repeat in seconds.
+        progress (callable, optional): Called with (case name, result) after each case.
+
+    Returns:
+        dict: {'metadata': environment description, 'results': case name -> timing dict,
+               with the parameters and the throughput in items per second added}.
+    """
+    results = {}
+    for case, benchmark, params in iter_cases(parameters, pattern):
+        func, items = BENCHMARKS[benchmark](**params)
+        result = time_function(func, repeats, min_time)
+        result.update(benchmark=benchmark, params=params, throughput=items / result['median'])
+        results[case] = result
+        if progress is not None:
+            progress(case, result)
+    metadata = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+    return {'metadata': metadata, 'results': results}
+
+
+def compare_to_baseline(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare a benchmark report with a stored baseline report.
+
+    Only cases present in both reports are compared. A case regresses when its median
+    time per call is more than threshold (e.g. 0.25 = 25 %) above the baseline, which
+    is the same as its throughput dropping below 1 / (1 + threshold) of the baseline.
+
+    Parameters:
+        report (dict): Report returned by run_benchmarks().
+        baseline (dict): Earlier report to compare with.
+        threshold (float): Allowed relative slowdown.
+
+    Returns:
+        tuple: Tuple containing the following elements:
+            - list: (case name, baseline seconds, current seconds, ratio) of every compared
+              case, sorted from the largest slowdown
+            - list: the compared cases that regressed
+    """
+    comparisons = []
+    for case, result in report['results'].items():
+        reference = baseline.get('results', {}).get(case)
+        if reference is not None:
+            ratio = result['median'] / reference['median']
+            comparisons.append((case, reference['median'], result['median'], ratio))
+    comparisons.sort(key=lambda item: item[3], reverse=True)
+    regressions = [item for item in comparisons if item[3] > 1 + threshold]
+    return comparisons, regressions
+
+
+def main(argv=None):
+    """
+    Command-line entry point: run the benchmarks, write JSON results and check for regressions.
+
+    The exit status is 1 if any case regressed against the baseline, so the command can
+    gate a CI job. Baselines are machine specific; record one with --save-baseline on
+    the machine that runs the comparison.
+
+    Parameters:
+        argv (list, optional): Command-line arguments, sys.argv[1:] by default.
+
+    Returns:
+        int: Exit status.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the distribution, intersection and linear solver paths.")
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON file for the results (ignored by git by default)")
+    parser.add_argument('--baseline', default='benchmark_baseline.json', help="JSON baseline to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="store the results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown before a case counts as a regression")
+    parser.add_argument('--quick', action='store_true', help="run the reduced parameter grid")
+    parser.add_argument('--filter', dest='pattern', help="only run cases whose name contains this string")
+    parser.add_argument('--repeats', type=int, default=5, help="timed repeats per case")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(QUICK_PARAMETERS if args.quick else FULL_PARAMETERS, args.pattern, args.repeats,
+                            progress=lambda case, result: print(
+                                f"{case:60s} {result['median'] * 1e3:10.3f} ms  {result['throughput']:12.4g} items/s"))
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    comparisons, regressions = compare_to_baseline(report, baseline, args.threshold)
+    for case, reference, current, ratio in comparisons:
+        flag = '  REGRESSION' if (case, reference, current, ratio) in regressions else ''
+        print(f"{case:60s} {reference * 1e3:10.3f} -> {current * 1e3:10.3f} ms  ({ratio:5.2f}x){flag}")
+    if regressions:
+        print(f"{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+        return 1
+    return 0
+#endregion
+
+if __name__ == '__main__':
+    sys.exit(main())
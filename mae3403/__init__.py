@@ -0,0 +1,106 @@
+"""
+Numerics of MAE 3403 homework 4 as an importable library.
+
+The package covers the normal distributions of ProblemA-4.py, the equations and
+intersections of ProblemB-1.py and the linear systems of ProblemC-matrix arrays.py,
+together with the faster and more general tools built around them. The scripts
+themselves, and ``python -m mae3403``, are thin command-line front ends (see cli).
+
+Importing the package is cheap: the names below are resolved on first access
+(PEP 562), so a worker process that only needs equation1 never imports
+matplotlib, and scipy submodules are imported by the functions that use them when
+they are first called.
+"""
+#region Import
+import importlib
+#endregion
+
+#region Constants
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'generate_data': 'distributions',
+    'generate_data_batch': 'distributions',
+    'generate_data_adaptive': 'adaptive_grid',
+    'norm_pdf': 'normal_kernel',
+    'norm_logpdf': 'normal_kernel',
+    'norm_cdf': 'normal_kernel',
+    'norm_sf': 'normal_kernel',
+    'probability_below': 'probability_queries',
+    'probability_above': 'probability_queries',
+    'probability_between': 'probability_queries',
+    'quantile': 'probability_queries',
+    'run_monte_carlo': 'monte_carlo',
+    'evaluate_chunked': 'chunked_evaluation',
+    'PARAMETER_NAMES': 'equations',
+    'DEFAULT_PARAMETERS': 'equations',
+    'equation1': 'equations',
+    'equation2': 'equations',
+    'equation1_derivative': 'equations',
+    'equation2_derivative': 'equations',
+    'find_intersections': 'equations',
+    'find_intersections_certified': 'equations',
+    'find_intersections_chebyshev': 'equations',
+    'track_intersections': 'equations',
+    'find_roots_bracketed': 'root_finding',
+    'batch_newton': 'root_finding',
+    'run_sweep': 'parameter_sweep',
+    'make_parameter_grid': 'parameter_sweep',
+    'write_sweep': 'parameter_sweep',
+    'MemoizedFunction': 'evaluation_cache',
+    'memoize': 'evaluation_cache',
+    'CompiledEquation': 'equation_registry',
+    'EquationRegistry': 'equation_registry',
+    'solve_matrix_equation': 'linear_solvers',
+    'solve_batched': 'linear_solvers',
+    'solve_structured': 'linear_solvers',
+    'solve_with_diagnostics': 'linear_solvers',
+    'FactorizationCache': 'linear_solvers',
+    'solve_iterative': 'iterative_solvers',
+    'plot_distributions': 'figures',
+    'plot_equations_with_intersections': 'figures',
+    'plot_solution_tables': 'figures',
+    'DistributionFigure': 'figures',
+    'render_figure': 'rendering',
+    'render_many': 'rendering',
+    'run_batch': 'batch',
+    'open_sink': 'result_sinks',
+    'load_results': 'result_sinks',
+    'timer': 'instrumentation',
+    'timed': 'instrumentation',
+    'write_metrics': 'instrumentation',
+}
+
+_SUBMODULES = {
+    'adaptive_grid', 'batch', 'chebyshev_proxy', 'chunked_evaluation', 'cli', 'continuation', 'distributions',
+    'equation_registry', 'equations', 'evaluation_cache', 'figures', 'instrumentation', 'iterative_solvers',
+    'linear_solvers', 'monte_carlo', 'normal_kernel', 'parameter_sweep', 'probability_queries', 'rendering',
+    'result_sinks', 'root_finding', 'root_isolation',
+}
+
+__all__ = list(_EXPORTS)
+#endregion
+
+#region Functions
+def __getattr__(name):
+    """
+    Import the submodule behind a public name on first access and cache the result.
+
+    Parameters:
+        name (str): Attribute requested from the package.
+
+    Returns:
+        object: The exported function, class or constant, or the submodule itself.
+    """
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | _SUBMODULES)
+#endregion
@@ -0,0 +1,263 @@
+#region Import
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+
+import numpy as np
+#endregion
+
+#region Constants
+# Job types accepted in a manifest and the fields each one understands (all optional but
+# the matrix and vector of a 'matrix' job)
+JOB_FIELDS = {
+    'distribution': ('mean', 'std', 'lower', 'upper', 'num_points'),
+    'intersections': ('a', 'b', 'c', 'd', 'e', 'lower', 'upper', 'num_points'),
+    'matrix': ('matrix', 'vector'),
+}
+#endregion
+
+#region Functions
+def _parse_csv_value(value):
+    """
+    Convert a CSV cell to an int or float where possible.
+
+    Parameters:
+        value (str): Cell text.
+
+    Returns:
+        int, float, str or None: The converted value; None for an empty cell.
+    """
+    value = value.strip()
+    if value == '':
+        return None
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+    return value
+
+
+def read_manifest(path):
+    """
+    Read the jobs of a manifest lazily, one at a time.
+
+    A manifest is either a JSON Lines file (one JSON object per line; blank lines are
+    skipped) or a CSV file with a header row, chosen by the extension .csv. Every job
+    has a 'type' from JOB_FIELDS and the fields of that type; empty CSV cells are
+    left out so that the defaults apply. A job without an 'id' gets its 1-based
+    position in the manifest as id. Relative file names in 'matrix' jobs are
+    resolved against the directory of the manifest.
+
+    Because the jobs are generated one by one, manifests with millions of jobs are
+    never held in memory.
+
+    Parameters:
+        path (str or os.PathLike): Manifest file.
+
+    Yields:
+        dict: The jobs in manifest order.
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, newline='') as file:
+        if os.fspath(path).lower().endswith('.csv'):
+            rows = ({key: _parse_csv_value(value) for key, value in row.items() if key is not None}
+                    for row in csv.DictReader(file))
+            rows = ({key: value for key, value in row.items() if value is not None} for row in rows)
+        else:
+            rows = (json.loads(line) for line in file if line.strip())
+        for position, job in enumerate(rows, start=1):
+            job.setdefault('id', position)
+            for key in ('matrix', 'vector'):
+                if isinstance(job.get(key), str):
+                    job[key] = os.path.join(base, job[key])
+            yield job
+
+
+def load_array(source):
+    """
+    Load a matrix or vector given inline or as a file (.npy, or text such as .csv/.txt).
+
+    Parameters:
+        source (list or str): Nested list of numbers, or path of the file.
+
+    Returns:
+        numpy.ndarray: The array as floats.
+    """
+    if not isinstance(source, str):
+        return np.asarray(source, dtype=float)
+    if source.lower().endswith('.npy'):
+        return np.load(source).astype(float)
+    return np.loadtxt(source, delimiter=',' if source.lower().endswith('.csv') else None, ndmin=1)
+
+
+def run_job(job):
+    """
+    Run a single manifest job and describe the outcome.
+
+    Errors are caught and reported in the result, so one bad job does not stop a batch.
+    A result with NaN or infinite values is reported as an error too, since it is not
+    a usable answer and cannot be written as standard JSON.
+
+    Parameters:
+        job (dict): Job with 'id', 'type' and the fields of that type.
+
+    Returns:
+        dict: {'id', 'type', 'status' ('ok' or 'error'), 'seconds'} plus 'result' (a dict
+            of lists) on success or 'error' (the message) on failure.
+    """
+    start = time.perf_counter()
+    job_type = job.get('type')
+    outcome = {'id': job.get('id'), 'type': job_type}
+    try:
+        if job_type not in JOB_FIELDS:
+            raise ValueError(f"Unknown job type {job_type!r}, expected one of {', '.join(JOB_FIELDS)}")
+        unknown = set(job) - set(JOB_FIELDS[job_type]) - {'id', 'type'}
+        if unknown:
+            raise ValueError(f"Unknown fields for job type {job_type}: {', '.join(sorted(unknown))}")
+
+        if job_type == 'distribution':
+            from .distributions import generate_data_batch
+            mean, std = job.get('mean', 0.0), job.get('std', 1.0)
+            x_range = (job.get('lower', mean - 5 * std), job.get('upper', mean + 5 * std))
+            x, pdf, cdf = generate_data_batch([mean], [std], [x_range], num_points=int(job.get('num_points', 1000)))
+            result = {'x': x[0].tolist(), 'pdf': pdf[0].tolist(), 'cdf': cdf[0].tolist()}
+        elif job_type == 'intersections':
+            from .equations import DEFAULT_PARAMETERS, PARAMETER_NAMES, find_intersections
+            parameters = tuple(job.get(name, default) for name, default in zip(PARAMETER_NAMES, DEFAULT_PARAMETERS))
+            roots = find_intersections(parameters, job.get('lower', -5.0), job.get('upper', 5.0),
+                                       int(job.get('num_points', 1000)))
+            result = {'roots': roots.tolist()}
+        else:
+            from .linear_solvers import solve_matrix_equation
+            if 'matrix' not in job or 'vector' not in job:
+                raise ValueError("A matrix job needs both 'matrix' and 'vector'")
+            result = {'solution': solve_matrix_equation(load_array(job['matrix']), load_array(job['vector'])).tolist()}
+        for name, values in result.items():
+            if not np.all(np.isfinite(values)):
+                raise ValueError(f"The {name} contains NaN or infinite values")
+        outcome.update(status='ok', result=result)
+    except Exception as error:
+        outcome.update(status='error', error=f"{type(error).__name__}: {error}")
+    outcome['seconds'] = time.perf_counter() - start
+    return outcome
+
+
+def _run_chunk(jobs):
+    """
+    Worker task that runs a chunk of jobs.
+
+    Parameters:
+        jobs (list): Jobs to run in order.
+
+    Returns:
+        list: The outcome of every job, see run_job().
+    """
+    return [run_job(job) for job in jobs]
+
+
+def completed_job_ids(output):
+    """
+    Collect the ids of the jobs already recorded in a results file.
+
+    A line cut off by a crash is ignored, so its job is run again.
+
+    Parameters:
+        output (str or os.PathLike): JSON Lines results file written by run_batch().
+
+    Returns:
+        set: Ids of the recorded jobs; empty if the file does not exist.
+    """
+    done = set()
+    if not os.path.exists(output):
+        return done
+    with open(output) as file:
+        for line in file:
+            try:
+                done.add(json.loads(line)['id'])
+            except (json.JSONDecodeError, KeyError):
+                pass
+    return done
+
+
+def run_batch(manifest, output, processes=None, chunksize=64, max_pending=None, resume=False, progress=None):
+    """
+    Run every job of a manifest in a worker pool and write the outcomes as they finish.
+
+    The jobs are read lazily and grouped into chunks of chunksize jobs, which are
+    submitted to a pool of worker processes; chunking keeps the inter-process overhead
+    small for the many short jobs of a large batch. At most max_pending chunks are in
+    flight at any time, so neither the manifest nor the results pile up in memory,
+    however many jobs there are.
+
+    Each outcome is appended to the JSON Lines output file as soon as its chunk
+    finishes, and the file is flushed after every chunk. A crash therefore loses at
+    most the chunks that were running, and with resume=True a rerun skips the jobs
+    whose outcomes are already in the file. Outcomes are written in completion order;
+    use their 'id' to match them with the manifest.
+
+    Parameters:
+        manifest (str or os.PathLike): JSON Lines or CSV manifest, see read_manifest().
+        output (str or os.PathLike): JSON Lines file for the outcomes, see run_job().
+        processes (int, optional): Number of worker processes, os.cpu_count() if None;
+            1 runs the jobs in the calling process.
+        chunksize (int): Number of jobs per worker task.
+        max_pending (int, optional): Largest number of chunks in flight, 4 * processes by default.
+        resume (bool): Append to an existing output file and skip the jobs recorded in it.
+        progress (callable, optional): Called with the summary dict after every chunk.
+
+    Returns:
+        dict: Summary {'ok': jobs that succeeded, 'error': jobs that failed,
+              'skipped': jobs already recorded when resuming}.
+    """
+    done = completed_job_ids(output) if resume else set()
+    summary = {'ok': 0, 'error': 0, 'skipped': 0}
+
+    def pending_jobs():
+        for job in read_manifest(manifest):
+            if job['id'] in done:
+                summary['skipped'] += 1
+            else:
+                yield job
+
+    jobs = pending_jobs()
+    chunks = iter(lambda: list(itertools.islice(jobs, chunksize)), [])
+    if max_pending is None:
+        max_pending = 4 * (processes or os.cpu_count() or 1)
+
+    with open(output, 'a' if resume else 'w') as file:
+        if file.tell() > 0:
+            # Terminate a last line that was cut off by a crash before appending
+            with open(output, 'rb') as existing:
+                existing.seek(-1, os.SEEK_END)
+                if existing.read(1) != b'\n':
+                    file.write('\n')
+
+        def record(outcomes):
+            for outcome in outcomes:
+                file.write(json.dumps(outcome) + '\n')
+                summary[outcome['status']] += 1
+            file.flush()
+            if progress is not None:
+                progress(dict(summary))
+
+        if processes == 1:
+            for chunk in chunks:
+                record(_run_chunk(chunk))
+            return summary
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending = set()
+            for chunk in chunks:
+                pending.add(executor.submit(_run_chunk, chunk))
+                if len(pending) >= max_pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        record(future.result())
+            for future in as_completed(pending):
+                record(future.result())
+    return summary
+#endregion
@@ -0,0 +1,154 @@
+#region Import
+import numpy as np
+from numpy.polynomial import Chebyshev
+from .root_finding import batch_newton, merge_roots
+#endregion
+
+#region Classes
+class ChebyshevProxy:
+    """
+    Chebyshev interpolant of a smooth function on an interval, accurate to about machine precision.
+
+    In the spirit of Chebfun, the function is interpolated at Chebyshev points with
+    degrees 16, 32, 64, ... until the trailing Chebyshev coefficients have decayed
+    below tol relative to the largest one; the negligible tail is then chopped off.
+    For smooth (analytic) functions such as the equations of ProblemB-1.py the
+    coefficients decay geometrically, so this takes a few hundred function
+    evaluations, each stage being a single vectorized call.
+
+    The proxy then stands in for the function: evaluation, derivatives and integrals
+    are exact operations on the Chebyshev series, and all real roots on the interval
+    are found at once as eigenvalues of the colleague matrix (the Chebyshev analogue
+    of the companion matrix) instead of one nonlinear solve per starting guess.
+
+    Parameters:
+        func (callable): Vectorized function to approximate; it must be finite on the interval.
+        lower (float): Lower end of the interval.
+        upper (float): Upper end of the interval.
+        tol (float): Relative size below which trailing coefficients are negligible.
+        max_degree (int): Largest degree tried before giving up on convergence.
+    """
+
+    def __init__(self, func, lower, upper, tol=1e-14, max_degree=4096):
+        self.func = func
+        self.lower, self.upper = float(lower), float(upper)
+        self.num_evaluations = 0
+        self.converged = False
+
+        degree = 16
+        while True:
+            series = Chebyshev.interpolate(func, degree, domain=[self.lower, self.upper])
+            self.num_evaluations += degree + 1
+            coefficients = np.abs(series.coef)
+            if not np.all(np.isfinite(coefficients)):
+                raise ValueError("ChebyshevProxy requires a function that is finite on the whole interval")
+            scale = coefficients.max()
+            if scale == 0 or np.all(coefficients[-4:] <= tol * scale):
+                self.converged = True
+                break
+            if 2 * degree > max_degree:
+                break
+            degree *= 2
+
+        if scale > 0:
+            # Chop the tail of coefficients that are negligible relative to the largest one
+            significant = np.nonzero(coefficients > tol * scale)[0]
+            series = series.cutdeg(significant[-1])
+        self.series = series
+
+    @classmethod
+    def _from_series(cls, series, func=None):
+        """
+        Wrap an existing Chebyshev series (e.g. a derivative) in a ChebyshevProxy.
+
+        Parameters:
+            series (numpy.polynomial.Chebyshev): Series with the proxy's domain.
+            func (callable, optional): Function the series approximates, if known.
+
+        Returns:
+            ChebyshevProxy: Proxy around the series.
+        """
+        proxy = cls.__new__(cls)
+        proxy.func = func if func is not None else series
+        proxy.lower, proxy.upper = (float(v) for v in series.domain)
+        proxy.num_evaluations = 0
+        proxy.converged = True
+        proxy.series = series
+        return proxy
+
+    @property
+    def degree(self):
+        """Degree of the Chebyshev series after chopping."""
+        return self.series.degree()
+
+    def __call__(self, x):
+        """
+        Evaluate the proxy at x with Clenshaw's recurrence.
+
+        Parameters:
+            x (float or array_like): Points in [lower, upper].
+
+        Returns:
+            float or numpy.ndarray: Values of the proxy.
+        """
+        return self.series(x)
+
+    def derivative(self, order=1):
+        """
+        Return the derivative of the proxy as a new proxy.
+
+        Parameters:
+            order (int): Order of the derivative.
+
+        Returns:
+            ChebyshevProxy: Proxy of the derivative.
+        """
+        return ChebyshevProxy._from_series(self.series.deriv(order))
+
+    def integral(self, lower=None, upper=None):
+        """
+        Compute the definite integral of the proxy.
+
+        Parameters:
+            lower (float, optional): Lower limit, the start of the interval by default.
+            upper (float, optional): Upper limit, the end of the interval by default.
+
+        Returns:
+            float: The integral from lower to upper.
+        """
+        antiderivative = self.series.integ()
+        lower = self.lower if lower is None else lower
+        upper = self.upper if upper is None else upper
+        return float(antiderivative(upper) - antiderivative(lower))
+
+    def roots(self, polish=True, imag_tol=1e-8):
+        """
+        Find all real roots of the proxy on its interval from the colleague matrix eigenvalues.
+
+        The eigenvalues with a negligible imaginary part that fall inside the interval
+        are the real roots. With polish=True every root is then improved with a Newton
+        step on the original function (using the proxy's derivative), which removes
+        the small error of the interpolant itself.
+
+        Parameters:
+            polish (bool): Whether to refine the roots against the original function.
+            imag_tol (float): Largest imaginary part, relative to the interval half-width,
+                of an eigenvalue accepted as a real root.
+
+        Returns:
+            numpy.ndarray: Sorted real roots in [lower, upper].
+        """
+        if self.degree < 1:
+            return np.empty(0)
+        half_width = 0.5 * (self.upper - self.lower)
+        candidates = self.series.roots()
+        real = candidates[np.abs(candidates.imag) <= imag_tol * half_width].real
+        margin = 1e-12 * half_width
+        real = real[(real >= self.lower - margin) & (real <= self.upper + margin)]
+
+        if polish and real.size:
+            derivative = self.series.deriv()
+            polished, converged = batch_newton(self.func, real, fprime=derivative, maxiter=5)
+            real = np.where(converged, polished, real)
+        return merge_roots(np.clip(real, self.lower, self.upper), tol=1e-12 * half_width)
+#endregion
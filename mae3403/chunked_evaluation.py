@@ -0,0 +1,89 @@
+#region Import
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from .normal_kernel import norm_cdf, norm_pdf
+#endregion
+
+#region Functions
+def evaluate_chunked(x_values, mean, std, pdf_path, cdf_path, chunk_size=1 << 20, threads=1, dtype=np.float64):
+    """
+    Evaluate the normal PDF and CDF over data that is too large for memory, chunk by chunk.
+
+    The x values are read from a memory-mapped .npy file (or any array-like such as an
+    existing numpy.memmap) and the results are written into two output .npy files that
+    are also memory-mapped. Each chunk is evaluated directly into its slice of the
+    output maps by the normal_kernel functions, so besides the mapped pages the only
+    memory used is one chunk of input per thread; the peak memory is about
+    threads * chunk_size values regardless of the size of the data set.
+
+    numpy releases the GIL inside its ufunc loops, so with threads > 1 the chunks are
+    evaluated in parallel by a thread pool without the copying that worker processes
+    would need.
+
+    Parameters:
+        x_values (str, os.PathLike or array_like): Path of a 1-D .npy file of x values, or
+            an array-like (e.g. numpy.memmap) holding them.
+        mean (float): Mean μ of the distribution.
+        std (float): Standard deviation σ of the distribution.
+        pdf_path (str or os.PathLike): Output .npy file for the PDF values.
+        cdf_path (str or os.PathLike): Output .npy file for the CDF values.
+        chunk_size (int): Number of values evaluated per chunk.
+        threads (int): Number of chunks evaluated in parallel.
+        dtype (numpy.dtype): np.float64 (default) or np.float32 for half-size outputs.
+
+    Returns:
+        tuple: The PDF and CDF results as read-only numpy.memmap arrays.
+    """
+    if isinstance(x_values, (str, os.PathLike)):
+        x_values = np.load(x_values, mmap_mode='r')
+    if np.ndim(x_values) != 1:
+        raise ValueError("x_values must be one-dimensional")
+    n = len(x_values)
+    pdf = np.lib.format.open_memmap(pdf_path, mode='w+', dtype=dtype, shape=(n,))
+    cdf = np.lib.format.open_memmap(cdf_path, mode='w+', dtype=dtype, shape=(n,))
+
+    def evaluate(start):
+        stop = min(start + chunk_size, n)
+        x = np.asarray(x_values[start:stop], dtype=dtype)
+        norm_pdf(x, mean, std, out=pdf[start:stop], dtype=dtype)
+        norm_cdf(x, mean, std, out=cdf[start:stop], dtype=dtype)
+
+    starts = range(0, n, chunk_size)
+    if threads == 1:
+        for start in starts:
+            evaluate(start)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            # Consume the results so that exceptions from the workers are raised here
+            for _ in executor.map(evaluate, starts):
+                pass
+
+    pdf.flush()
+    cdf.flush()
+    del pdf, cdf
+    return np.load(pdf_path, mmap_mode='r'), np.load(cdf_path, mmap_mode='r')
+
+
+def iter_evaluate_chunks(chunks, mean, std, dtype=np.float64):
+    """
+    Evaluate the normal PDF and CDF for a stream of x-value chunks.
+
+    This is the streaming form of evaluate_chunked() for sources whose total length
+    is not known in advance, such as measurements read from a socket or a chain of
+    files. Each chunk is evaluated as soon as it arrives and the results are yielded
+    before the next chunk is read, so only one chunk is held in memory at a time.
+
+    Parameters:
+        chunks (iterable): Iterable of 1-D arrays of x values.
+        mean (float): Mean μ of the distribution.
+        std (float): Standard deviation σ of the distribution.
+        dtype (numpy.dtype): np.float64 (default) or np.float32.
+
+    Yields:
+        tuple: The PDF and CDF values of each chunk.
+    """
+    for chunk in chunks:
+        yield norm_pdf(chunk, mean, std, dtype=dtype), norm_cdf(chunk, mean, std, dtype=dtype)
+#endregion
@@ -0,0 +1,234 @@
+#region Import
+import argparse
+import sys
+
+import numpy as np
+from .instrumentation import enable, timer, write_metrics
+#endregion
+
+#region Functions
+def _show_or_render(build, output=None, figsize=None):
+    """
+    Render a figure to a file headlessly, or show it in a window if no file is given.
+
+    pyplot (and with it a GUI backend) is only imported in the interactive case.
+
+    Parameters:
+        build (callable): Function build(fig) that draws into fig, or creates a Figure when fig is None.
+        output (str, optional): Output file; its extension selects the format.
+        figsize (tuple, optional): Size of the interactive window in inches.
+    """
+    if output is not None:
+        from .rendering import render_figure
+        render_figure(build(None), output)
+    else:
+        import matplotlib.pyplot as plt
+        build(plt.figure(figsize=figsize))
+        plt.show()
+
+
+def _write_results(results, metadata, **columns):
+    """
+    Write the results of a problem as a single chunk to a columnar results file.
+
+    Parameters:
+        results (str): Results file; its extension (.npz, .parquet or .h5) selects the format.
+        metadata (dict): Parameters, tolerances and solver of the run.
+        **columns: Columns of the chunk, see result_sinks.ResultSink.append().
+    """
+    from .result_sinks import open_sink
+    with timer('serialize.results'), open_sink(results, metadata=metadata) as sink:
+        sink.append(**columns)
+    print(f"Results written to {results}")
+
+
+def run_distributions(output=None, results=None):
+    """
+    Run ProblemA-4: plot the PDFs and CDFs of the two normal distributions.
+
+    Parameters:
+        output (str, optional): File to render to (e.g. report.png, .svg or .pdf)
+            instead of showing the plots.
+        results (str, optional): Columnar file (.npz, .parquet or .h5) to write the x
+            values, PDFs and CDFs to instead of plotting them.
+    """
+    from .distributions import generate_data
+
+    # Generate data
+    data = generate_data()
+
+    if results is not None:
+        x1, x2, pdf1, pdf2, cdf1, cdf2 = data
+        _write_results(results, {'problem': 'distributions', 'means': [0, 175], 'std_devs': [1, 3],
+                                 'x_ranges': [[-5, 5], [160, 190]], 'num_points': len(x1),
+                                 'solver': 'normal_kernel closed form'},
+                       mean=np.array([0.0, 175.0]), std_dev=np.array([1.0, 3.0]),
+                       x=np.stack((x1, x2)), pdf=np.stack((pdf1, pdf2)), cdf=np.stack((cdf1, cdf2)))
+        return
+
+    from .figures import plot_distributions
+
+    # Create plots
+    _show_or_render(lambda fig: plot_distributions(data, fig), output, figsize=(20, 10))
+
+
+def run_intersections(output=None, results=None):
+    """
+    Run ProblemB-1: print the roots and intersections of the two equations and plot them.
+
+    Parameters:
+        output (str, optional): File to render the plot to instead of showing it.
+        results (str, optional): Columnar file (.npz, .parquet or .h5) to write the roots
+            and intersections to instead of printing and plotting them.
+    """
+    from .equation_registry import default_registry
+    from .equations import DEFAULT_PARAMETERS, PARAMETER_NAMES
+    from .evaluation_cache import MemoizedFunction
+    from .root_finding import batch_newton
+
+    compiled = (default_registry['equation1'], default_registry['equation2'])
+
+    # Memoized equations, so that points evaluated by the solves are not recomputed by the plot
+    equations = tuple(MemoizedFunction(equation) for equation in compiled)
+
+    # Find the roots of equation 1 (all starting guesses are iterated together)
+    roots1, converged1 = batch_newton(equations[0], [0, 1, 2, 3, 4], fprime=compiled[0].derivative)
+
+    # Find the roots of equation 2
+    roots2, converged2 = batch_newton(equations[1], [-1, 0, 1, 2, 3], fprime=compiled[1].derivative)
+
+    # Find the intersections with the compiled kernels
+    intersections = default_registry.find_intersections('equation1', 'equation2')
+
+    if results is not None:
+        _write_results(results, {'problem': 'intersections',
+                                 'parameters': dict(zip(PARAMETER_NAMES, DEFAULT_PARAMETERS)),
+                                 'starting_guesses': [[0, 1, 2, 3, 4], [-1, 0, 1, 2, 3]],
+                                 'tolerance': 1e-10, 'max_iterations': 50, 'root_solver': 'batch_newton',
+                                 'search_interval': [-5.0, 5.0], 'num_points': 1000,
+                                 'intersection_solver': 'find_roots_bracketed (Brent)'},
+                       roots1=[roots1], converged1=[converged1], roots2=[roots2], converged2=[converged2],
+                       intersections=[intersections])
+        return
+
+    from .figures import plot_equations_with_intersections
+
+    # Print roots and intersection points
+    print("Roots of equation 1:", roots1)
+    print("Roots of equation 2:", roots2)
+    print("Intersection points:", intersections)
+
+    # Plot equations with intersections
+    _show_or_render(lambda fig: plot_equations_with_intersections(fig, equations=equations,
+                                                                  intersection_points=intersections),
+                    output, figsize=(8, 6))
+
+
+def run_matrix(output=None, results=None):
+    """
+    Run ProblemC: solve the two example matrix equations and display the solutions as tables.
+
+    Parameters:
+        output (str, optional): File to render the tables to instead of showing them.
+        results (str, optional): Columnar file (.npz, .parquet or .h5) to write the
+            solution vectors to instead of printing and tabulating them.
+    """
+    from .linear_solvers import solve_matrix_equation
+
+    # Define the coefficient matrix and constant vector for the first matrix equation
+    A1 = np.array([[3, 1, -1],
+                   [1, 4, 1],
+                   [2, 1, 2]])
+    b1 = np.array([2, 12, 10])
+
+    # Solve the first equation
+    x1 = solve_matrix_equation(A1, b1)
+
+    # Define the coefficient matrix and constant vector for the second matrix equation
+    A2 = np.array([[1, -10, 2, 4],
+                   [3, 0, 12, 0],
+                   [9, 2, 3, 4],
+                   [0, 0, 7, 0]])
+    b2 = np.array([2, 12, 21, 37])
+
+    # Solve the second equation
+    x2 = solve_matrix_equation(A2, b2)
+
+    if results is not None:
+        _write_results(results, {'problem': 'matrix', 'solver': 'LU (scipy.linalg.lu_factor / lu_solve)',
+                                 'coefficient_matrices': [A1.tolist(), A2.tolist()],
+                                 'constant_vectors': [b1.tolist(), b2.tolist()]},
+                       size=np.array([len(b1), len(b2)]), solution=[x1, x2],
+                       residual_norm=np.array([np.linalg.norm(A1 @ x1 - b1), np.linalg.norm(A2 @ x2 - b2)]))
+        return
+
+    # Display the coefficient matrices
+    print("Coefficient matrix for the first equation (A1):")
+    print(A1)
+    print(b1)
+    print("Coefficient matrix for the second equation (A2):")
+    print(A2)
+    print(b2)
+
+    # Display solutions as tables
+    from .figures import plot_solution_tables
+    _show_or_render(lambda fig: plot_solution_tables([x1, x2], fig), output)
+
+
+COMMANDS = {
+    'distributions': run_distributions,
+    'intersections': run_intersections,
+    'matrix': run_matrix,
+}
+
+
+def main(argv=None):
+    """
+    Command-line entry point, used by ``python -m mae3403``.
+
+    Parameters:
+        argv (list, optional): Command-line arguments, sys.argv[1:] by default.
+
+    Returns:
+        int: Exit status.
+    """
+    parser = argparse.ArgumentParser(prog='mae3403', description="MAE 3403 homework 4 problems.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, command in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=command.__doc__.strip().splitlines()[0])
+        subparser.add_argument('output', nargs='?',
+                               help="render the figure to this file instead of showing it")
+        subparser.add_argument('--results', metavar='PATH',
+                               help="write the results to a .npz, .parquet or .h5 file instead of "
+                                    "printing and plotting them")
+        subparser.add_argument('--metrics', metavar='PATH',
+                               help="collect timings and counters and write them to a .json or .prom file")
+
+    batch_parser = subparsers.add_parser('batch', help="Run the jobs of a JSONL or CSV manifest in a worker pool.")
+    batch_parser.add_argument('manifest', help="JSON Lines (.jsonl) or CSV (.csv) job manifest")
+    batch_parser.add_argument('output', help="JSON Lines file the job outcomes are appended to")
+    batch_parser.add_argument('--processes', type=int, help="number of worker processes (default: all CPUs)")
+    batch_parser.add_argument('--chunksize', type=int, default=64, help="jobs per worker task")
+    batch_parser.add_argument('--max-pending', type=int, help="largest number of chunks in flight")
+    batch_parser.add_argument('--resume', action='store_true', help="skip jobs already in the output file")
+    batch_parser.add_argument('--metrics', metavar='PATH',
+                              help="collect timings and counters of this process (not of the workers) "
+                                   "and write them to a .json or .prom file")
+
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    if args.metrics is not None:
+        enable()
+    status = 0
+    with timer(f'cli.{args.command}'):
+        if args.command == 'batch':
+            from .batch import run_batch
+            summary = run_batch(args.manifest, args.output, args.processes, args.chunksize, args.max_pending,
+                                args.resume)
+            print(f"{summary['ok']} jobs succeeded, {summary['error']} failed, {summary['skipped']} skipped")
+            status = 1 if summary['error'] else 0
+        else:
+            COMMANDS[args.command](args.output, args.results)
+    if args.metrics is not None:
+        write_metrics(args.metrics)
+    return status
+#endregion
@@ -0,0 +1,263 @@
+#region Import
+import numpy as np
+from .root_finding import batch_newton
+#endregion
+
+#region Constants
+# Relative step of the central differences for the parameter derivatives, about the
+# cube root of machine epsilon, which balances truncation and round-off error
+FD_STEP = np.cbrt(np.finfo(float).eps)
+#endregion
+
+#region Functions
+def _parameter_derivative(func, x, p, dfdp=None):
+    """
+    Evaluate ∂f/∂p analytically if dfdp is given, otherwise with a central difference.
+
+    Parameters:
+        func (callable): Function f(x, p).
+        x (float or numpy.ndarray): Points on the branches.
+        p (float): Parameter value.
+        dfdp (callable, optional): Analytic derivative ∂f/∂p(x, p).
+
+    Returns:
+        float or numpy.ndarray: ∂f/∂p at (x, p).
+    """
+    if dfdp is not None:
+        return dfdp(x, p)
+    h = FD_STEP * max(1.0, abs(p))
+    return (func(x, p + h) - func(x, p - h)) / (2 * h)
+
+
+def continuation_step(func, fprime, x, p_from, p_to, dfdp=None, tol=1e-10, maxiter=20):
+    """
+    Move roots of f(x, p) = 0 from p_from to p_to with a tangent predictor and a Newton corrector.
+
+    Along a branch of simple roots x(p) the implicit function theorem gives the slope
+    dx/dp = -(∂f/∂p) / (∂f/∂x). The predictor follows this tangent over the step,
+    x + (p_to - p_from) dx/dp, and the corrector refines the prediction with Newton's
+    method at p_to (root_finding.batch_newton, all branches together). Since the
+    prediction is already close, the corrector usually converges in 2-3 iterations.
+
+    A branch is reported as failed if Newton does not converge or if ∂f/∂x changes
+    sign, which means the corrector has jumped to a neighbouring root: simple roots of
+    a continuous function alternate in the sign of their slope, and a branch keeps its
+    sign until it runs into a fold.
+
+    Parameters:
+        func (callable): Function f(x, p), vectorized in x.
+        fprime (callable): Derivative ∂f/∂x(x, p).
+        x (array_like): Roots at p_from, one per branch.
+        p_from (float): Current parameter value.
+        p_to (float): Next parameter value.
+        dfdp (callable, optional): Analytic derivative ∂f/∂p(x, p); a central difference
+            is used if omitted.
+        tol (float): Relative step tolerance of the Newton corrector.
+        maxiter (int): Maximum number of Newton iterations.
+
+    Returns:
+        tuple: The corrected roots at p_to and a boolean mask of the branches that succeeded.
+    """
+    x = np.array(x, dtype=float, ndmin=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = fprime(x, p_from)
+        x_pred = x - (p_to - p_from) * _parameter_derivative(func, x, p_from, dfdp) / slope
+        x_new, converged = batch_newton(func, x_pred, fprime=fprime, args=(p_to,), tol=tol, maxiter=maxiter)
+        ok = converged & (np.sign(fprime(x_new, p_to)) == np.sign(slope))
+    return x_new, ok
+
+
+def locate_fold(func, fprime, x0, p0, dfdp=None, tol=1e-10, maxiter=50):
+    """
+    Locate a fold (turning point) of the root branches near (x0, p0).
+
+    At a fold two branches of roots meet and disappear: f(x, p) = 0 and ∂f/∂x(x, p) = 0
+    hold simultaneously. This 2×2 system is solved for (x, p) with Newton's method,
+    using the Jacobian [[∂f/∂x, ∂f/∂p], [∂²f/∂x², ∂²f/∂x∂p]] whose second derivatives
+    are central differences of fprime.
+
+    Parameters:
+        func (callable): Function f(x, p).
+        fprime (callable): Derivative ∂f/∂x(x, p).
+        x0 (float): Starting x, typically the last point of a branch before it ended.
+        p0 (float): Starting parameter value.
+        dfdp (callable, optional): Analytic derivative ∂f/∂p(x, p).
+        tol (float): Relative step tolerance.
+        maxiter (int): Maximum number of Newton iterations.
+
+    Returns:
+        tuple or None: The fold (x, p), or None if Newton's method did not converge.
+    """
+    x, p = float(x0), float(p0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(maxiter):
+            hx, hp = FD_STEP * max(1.0, abs(x)), FD_STEP * max(1.0, abs(p))
+            f, fx = func(x, p), fprime(x, p)
+            fp = _parameter_derivative(func, x, p, dfdp)
+            fxx = (fprime(x + hx, p) - fprime(x - hx, p)) / (2 * hx)
+            fxp = (fprime(x, p + hp) - fprime(x, p - hp)) / (2 * hp)
+            det = fx * fxp - fp * fxx
+            dx = (f * fxp - fp * fx) / det
+            dp = (fx * fx - fxx * f) / det
+            if not (np.isfinite(dx) and np.isfinite(dp)):
+                return None
+            x, p = x - float(dx), p - float(dp)
+            if abs(dx) <= tol * (1.0 + abs(x)) and abs(dp) <= tol * (1.0 + abs(p)):
+                return x, p
+    return None
+
+
+def _advance(func, fprime, x, p_from, p_to, dfdp, tol, maxiter, max_halvings):
+    """
+    Continue all branches over one parameter step, retrying failed branches with smaller steps.
+
+    A branch that fails over the full step is repeated with 2, 4, ... sub-steps, since
+    a large step can fail far from any fold. If it still fails with 2**max_halvings
+    sub-steps, the last point reached is returned as the place where it ended.
+
+    Returns:
+        tuple: Tuple containing the following elements:
+            - numpy array: roots at p_to (meaningless where the branch failed)
+            - numpy array: boolean mask of the branches that reached p_to
+            - dict: for each failed branch index, the last (x, p) reached
+    """
+    x_new, ok = continuation_step(func, fprime, x, p_from, p_to, dfdp, tol, maxiter)
+    ends = {}
+    for i in np.nonzero(~ok)[0]:
+        # Without halvings the branch ends where the failed step started
+        x_sub, q_from = x[i], p_from
+        for halving in range(1, max_halvings + 1):
+            grid = np.linspace(p_from, p_to, 2 ** halving + 1)
+            x_sub = x[i]
+            for q_from, q_to in zip(grid[:-1], grid[1:]):
+                x_next, step_ok = continuation_step(func, fprime, x_sub, q_from, q_to, dfdp, tol, maxiter)
+                if not step_ok[0]:
+                    break
+                x_sub = x_next[0]
+            else:
+                x_new[i], ok[i] = x_sub, True
+                break
+        else:
+            ends[i] = (x_sub, q_from)
+    return x_new, ok, ends
+
+
+def _record_fold(folds, func, fprime, end, kind, p_from, p_to, dfdp, tol):
+    """
+    Locate the fold at which a branch ended or started and append it to folds once.
+
+    Both branches meeting at a fold end (or start) there, so a fold that is already
+    recorded is not added again.
+    """
+    fold = locate_fold(func, fprime, *end, dfdp=dfdp, tol=tol)
+    margin = abs(p_to - p_from)
+    if fold is not None and min(p_from, p_to) - margin <= fold[1] <= max(p_from, p_to) + margin:
+        entry = {'x': fold[0], 'parameter': fold[1], 'kind': kind, 'located': True}
+    else:
+        entry = {'x': float(end[0]), 'parameter': float(end[1]), 'kind': kind, 'located': False}
+    for other in folds:
+        if (other['kind'] == kind and abs(other['x'] - entry['x']) <= 1e-6 * (1 + abs(entry['x']))
+                and abs(other['parameter'] - entry['parameter']) <= 1e-6 * (1 + abs(entry['parameter']))):
+            return
+    folds.append(entry)
+
+
+def track_roots(func, fprime, roots, parameter_values, dfdp=None, finder=None, rescan_every=None,
+                lower=-np.inf, upper=np.inf, tol=1e-10, maxiter=20, max_halvings=6, match_tol=1e-6):
+    """
+    Follow the roots of f(x, p) = 0 through a sequence of parameter values by continuation.
+
+    Solving every parameter step from scratch with a global search repeats almost all
+    of the work, because the roots move only slightly from one step to the next.
+    Here each branch of roots is instead carried from one step to the next with
+    continuation_step() (tangent predictor plus Newton corrector), which costs a few
+    evaluations per branch and step.
+
+    Branches end at folds, where two roots merge and disappear. A branch whose step
+    fails even after the step has been halved max_halvings times is ended, and the
+    fold is located with locate_fold(). Roots that leave [lower, upper] end their
+    branch without a fold. Pairs of roots that appear at a fold cannot be predicted
+    from the existing branches; to catch them, the global finder (e.g.
+    equations.find_intersections) is run every rescan_every steps and at the last
+    step, and every root it finds that is not on a tracked branch starts a new branch.
+    The new branch is traced backwards to the step where it appeared and its fold is
+    located. Without a finder only disappearing roots are detected.
+
+    Parameters:
+        func (callable): Function f(x, p), vectorized in x.
+        fprime (callable): Derivative ∂f/∂x(x, p).
+        roots (array_like or None): Roots at the first parameter value; found with finder if None.
+        parameter_values (array_like): Monotonic sequence of parameter values.
+        dfdp (callable, optional): Analytic derivative ∂f/∂p(x, p); a central difference
+            is used if omitted.
+        finder (callable, optional): Global root search finder(p) returning all roots at p.
+        rescan_every (int, optional): Number of steps between runs of the finder.
+        lower (float): Lower end of the x interval of interest.
+        upper (float): Upper end of the x interval of interest.
+        tol (float): Relative tolerance of the Newton corrector and the fold location.
+        maxiter (int): Maximum number of Newton iterations per step.
+        max_halvings (int): Number of times a failing step is halved before the branch ends.
+        match_tol (float): Distance within which a root of the finder is on a tracked branch.
+
+    Returns:
+        dict: {'parameter': the parameter values (m,),
+               'roots': roots of every branch (m, num_branches), nan where the branch does not exist,
+               'folds': list of {'x', 'parameter', 'kind' ('appear' or 'disappear'), 'located'}}.
+    """
+    p_values = np.asarray(parameter_values, dtype=float)
+    m = p_values.size
+    if roots is None:
+        if finder is None:
+            raise ValueError("Either the initial roots or a finder must be given")
+        roots = finder(p_values[0])
+    columns = []
+    for root in np.asarray(roots, dtype=float).ravel():
+        columns.append(np.full(m, np.nan))
+        columns[-1][0] = root
+    alive = list(range(len(columns)))
+    folds = []
+    last_scan = 0
+
+    for k in range(1, m):
+        p_from, p_to = p_values[k - 1], p_values[k]
+        x = np.array([columns[j][k - 1] for j in alive])
+        x_new, ok, ends = _advance(func, fprime, x, p_from, p_to, dfdp, tol, maxiter, max_halvings)
+
+        # Two branches that converged to the same root have run through a fold together
+        order = np.argsort(np.where(ok, x_new, np.inf))
+        for i, j in zip(order[:-1], order[1:]):
+            if ok[i] and ok[j] and abs(x_new[j] - x_new[i]) <= match_tol * (1 + abs(x_new[i])):
+                ok[i] = ok[j] = False
+                ends[i], ends[j] = (x[i], p_from), (x[j], p_from)
+
+        inside = (x_new >= lower) & (x_new <= upper)
+        for i in np.nonzero(~ok)[0]:
+            _record_fold(folds, func, fprime, ends[i], 'disappear', p_from, p_to, dfdp, tol)
+        for i in np.nonzero(ok & inside)[0]:
+            columns[alive[i]][k] = x_new[i]
+        alive = [alive[i] for i in np.nonzero(ok & inside)[0]]
+
+        if finder is not None and rescan_every and (k - last_scan >= rescan_every or k == m - 1):
+            tracked = np.array([columns[j][k] for j in alive])
+            for root in np.asarray(finder(p_to), dtype=float).ravel():
+                if tracked.size and np.min(np.abs(tracked - root)) <= match_tol * (1 + abs(root)):
+                    continue
+                column = np.full(m, np.nan)
+                column[k] = root
+                # Trace the new branch backwards until it disappears, which is where it appeared
+                for kk in range(k, last_scan, -1):
+                    x_back, back_ok, back_ends = _advance(func, fprime, column[kk:kk + 1], p_values[kk],
+                                                          p_values[kk - 1], dfdp, tol, maxiter, max_halvings)
+                    if not back_ok[0] or not lower <= x_back[0] <= upper:
+                        if not back_ok[0]:
+                            _record_fold(folds, func, fprime, back_ends[0], 'appear',
+                                         p_values[kk], p_values[kk - 1], dfdp, tol)
+                        break
+                    column[kk - 1] = x_back[0]
+                columns.append(column)
+                alive.append(len(columns) - 1)
+            last_scan = k
+
+    roots_table = np.column_stack(columns) if columns else np.empty((m, 0))
+    return {'parameter': p_values, 'roots': roots_table, 'folds': folds}
+#endregion
@@ -0,0 +1,101 @@
+#region Import
+import numpy as np
+from .instrumentation import timed
+from .normal_kernel import norm_cdf, norm_pdf
+#endregion
+
+#region Functions
+def generate_data_batch(means, std_devs, x_ranges, num_points=1000, dtype=np.float64):
+    """
+    Generate x values, PDFs and CDFs for many normal distributions in one broadcasted pass.
+
+    This is the batched form of generate_data(). Instead of handling
+    two hard-coded distributions one at a time, it takes arrays of means, standard
+    deviations and plotting ranges and evaluates every distribution at once:
+    1. The x grids are built with a single np.linspace call over all ranges, giving an
+       (n_distributions × n_points) block whose row i spans x_ranges[i].
+    2. The means and standard deviations are reshaped to columns so that they broadcast
+       across the rows of that block.
+    3. The PDF and CDF blocks are evaluated with the closed-form kernels in
+       normal_kernel, again for all rows together, so there is no Python loop over the
+       distributions.
+
+    Parameters:
+        means (array_like): Means μ of the distributions, shape (k,).
+        std_devs (array_like): Standard deviations σ of the distributions, shape (k,).
+        x_ranges (array_like): Lower and upper x limit of each distribution, shape (k, 2).
+        num_points (int): Number of x values per distribution.
+        dtype (numpy.dtype): np.float64 (default) or np.float32.
+
+    Returns:
+    -------
+    tuple: Tuple containing the following elements:
+        - numpy array: x values, shape (k, num_points)
+        - numpy array: probability density function (PDF) values, shape (k, num_points)
+        - numpy array: cumulative distribution function (CDF) values, shape (k, num_points)
+    """
+    means = np.atleast_1d(np.asarray(means, dtype=dtype))
+    std_devs = np.atleast_1d(np.asarray(std_devs, dtype=dtype))
+    x_ranges = np.asarray(x_ranges, dtype=dtype).reshape(-1, 2)
+    if not (means.shape == std_devs.shape == x_ranges[:, 0].shape):
+        raise ValueError("means, std_devs and x_ranges must describe the same number of distributions")
+    if np.any(std_devs <= 0):
+        raise ValueError("Standard deviations must be positive")
+
+    x_values = np.linspace(x_ranges[:, 0], x_ranges[:, 1], num_points, axis=1, dtype=dtype)
+    pdf = norm_pdf(x_values, means[:, None], std_devs[:, None], dtype=dtype)
+    cdf = norm_cdf(x_values, means[:, None], std_devs[:, None], dtype=dtype)
+    return x_values, pdf, cdf
+
+
+@timed('numerics.generate_data')
+def generate_data():
+    """
+    Generate data for two normal distributions.
+
+    This function generates data for two normal distributions, representing Equation 1 and Equation 2.
+    Equation 1 represents a standard normal distribution with mean (μ) = 0 and standard deviation (σ) = 1.
+    Equation 2 represents a normal distribution with mean (μ) = 175 and standard deviation (σ) = 3.
+
+    The data generation process involves the following steps:
+    1. Generate x-values for plotting using linspace to create a range of equally spaced values.
+    2. Define the mean and standard deviation parameters for each distribution.
+    3. Calculate the probability density function (PDF) for both distributions.
+       The PDF represents the likelihood of a given value occurring in the distribution.
+       It is calculated using the formula: f(x) = (1 / (σ * sqrt(2 * π))) * exp(-((x - μ)^2) / (2 * σ^2))
+       where μ is the mean, σ is the standard deviation, and x is the value.
+    4. Calculate the cumulative distribution function (CDF) for both distributions.
+       The CDF represents the probability that a random variable takes on a value less than or equal to x.
+       It is calculated using the formula: F(x) = 0.5 * (1 + erf((x - μ) / (σ * sqrt(2))))
+       where erf is the error function.
+       Both are evaluated directly from these closed forms by the normal_kernel module,
+       which avoids the per-call overhead of scipy.stats.norm.
+    5. Return a tuple containing the generated data.
+
+    Both distributions are evaluated together by generate_data_batch(), which returns
+    one row per distribution; use it directly to evaluate many distributions at once.
+
+    Returns:
+    -------
+    tuple: Tuple containing the following elements:
+        - numpy array: x values for Equation 1
+        - numpy array: x values for Equation 2
+        - numpy array: probability density function (PDF) for Equation 1
+        - numpy array: probability density function (PDF) for Equation 2
+        - numpy array: cumulative distribution function (CDF) for Equation 1
+        - numpy array: cumulative distribution function (CDF) for Equation 2
+    """
+    # Define parameters and x-ranges for the normal distributions
+    means = [0, 175]
+    std_devs = [1, 3]
+    x_ranges = [(-5, 5),  # Adjusted x-range for Equation 1
+                (160, 190)]  # Adjusted x-range for Equation 2
+
+    # Calculate the PDF and CDF of both distributions in one batched evaluation
+    x_values, pdf, cdf = generate_data_batch(means, std_devs, x_ranges, num_points=1000)
+    x_values_e1, x_values_e2 = x_values
+    pdf_1, pdf_2 = pdf
+    cdf_1, cdf_2 = cdf
+
+    return x_values_e1, x_values_e2, pdf_1, pdf_2, cdf_1, cdf_2
+#endregion
@@ -0,0 +1,274 @@
+#region Import
+import numpy as np
+from .root_finding import batch_newton, find_roots_bracketed
+#endregion
+
+#region Classes
+class CompiledEquation:
+    """
+    Equation y = f(x; parameters) compiled from a symbolic expression into a vectorized kernel.
+
+    The expression is given as a string such as "a*x - b*cos(c*x)" or as a SymPy
+    expression. Every free symbol other than the variable is a parameter. The
+    expression is differentiated symbolically with respect to the variable, and both
+    the expression and its derivative are turned into NumPy functions with
+    sympy.lambdify, so that an array of x values is evaluated with a handful of ufunc
+    calls and Newton-type solvers get the exact slope instead of a finite-difference
+    approximation.
+
+    With jit=True both kernels are additionally compiled with numba.njit, which pays
+    off for long expressions whose NumPy form creates many temporary arrays. Numba is
+    an optional dependency and is only imported in that case.
+
+    Parameters:
+        expression (str or sympy.Expr): The right-hand side f(x; parameters).
+        variable (str): Name of the independent variable.
+        parameters (dict or sequence, optional): Parameter names in call order, or a dict
+            mapping them to default values. Defaults to the remaining free symbols in
+            alphabetical order, without default values.
+        jit (bool): Whether to compile the kernels with Numba.
+        name (str, optional): Name of the equation, used in labels and error messages.
+    """
+
+    def __init__(self, expression, variable='x', parameters=None, jit=False, name=None):
+        # SymPy takes longer to import than the rest of the package, so only compiling needs it
+        import sympy
+        self.variable = sympy.Symbol(variable)
+        if isinstance(expression, str):
+            # Parse the declared names as plain symbols, not as SymPy objects such as N, S, I or beta
+            names = [variable, *(parameters if parameters is not None else ())]
+            expression = sympy.sympify(expression, locals={name: sympy.Symbol(name) for name in names})
+        self.expression = expression
+        free = {symbol.name for symbol in self.expression.free_symbols} - {variable}
+        if parameters is None:
+            parameters = sorted(free)
+        self.defaults = dict(parameters) if isinstance(parameters, dict) else {}
+        self.parameters = tuple(parameters)
+        unknown = free - set(self.parameters)
+        if unknown:
+            raise ValueError(f"Expression uses undeclared parameters: {', '.join(sorted(unknown))}")
+        self.name = name if name is not None else str(self.expression)
+
+        # powsimp turns e*x**e/x into e*x**(e - 1), which stays finite at x = 0
+        self.derivative_expression = sympy.powsimp(sympy.diff(self.expression, self.variable))
+        symbols = [self.variable] + [sympy.Symbol(p) for p in self.parameters]
+        self._kernel = sympy.lambdify(symbols, self.expression, modules='numpy')
+        self._derivative_kernel = sympy.lambdify(symbols, self.derivative_expression, modules='numpy')
+        if jit:
+            import numba
+            self._kernel = numba.njit(self._kernel)
+            self._derivative_kernel = numba.njit(self._derivative_kernel)
+
+    def __repr__(self):
+        return f"CompiledEquation({str(self.expression)!r}, parameters={self.parameters!r})"
+
+    def _bind(self, args, kwargs):
+        """
+        Resolve positional and keyword parameter values, falling back to the defaults.
+
+        Parameters:
+            args (tuple): Positional parameter values in the order of self.parameters.
+            kwargs (dict): Keyword parameter values.
+
+        Returns:
+            list: The value of every parameter, in order.
+        """
+        if len(args) > len(self.parameters):
+            raise TypeError(f"{self.name} takes {len(self.parameters)} parameters but {len(args)} were given")
+        values = dict(self.defaults)
+        values.update(zip(self.parameters, args))
+        values.update(kwargs)
+        missing = [p for p in self.parameters if p not in values]
+        if missing or len(values) > len(self.parameters):
+            raise TypeError(f"{self.name} expects the parameters {', '.join(self.parameters)}")
+        return [values[p] for p in self.parameters]
+
+    def _evaluate(self, kernel, x, args, kwargs):
+        """
+        Call a kernel and broadcast its result to the shape of the inputs.
+
+        Constant expressions (e.g. the derivative of a linear term) evaluate to a
+        scalar, which is expanded so that callers always get one value per x.
+        """
+        params = self._bind(args, kwargs)
+        x = np.asarray(x, dtype=float)
+        result = np.asarray(kernel(x, *params), dtype=float)
+        shape = np.broadcast(x, *params).shape
+        if result.shape != shape:
+            result = np.broadcast_to(result, shape).copy()
+        return result[()]
+
+    def __call__(self, x, *args, **kwargs):
+        """
+        Evaluate the equation.
+
+        Parameters:
+            x (float or array_like): The input value(s).
+            *args, **kwargs: Parameter values; omitted parameters take their defaults.
+
+        Returns:
+            float or numpy.ndarray: The value(s) of the equation.
+        """
+        return self._evaluate(self._kernel, x, args, kwargs)
+
+    def derivative(self, x, *args, **kwargs):
+        """
+        Evaluate the analytic derivative of the equation with respect to the variable.
+
+        Parameters:
+            x (float or array_like): The input value(s).
+            *args, **kwargs: Parameter values; omitted parameters take their defaults.
+
+        Returns:
+            float or numpy.ndarray: The derivative at x.
+        """
+        return self._evaluate(self._derivative_kernel, x, args, kwargs)
+
+
+class EquationRegistry:
+    """
+    Named collection of compiled equations, with root and intersection searches on top.
+
+    New equations (or pairs of equations to intersect) are added at run time with
+    register() instead of being written as Python functions, and the solvers and the
+    plot work with any registered pair. default_registry holds equation1 and
+    equation2 of ProblemB-1.py under those names.
+    """
+
+    def __init__(self):
+        self._equations = {}
+
+    def __contains__(self, name):
+        return name in self._equations
+
+    def __getitem__(self, name):
+        try:
+            return self._equations[name]
+        except KeyError:
+            raise KeyError(f"No equation registered under the name {name!r}") from None
+
+    def __iter__(self):
+        return iter(self._equations)
+
+    def __len__(self):
+        return len(self._equations)
+
+    def register(self, name, expression, variable='x', parameters=None, jit=False):
+        """
+        Compile an expression and register it under a name, replacing any previous entry.
+
+        Parameters:
+            name (str): Name of the equation.
+            expression (str or sympy.Expr): The right-hand side, see CompiledEquation.
+            variable (str): Name of the independent variable.
+            parameters (dict or sequence, optional): Parameter names, or names with defaults.
+            jit (bool): Whether to compile the kernels with Numba.
+
+        Returns:
+            CompiledEquation: The compiled equation.
+        """
+        equation = CompiledEquation(expression, variable, parameters, jit=jit, name=name)
+        self._equations[name] = equation
+        return equation
+
+    def unregister(self, name):
+        """
+        Remove an equation from the registry.
+
+        Parameters:
+            name (str): Name of the equation.
+        """
+        if name not in self._equations:
+            raise KeyError(f"No equation registered under the name {name!r}")
+        del self._equations[name]
+
+    def find_roots(self, name, x0, tol=1e-10, maxiter=50, **parameters):
+        """
+        Refine starting guesses to roots of a registered equation with the analytic derivative.
+
+        Parameters:
+            name (str): Name of the equation.
+            x0 (array_like): Starting guesses, all iterated together by root_finding.batch_newton.
+            tol (float): Convergence tolerance.
+            maxiter (int): Maximum number of Newton iterations.
+            **parameters: Parameter values; omitted parameters take their defaults.
+
+        Returns:
+            tuple: The roots and a boolean array telling which starting guesses converged.
+        """
+        equation = self[name]
+        return batch_newton(lambda x: equation(x, **parameters), x0,
+                            fprime=lambda x: equation.derivative(x, **parameters), tol=tol, maxiter=maxiter)
+
+    def find_intersections(self, first, second, lower=-5.0, upper=5.0, num_points=1000, **parameters):
+        """
+        Determine all intersection points of two registered equations on an interval.
+
+        The keyword parameters are shared by both equations; each equation takes the
+        ones it declares and uses its defaults for the rest.
+
+        Parameters:
+            first (str): Name of the first equation.
+            second (str): Name of the second equation.
+            lower (float): Lower end of the search interval.
+            upper (float): Upper end of the search interval.
+            num_points (int): Number of grid points used to bracket the roots.
+            **parameters: Parameter values of the two equations.
+
+        Returns:
+            numpy.ndarray: Sorted x-coordinates of all intersection points found.
+        """
+        f, g = self[first], self[second]
+        f_params = {p: v for p, v in parameters.items() if p in f.parameters}
+        g_params = {p: v for p, v in parameters.items() if p in g.parameters}
+        unknown = set(parameters) - set(f_params) - set(g_params)
+        if unknown:
+            raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+        # Non-integer exponents give nan for negative x, which the bracket search skips
+        with np.errstate(invalid='ignore'):
+            return find_roots_bracketed(lambda x: f(x, **f_params) - g(x, **g_params),
+                                        lower, upper, num_points=num_points)
+
+    def plot_intersections(self, first, second, fig=None, lower=-5.0, upper=5.0, **parameters):
+        """
+        Plot two registered equations and mark their intersections, see figures.plot_equations_with_intersections().
+
+        Parameters:
+            first (str): Name of the first equation.
+            second (str): Name of the second equation.
+            fig (matplotlib.figure.Figure, optional): Figure to draw into.
+            lower (float): Lower end of the plotted interval.
+            upper (float): Upper end of the plotted interval.
+            **parameters: Parameter values of the two equations.
+
+        Returns:
+            matplotlib.figure.Figure: The figure holding the plot.
+        """
+        from .figures import plot_equations_with_intersections
+        f, g = self[first], self[second]
+        points = self.find_intersections(first, second, lower, upper, **parameters)
+        equations = tuple(lambda x, eq=eq: eq(x, **{p: v for p, v in parameters.items() if p in eq.parameters})
+                          for eq in (f, g))
+        return plot_equations_with_intersections(fig, equations=equations, labels=(str(f.expression), str(g.expression)),
+                                                 intersection_points=points, x_range=(lower, upper))
+#endregion
+
+#region Module state
+def __getattr__(name):
+    """
+    Build default_registry on first access (PEP 562), so that importing the module does not import SymPy.
+
+    Parameters:
+        name (str): Attribute name.
+
+    Returns:
+        EquationRegistry: The registry pre-populated with the two equations of ProblemB-1.py.
+    """
+    if name != 'default_registry':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    registry = EquationRegistry()
+    registry.register('equation1', 'a*x - b*cos(c*x)', parameters={'a': 1.0, 'b': 3.0, 'c': 1.0})
+    registry.register('equation2', 'cos(d*x)*x**e', parameters={'d': 2.0, 'e': 3.0})
+    globals()['default_registry'] = registry
+    return registry
+#endregion
@@ -0,0 +1,304 @@
+#region Import
+import numpy as np
+from .chebyshev_proxy import ChebyshevProxy
+from .continuation import track_roots
+from .instrumentation import timed
+from .root_isolation import (interval_add, interval_cos, interval_mul, interval_power, interval_scale,
+                            interval_sin, isolate_roots)
+#endregion
+
+#region Constants
+# Order of the coefficients in a parameter tuple (a, b, c, d, e)
+PARAMETER_NAMES = ('a', 'b', 'c', 'd', 'e')
+
+# Coefficients that reproduce x - 3*cos(x) and cos(2*x)*x^3 from ProblemB-1.py
+DEFAULT_PARAMETERS = (1.0, 3.0, 1.0, 2.0, 3.0)
+#endregion
+
+#region Functions
+def equation1(x, a=1.0, b=3.0, c=1.0):
+    """
+    Calculate the value of the parameterized first equation, a * x - b * cos(c * x).
+
+    With the default coefficients a = 1, b = 3 and c = 1 this is the equation
+    x - 3 * cos(x) used in ProblemB-1.py. The coefficients scale the linear term,
+    the amplitude of the periodic term and its angular frequency, so the family
+    covers the variants needed for sensitivity studies.
+
+    Parameters:
+        x (float or array_like): The input value(s) for which to evaluate the equation.
+        a (float or array_like): Slope of the linear term.
+        b (float or array_like): Amplitude of the cosine term.
+        c (float or array_like): Angular frequency of the cosine term.
+
+    Returns:
+        float or array_like: The result(s) of the equation evaluation.
+    """
+    return a * x - b * np.cos(c * x)
+
+
+def equation2(x, d=2.0, e=3.0):
+    """
+    Compute the value of the parameterized second equation, cos(d * x) * x**e.
+
+    With the default coefficients d = 2 and e = 3 this is the equation
+    cos(2 * x) * x**3 used in ProblemB-1.py. For negative x the power x**e is only
+    real when e is an integer; other exponents give nan there, which the root
+    finders treat as "no information" rather than as a sign change.
+
+    Parameters:
+        x (float or array_like): The input value(s) for which to compute the equation.
+        d (float or array_like): Angular frequency of the cosine factor.
+        e (float or array_like): Exponent of the power factor.
+
+    Returns:
+        float or array_like: The computed value(s) of the equation.
+    """
+    return np.cos(d * x) * np.power(x, e)
+
+
+def equation1_derivative(x, a=1.0, b=3.0, c=1.0):
+    """
+    Calculate the derivative of the first equation, a + b * c * sin(c * x).
+
+    The analytic derivative is supplied to the Newton solver so that it does not
+    have to approximate the slope of equation1 with finite differences.
+
+    Parameters:
+        x (float or array_like): The input value(s) at which to evaluate the derivative.
+        a (float or array_like): Slope of the linear term.
+        b (float or array_like): Amplitude of the cosine term.
+        c (float or array_like): Angular frequency of the cosine term.
+
+    Returns:
+        float or array_like: The derivative of equation1 at x.
+    """
+    return a + b * c * np.sin(c * x)
+
+
+def equation2_derivative(x, d=2.0, e=3.0):
+    """
+    Compute the derivative of the second equation, e * x**(e-1) * cos(d * x) - d * x**e * sin(d * x).
+
+    The expression follows from the product rule applied to cos(d * x) * x**e and
+    is used by the Newton solver in place of a finite-difference slope.
+
+    Parameters:
+        x (float or array_like): The input value(s) at which to compute the derivative.
+        d (float or array_like): Angular frequency of the cosine factor.
+        e (float or array_like): Exponent of the power factor.
+
+    Returns:
+        float or array_like: The derivative of equation2 at x.
+    """
+    return e * np.power(x, e - 1) * np.cos(d * x) - d * np.power(x, e) * np.sin(d * x)
+
+
+def intersection_function(x, a=1.0, b=3.0, c=1.0, d=2.0, e=3.0):
+    """
+    Evaluate the difference equation1(x) - equation2(x) whose roots are the intersections.
+
+    Parameters:
+        x (float or array_like): The input value(s) at which to evaluate the difference.
+        a, b, c (float or array_like): Coefficients of equation1.
+        d, e (float or array_like): Coefficients of equation2.
+
+    Returns:
+        float or array_like: The difference of the two equations at x.
+    """
+    return equation1(x, a, b, c) - equation2(x, d, e)
+
+
+def intersection_derivative(x, a=1.0, b=3.0, c=1.0, d=2.0, e=3.0):
+    """
+    Evaluate the derivative of equation1(x) - equation2(x).
+
+    Parameters:
+        x (float or array_like): The input value(s) at which to evaluate the derivative.
+        a, b, c (float or array_like): Coefficients of equation1.
+        d, e (float or array_like): Coefficients of equation2.
+
+    Returns:
+        float or array_like: The derivative of the difference of the two equations at x.
+    """
+    return equation1_derivative(x, a, b, c) - equation2_derivative(x, d, e)
+
+
+def intersection_parameter_derivative(x, parameter, a=1.0, b=3.0, c=1.0, d=2.0, e=3.0):
+    """
+    Evaluate the derivative of equation1(x) - equation2(x) with respect to one coefficient.
+
+    The exponent e is not covered: x^e has no real derivative with respect to e for
+    negative x, so callers fall back to a finite difference for it.
+
+    Parameters:
+        x (float or array_like): The input value(s) at which to evaluate the derivative.
+        parameter (str): Coefficient to differentiate by, one of 'a', 'b', 'c' and 'd'.
+        a, b, c (float or array_like): Coefficients of equation1.
+        d, e (float or array_like): Coefficients of equation2.
+
+    Returns:
+        float or array_like: The partial derivative with respect to the coefficient at x.
+    """
+    if parameter == 'a':
+        return x
+    if parameter == 'b':
+        return -np.cos(c * x)
+    if parameter == 'c':
+        return b * x * np.sin(c * x)
+    if parameter == 'd':
+        return np.power(x, e + 1) * np.sin(d * x)
+    raise ValueError(f"No analytic derivative with respect to {parameter!r}")
+
+
+@timed('numerics.find_intersections')
+def find_intersections(parameters=DEFAULT_PARAMETERS, lower=-5.0, upper=5.0, num_points=1000):
+    """
+    Determine all intersection points of the two parameterized equations on an interval.
+
+    The difference of the compiled equation1 and equation2 of
+    equation_registry.default_registry is searched for sign changes on a grid of
+    num_points values and every bracket is refined with Brent's method (see
+    root_finding.find_roots_bracketed).
+
+    Parameters:
+        parameters (tuple): Coefficients (a, b, c, d, e), see PARAMETER_NAMES.
+        lower (float): Lower end of the search interval.
+        upper (float): Upper end of the search interval.
+        num_points (int): Number of grid points used to bracket the roots.
+
+    Returns:
+        numpy.ndarray: Sorted x-coordinates of all intersection points found.
+    """
+    from .equation_registry import default_registry
+    return default_registry.find_intersections('equation1', 'equation2', lower, upper, num_points=num_points,
+                                               **dict(zip(PARAMETER_NAMES, parameters)))
+
+
+def intersection_derivative_bounds(lo, hi, a=1.0, b=3.0, c=1.0, d=2.0, e=3.0):
+    """
+    Enclose the derivative of equation1(x) - equation2(x) over intervals [lo, hi].
+
+    The derivative a + b*c*sin(c*x) - e*x^(e-1)*cos(d*x) + d*x^e*sin(d*x) is evaluated
+    in interval arithmetic (see root_isolation): every operation returns bounds that
+    contain all values it can take for x in [lo, hi]. The enclosure can be wider than
+    the true range, but it shrinks towards it as the intervals are bisected, which is
+    all the certified root isolation needs.
+
+    Parameters:
+        lo, hi (numpy.ndarray): Lower and upper bounds of the intervals.
+        a, b, c (float): Coefficients of equation1.
+        d, e (float): Coefficients of equation2; e must be a non-negative integer.
+
+    Returns:
+        tuple: Lower and upper bounds of the derivative over each interval.
+    """
+    if e < 0 or e != int(e):
+        raise ValueError("Derivative bounds require a non-negative integer exponent e")
+    e = int(e)
+    x = (lo, hi)
+    term1 = interval_add((a, a), interval_scale(*interval_sin(*interval_scale(*x, c)), b * c))
+    term3 = interval_scale(*interval_mul(interval_power(*x, e), interval_sin(*interval_scale(*x, d))), d)
+    if e == 0:
+        return interval_add(term1, term3)
+    term2 = interval_scale(*interval_mul(interval_power(*x, e - 1), interval_cos(*interval_scale(*x, d))), -e)
+    return interval_add(interval_add(term1, term2), term3)
+
+
+def find_intersections_certified(parameters=DEFAULT_PARAMETERS, lower=-5.0, upper=5.0, min_width=1e-10):
+    """
+    Determine all intersection points with a guarantee that none is missed or repeated.
+
+    Unlike find_intersections(), which can miss intersections that are closer together
+    than its grid spacing, this uses root_isolation.isolate_roots with the derivative
+    enclosure of intersection_derivative_bounds() to prove that every reported root is
+    the only one in its interval and that the discarded intervals hold no roots.
+
+    Parameters:
+        parameters (tuple): Coefficients (a, b, c, d, e), see PARAMETER_NAMES; e must be
+            a non-negative integer.
+        lower (float): Lower end of the search interval.
+        upper (float): Upper end of the search interval.
+        min_width (float): Width below which an undecided interval is reported as unresolved.
+
+    Returns:
+        tuple: Tuple containing the following elements:
+            - numpy array: sorted x-coordinates of all intersection points
+            - list: (lo, hi) intervals that could not be resolved, e.g. around tangencies
+            - int: number of function evaluations used
+    """
+    a, b, c, d, e = parameters
+    return isolate_roots(lambda x: intersection_function(x, a, b, c, d, e),
+                         lambda lo, hi: intersection_derivative_bounds(lo, hi, a, b, c, d, e),
+                         lower, upper, min_width=min_width)
+
+
+def find_intersections_chebyshev(parameters=DEFAULT_PARAMETERS, lower=-5.0, upper=5.0):
+    """
+    Determine all intersection points from a Chebyshev proxy of the intersection function.
+
+    The difference equation1(x) - equation2(x) is interpolated to machine precision
+    by a chebyshev_proxy.ChebyshevProxy, whose real roots on the interval are the
+    eigenvalues of a single colleague matrix; each root is then polished with Newton's
+    method against the original function. The proxy is returned as well so that it
+    can be reused for cheap evaluation, derivatives or integrals.
+
+    Parameters:
+        parameters (tuple): Coefficients (a, b, c, d, e), see PARAMETER_NAMES.
+        lower (float): Lower end of the search interval.
+        upper (float): Upper end of the search interval.
+
+    Returns:
+        tuple: The sorted x-coordinates of all intersection points and the ChebyshevProxy.
+    """
+    a, b, c, d, e = parameters
+    proxy = ChebyshevProxy(lambda x: intersection_function(x, a, b, c, d, e), lower, upper)
+    return proxy.roots(), proxy
+
+
+def track_intersections(parameter, values, parameters=DEFAULT_PARAMETERS, lower=-5.0, upper=5.0,
+                        rescan_every=10, num_points=1000):
+    """
+    Follow the intersection points while one coefficient varies, by continuation.
+
+    Instead of calling find_intersections() for every value of the coefficient, the
+    intersections at the first value are carried from step to step with a tangent
+    predictor and a Newton corrector (see continuation.track_roots), using the
+    analytic derivatives intersection_derivative() and, except for the exponent e,
+    intersection_parameter_derivative(). A step costs a few evaluations per
+    intersection however fine the grid of the global search is, so the saving over
+    repeated find_intersections() calls grows with num_points. Folds where pairs of intersections
+    disappear are detected and located; find_intersections() is rerun every
+    rescan_every steps to pick up pairs that appear.
+
+    Parameters:
+        parameter (str): Name of the varying coefficient, one of PARAMETER_NAMES.
+        values (array_like): Monotonic sequence of values of that coefficient.
+        parameters (tuple): Coefficients (a, b, c, d, e) that stay fixed.
+        lower (float): Lower end of the search interval.
+        upper (float): Upper end of the search interval.
+        rescan_every (int or None): Steps between global searches; None disables them.
+        num_points (int): Number of grid points of each global search.
+
+    Returns:
+        dict: See continuation.track_roots; 'roots' holds one column per branch of intersections.
+    """
+    if parameter not in PARAMETER_NAMES:
+        raise ValueError(f"Unknown parameter {parameter!r}; expected one of {', '.join(PARAMETER_NAMES)}")
+    index = PARAMETER_NAMES.index(parameter)
+
+    def with_value(p):
+        coefficients = list(parameters)
+        coefficients[index] = p
+        return coefficients
+
+    # Non-integer exponents give nan for negative x, which ends the branches there
+    dfdp = None
+    if parameter != 'e':
+        dfdp = lambda x, p: intersection_parameter_derivative(x, parameter, *with_value(p))
+    with np.errstate(invalid='ignore'):
+        return track_roots(lambda x, p: intersection_function(x, *with_value(p)),
+                           lambda x, p: intersection_derivative(x, *with_value(p)), None, values, dfdp=dfdp,
+                           finder=lambda p: find_intersections(with_value(p), lower, upper, num_points),
+                           rescan_every=rescan_every, lower=lower, upper=upper)
+#endregion
@@ -0,0 +1,142 @@
+#region Import
+from collections import OrderedDict
+
+import numpy as np
+from .instrumentation import count
+#endregion
+
+#region Classes
+class MemoizedFunction:
+    """
+    Least-recently-used cache of function values keyed on the quantized input.
+
+    Root finders, plots and parameter studies evaluate the same equation at identical
+    or nearly identical points over and over: Newton and Brent iterations revisit
+    their brackets, and a plot evaluates the curve at the intersections that were just
+    computed. For cheap closed-form equations this does not matter, but when an
+    equation is replaced by an expensive model (e.g. one that runs a simulation) the
+    duplicate evaluations dominate the run time.
+
+    A MemoizedFunction wraps a function f(x, *args) and caches its values element by
+    element. Each x is rounded to a multiple of resolution, so points closer together
+    than that share one cache entry. Where that multiple is not exactly representable
+    (|x| >= 2**53 * resolution) and for inf and nan, x is keyed on its exact bit
+    pattern instead, so distinct large inputs never share an entry and repeated
+    non-finite inputs still hit the cache. The key also holds the extra arguments (the
+    equation coefficients), which must therefore be scalars. Scalars and arrays of any
+    shape are accepted; for an array only the points that miss the cache are passed to
+    the function, in a single vectorized call (or one call per point if vectorized is
+    False).
+
+    The cache holds at most maxsize values and evicts the least recently used one when
+    it is full. The hits and misses counters count individual points.
+
+    Parameters:
+        func (callable): Function f(x, *args) to memoize.
+        maxsize (int): Maximum number of cached values.
+        resolution (float): Quantization step of x; inputs that round to the same
+            multiple of it are treated as identical.
+        vectorized (bool): Whether func accepts an array of x values.
+    """
+
+    def __init__(self, func, maxsize=4096, resolution=1e-12, vectorized=True):
+        self.func = func
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.vectorized = vectorized
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self.__name__ = getattr(func, '__name__', type(self).__name__)
+        self.__doc__ = getattr(func, '__doc__', None)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __call__(self, x, *args):
+        """
+        Evaluate the function, computing only the points that are not cached yet.
+
+        Parameters:
+            x (float or array_like): The input value(s).
+            *args (float): Further scalar arguments of the function.
+
+        Returns:
+            float or numpy.ndarray: The function value(s), with the shape of x.
+        """
+        try:
+            params = tuple(float(arg) for arg in args)
+        except TypeError:
+            raise ValueError("Memoized functions only accept scalar extra arguments") from None
+        x_array = np.asarray(x, dtype=float)
+        flat = x_array.ravel()
+        # Quantize where the multiple of resolution is exact; key the rest (and inf, nan) on their bits
+        quantizable = np.abs(flat) < self.resolution * 2.0 ** 53
+        positions = np.nonzero(quantizable)[0], np.nonzero(~quantizable)[0]
+        quantized, first_q, inverse_q = np.unique(np.rint(flat[positions[0]] / self.resolution),
+                                                  return_index=True, return_inverse=True)
+        bits, first_b, inverse_b = np.unique(flat[positions[1]].view(np.int64), return_index=True,
+                                             return_inverse=True)
+        first = np.concatenate((positions[0][first_q], positions[1][first_b]))
+        inverse = np.empty(flat.size, dtype=np.intp)
+        inverse[positions[0]] = inverse_q.reshape(-1)
+        inverse[positions[1]] = inverse_b.reshape(-1) + quantized.size
+        keys = [(params, q) for q in quantized.tolist()] + [(params, None, b) for b in bits.tolist()]
+
+        results = np.empty(len(keys))
+        missing = []
+        for i, key in enumerate(keys):
+            value = self._values.get(key)
+            if value is None:
+                missing.append(i)
+            else:
+                self._values.move_to_end(key)
+                results[i] = value
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        count('memoized_function.hits', len(keys) - len(missing))
+        count('memoized_function.misses', len(missing))
+
+        if missing:
+            points = flat[first[missing]]
+            if self.vectorized:
+                values = np.broadcast_to(np.asarray(self.func(points, *args), dtype=float), points.shape)
+            else:
+                values = np.array([self.func(point, *args) for point in points], dtype=float)
+            results[missing] = values
+            for i, value in zip(missing, values.tolist()):
+                self._values[keys[i]] = value
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+        return results[inverse].reshape(x_array.shape)[()]
+
+    def clear(self):
+        """
+        Remove all cached values and reset the hit and miss counters.
+        """
+        self._values.clear()
+        self.hits = 0
+        self.misses = 0
+#endregion
+
+#region Functions
+def memoize(func=None, maxsize=4096, resolution=1e-12, vectorized=True):
+    """
+    Decorator form of MemoizedFunction.
+
+    Can be applied bare (@memoize) or with options (@memoize(maxsize=100000)).
+
+    Parameters:
+        func (callable, optional): Function to memoize.
+        maxsize (int): Maximum number of cached values.
+        resolution (float): Quantization step of x.
+        vectorized (bool): Whether func accepts an array of x values.
+
+    Returns:
+        MemoizedFunction or callable: The memoized function, or a decorator producing it.
+    """
+    def decorate(function):
+        return MemoizedFunction(function, maxsize=maxsize, resolution=resolution, vectorized=vectorized)
+    return decorate if func is None else decorate(func)
+#endregion
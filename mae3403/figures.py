@@ -0,0 +1,302 @@
+#region Import
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.patches import Polygon, Rectangle
+from .equations import equation1, equation2, find_intersections
+from .instrumentation import timed
+from .probability_queries import resolve_tail_annotations
+#endregion
+
+#region Constants
+# Tail probabilities annotated on the PDF/CDF plots of ProblemA-4.py; the probabilities
+# themselves are computed from the thresholds when the figure is drawn
+DISTRIBUTION_ANNOTATIONS = [
+    {'mean': 0, 'std': 1, 'tail': 'lower', 'threshold': -0.5},
+    {'mean': 175, 'std': 3, 'tail': 'upper', 'threshold': 181.5},
+]
+#endregion
+
+#region Functions
+@timed('plot.distributions')
+def plot_distributions(data, fig=None, annotations=DISTRIBUTION_ANNOTATIONS):
+    """
+    Draw the 2×2 PDF/CDF layout of ProblemA-4.py for the two normal distributions.
+
+    The figure is built with the object-oriented matplotlib API on a plain Figure,
+    so no pyplot state and no GUI backend are involved; the result can be shown
+    interactively by passing a pyplot figure as fig, or rendered headlessly with
+    rendering.render_figure(). The left column shows N(0, 1) and the right column
+    N(175, 3); the top row holds the PDFs with the shaded tail probability and the
+    bottom row the CDFs with the corresponding probability marked. The layout is
+    drawn by a DistributionFigure; to draw many distribution pairs, create one
+    DistributionFigure and call its update() method instead of this function.
+
+    Parameters:
+        data (tuple): The 6-tuple returned by distributions.generate_data().
+        fig (matplotlib.figure.Figure, optional): Figure to draw into. A new 20×10 inch
+            Figure is created if omitted.
+        annotations (list): Tail annotation of each distribution, see DistributionFigure.update().
+
+    Returns:
+        matplotlib.figure.Figure: The figure holding the four plots.
+    """
+    x_values_e1, x_values_e2, pdf_1, pdf_2, cdf_1, cdf_2 = data
+    template = DistributionFigure(num_distributions=2, fig=fig)
+    template.update([x_values_e1, x_values_e2], [pdf_1, pdf_2], [cdf_1, cdf_2], annotations)
+    return template.fig
+
+
+@timed('plot.equations_with_intersections')
+def plot_equations_with_intersections(fig=None, equations=(equation1, equation2),
+                                      labels=('x - 3*cos(x)', 'cos(2*x)*x^3'), intersection_points=None,
+                                      x_range=(-5, 5)):
+    """
+    Plot both equations of ProblemB-1.py and mark their intersection points for visualization.
+
+    This function generates a plot that illustrates the behavior of the two equations
+    over a specified range of x values, with separate lines for each equation.
+    Intersection points are identified using the find_intersections() function and
+    marked on the plot as white circles with red borders. Additionally, text
+    annotations are added near each intersection point to display their coordinates.
+    The plot is adorned with axis labels, a title, a legend, and gridlines to enhance
+    clarity.
+
+    Parameters:
+        fig (matplotlib.figure.Figure, optional): Figure to draw into. A new 8×6 inch
+            Figure is created if omitted.
+        equations (tuple): The two equation functions to plot. Pass
+            evaluation_cache.MemoizedFunction wrappers to reuse values computed
+            elsewhere, e.g. by the root solves.
+        labels (tuple): Legend labels of the two equations.
+        intersection_points (array_like, optional): Precomputed intersections of the two
+            equations; find_intersections() is used if omitted.
+        x_range (tuple): Lower and upper x limit of the plot.
+
+    Returns:
+        matplotlib.figure.Figure: The figure holding the plot.
+    """
+    if fig is None:
+        fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
+    x_values = np.linspace(*x_range, 400)
+    first, second = equations
+    ax.plot(x_values, first(x_values), label=labels[0])
+    ax.plot(x_values, second(x_values), label=labels[1])
+    if intersection_points is None:
+        intersection_points = find_intersections()
+    intersection_values = first(intersection_points)
+    for intersection_point, intersection_value in zip(intersection_points, intersection_values):
+        ax.plot(intersection_point, intersection_value, 'wo', markersize=10, markeredgecolor='r')
+        ax.text(intersection_point, intersection_value + 0.5,
+                f'({intersection_point:.2f}, {intersection_value:.2f})', color='black')
+    ax.set_xlabel('x')
+    ax.set_ylabel('y')
+    ax.set_title('Intersection of Two Equations')
+    ax.legend()
+    ax.grid(True)
+    return fig
+
+
+@timed('plot.solution_tables')
+def plot_solution_tables(solutions, fig=None):
+    """
+    Display the solution vectors of the matrix script as tables, one per subplot.
+
+    Parameters:
+        solutions (list): Solution vectors (numpy arrays) of the matrix equations, in order.
+        fig (matplotlib.figure.Figure, optional): Figure to draw into. A new Figure is
+            created if omitted.
+
+    Returns:
+        matplotlib.figure.Figure: The figure holding the tables.
+    """
+    if fig is None:
+        fig = Figure()
+    axs = np.atleast_1d(fig.subplots(len(solutions)))
+    ordinals = ['first', 'second', 'third', 'fourth', 'fifth']
+    for i, (ax, solution) in enumerate(zip(axs, solutions)):
+        ax.axis('tight')
+        ax.axis('off')
+        name = ordinals[i] if i < len(ordinals) else f'#{i + 1}'
+        ax.set_title(f'Solution to the {name} matrix equation')
+        header = [f'x{j + 1}' for j in range(len(solution))]
+        table_data = [header] + [np.asarray(solution).tolist()]  # Prepare data for table display
+        ax.table(cellText=table_data, loc='center')  # Display table with solution
+    return fig
+#endregion
+
+#region Classes
+class DistributionFigure:
+    """
+    Persistent 2×n PDF/CDF figure whose artists are built once and updated for each new distribution.
+
+    Building a matplotlib figure (axes, lines, fill polygons, annotations, reference
+    lines, legends and borders) costs far more than computing the curves themselves.
+    This template creates every axis and artist once in the constructor; update()
+    then only replaces the data of the existing artists: the line data, the vertices
+    of the shaded tail polygon, the annotation text and position, the reference lines
+    and marker on the CDF, the titles and the axis limits. Column i of the figure
+    shows distribution i with its PDF on top and its CDF below.
+
+    With blit=True the changing artists are marked as animated and refresh() redraws
+    only those artists over a cached background of each axes, which is much faster
+    for interactive canvases. The background is recaptured automatically whenever
+    the axis limits, titles or legend labels change, since the ticks and texts are then
+    part of what has changed.
+
+    Parameters:
+        num_distributions (int): Number of distributions (figure columns).
+        fig (matplotlib.figure.Figure, optional): Figure to draw into. A new Figure of
+            10×10 inches per column is created if omitted.
+        blit (bool): Whether refresh() should use blitting.
+    """
+
+    def __init__(self, num_distributions=2, fig=None, blit=False):
+        if fig is None:
+            fig = Figure(figsize=(10 * num_distributions, 10))
+        self.fig = fig
+        self.blit = blit
+        self._laid_out = False
+        self._backgrounds = None
+        self._static_state = None
+        self.panels = []
+
+        axes = fig.subplots(2, num_distributions, squeeze=False)
+        for ax_pdf, ax_cdf in zip(axes[0], axes[1]):
+            panel = {'ax_pdf': ax_pdf, 'ax_cdf': ax_cdf}
+            panel['pdf_line'], = ax_pdf.plot([], [], label=' ')
+            panel['tail'] = ax_pdf.add_patch(Polygon(np.zeros((1, 2)), closed=True, color='lightgrey', alpha=0.5))
+            panel['annotation'] = ax_pdf.annotate('', xy=(0, 0), xytext=(0, 0),
+                                                  arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=.5'))
+            ax_pdf.set_xlabel('x')
+            ax_pdf.set_ylabel('f(X)')
+            panel['pdf_legend'] = ax_pdf.legend()
+
+            panel['cdf_line'], = ax_cdf.plot([], [], label=' ')
+            panel['hline'] = ax_cdf.axhline(y=0, color='black', linestyle='-', xmin=0, xmax=0, clip_on=False)
+            panel['vline'] = ax_cdf.axvline(x=0, color='black', linestyle='-', ymin=0, ymax=0, clip_on=False)
+            panel['marker'] = ax_cdf.scatter([0], [0], color='white', edgecolor='black', s=75, zorder=5)
+            ax_cdf.set_ylim(0, 1)
+            ax_cdf.set_xlabel('x')
+            ax_cdf.set_ylabel(r'$\theta(x)=\int_{-\infty}^{x} f(x) \, dx$')
+            panel['cdf_legend'] = ax_cdf.legend()
+
+            # Blue boxes around the plots, in axes coordinates so they never need updating
+            for ax in (ax_pdf, ax_cdf):
+                ax.add_patch(Rectangle((0, 0), 1, 1, transform=ax.transAxes, edgecolor='blue', fill=False))
+
+            if blit:
+                for key in ('pdf_line', 'tail', 'annotation', 'cdf_line', 'hline', 'vline', 'marker'):
+                    panel[key].set_animated(True)
+            self.panels.append(panel)
+
+    def update(self, x_values, pdf, cdf, annotations):
+        """
+        Replace the data shown in the figure with a new set of distributions.
+
+        Each annotation describes the tail probability marked for one distribution:
+        for tail 'lower' the region x < threshold is shaded and the CDF is marked at
+        (threshold, probability); for tail 'upper' the region x > threshold is shaded
+        and the CDF is marked at (threshold, 1 - probability). The probabilities are
+        computed from the thresholds for all distributions at once, or the thresholds
+        from target probabilities (see probability_queries.resolve_tail_annotations).
+
+        Parameters:
+            x_values (numpy.ndarray or list): x values, one row per distribution (see
+                generate_data_batch); a list of rows of different lengths, such as the
+                adaptive grids of adaptive_grid.generate_data_adaptive, is also accepted.
+            pdf (numpy.ndarray or list): PDF values, same shape as x_values.
+            cdf (numpy.ndarray or list): CDF values, same shape as x_values.
+            annotations (list): One dict per distribution with the keys 'mean', 'std',
+                'tail' ('lower' or 'upper') and either 'threshold' or 'probability'.
+
+        Returns:
+            matplotlib.figure.Figure: The updated figure.
+        """
+        annotations = resolve_tail_annotations(annotations)
+        for i, (panel, x, f, F, note) in enumerate(zip(self.panels, x_values, pdf, cdf, annotations)):
+            mean, std, tail, threshold, probability = (note['mean'], note['std'], note['tail'],
+                                                       note['threshold'], note['probability'])
+            name = f'N({mean:g}, {std:g})'
+            x_min, x_max = x[0], x[-1]
+            y_max = 1.065 * f.max()
+            ax_pdf, ax_cdf = panel['ax_pdf'], panel['ax_cdf']
+
+            # PDF: curve, shaded tail and annotation
+            panel['pdf_line'].set_data(x, f)
+            # The tail polygon ends exactly at the threshold, however coarse the grid is
+            edge_x = np.clip(threshold, x_min, x_max)
+            if tail == 'lower':
+                tail_x = np.append(x[x < edge_x], edge_x)
+            else:
+                tail_x = np.insert(x[x > edge_x], 0, edge_x)
+            tail_f = np.interp(tail_x, x, f)
+            panel['tail'].set_xy(np.column_stack((np.concatenate((tail_x, tail_x[::-1])),
+                                                  np.concatenate((tail_f, np.zeros_like(tail_f))))))
+            sign = '<' if tail == 'lower' else '>'
+            annotation = panel['annotation']
+            annotation.set_text(f'P(x {sign} {threshold:.2f} | N({mean:.2f}, {std:.2f})) = {probability:.2f}')
+            arrow_x = threshold - std if tail == 'lower' else threshold + 0.5 * std
+            annotation.xy = (arrow_x, 0.3 * np.interp(arrow_x, x, f))
+            if tail == 'lower':
+                annotation.set_position((x_min + 0.05 * (x_max - x_min), 0.4 * y_max))
+                annotation.set_horizontalalignment('left')
+            else:
+                annotation.set_position((x_max - 0.02 * (x_max - x_min), 0.3 * y_max))
+                annotation.set_horizontalalignment('right')
+            annotation.arrow_patch.set_connectionstyle(f'arc3,rad={0.5 if tail == "lower" else -0.5}')
+            ax_pdf.set_xlim(x_min, x_max)
+            ax_pdf.set_ylim(0, y_max)
+            ax_pdf.set_title(f'PDF - Equation {i + 1}: {name}')
+
+            # CDF: curve and the probability marked at the threshold
+            level = probability if tail == 'lower' else 1 - probability
+            panel['cdf_line'].set_data(x, F)
+            panel['hline'].set_data([0, (threshold - x_min) / (x_max - x_min)], [level, level])
+            panel['vline'].set_data([threshold, threshold], [0, level])
+            panel['marker'].set_offsets([[threshold, level]])
+            ax_cdf.set_xlim(x_min, x_max)
+            ax_cdf.set_title(f'CDF - Equation {i + 1}: {name}')
+
+            for line, legend in ((panel['pdf_line'], panel['pdf_legend']), (panel['cdf_line'], panel['cdf_legend'])):
+                line.set_label(name)
+                legend.get_texts()[0].set_text(name)
+
+        if not self._laid_out:
+            self.fig.tight_layout()
+            self._laid_out = True
+        return self.fig
+
+    def refresh(self):
+        """
+        Redraw the figure on its canvas, using blitting when it was enabled.
+
+        Without blitting the whole figure is redrawn. With blitting, a full redraw is
+        only done on the first call and whenever the axis limits, titles or legend
+        labels have changed; it captures the static background of every axes. Later
+        calls restore that background and draw just the animated artists on top of it.
+        """
+        canvas = self.fig.canvas
+        if not self.blit:
+            canvas.draw_idle()
+            return
+        # Titles lie outside the blitted axes areas, so text changes need a full redraw too
+        static_state = [(panel['ax_pdf'].get_xlim(), panel['ax_pdf'].get_ylim(), panel['ax_cdf'].get_xlim(),
+                         panel['ax_pdf'].get_title(), panel['ax_cdf'].get_title(),
+                         panel['pdf_legend'].get_texts()[0].get_text(), panel['cdf_legend'].get_texts()[0].get_text())
+                        for panel in self.panels]
+        if self._backgrounds is None or static_state != self._static_state:
+            canvas.draw()
+            self._backgrounds = [canvas.copy_from_bbox(ax.bbox) for ax in self.fig.axes]
+            self._static_state = static_state
+        else:
+            for background in self._backgrounds:
+                canvas.restore_region(background)
+        for panel in self.panels:
+            for key in ('tail', 'pdf_line', 'annotation'):
+                panel['ax_pdf'].draw_artist(panel[key])
+            for key in ('cdf_line', 'hline', 'vline', 'marker'):
+                panel['ax_cdf'].draw_artist(panel[key])
+        for ax in self.fig.axes:
+            canvas.blit(ax.bbox)
+#endregion
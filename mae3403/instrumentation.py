@@ -0,0 +1,245 @@
+#region Import
+import functools
+import json
+import time
+from contextlib import nullcontext
+#endregion
+
+#region Functions
+def enable(reset=True):
+    """
+    Switch instrumentation on for the current process.
+
+    Parameters:
+        reset (bool): Discard the metrics collected so far.
+    """
+    global _enabled
+    if reset:
+        metrics.reset()
+    _enabled = True
+
+
+def disable():
+    """
+    Switch instrumentation off; the metrics collected so far are kept.
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """
+    Check whether instrumentation is switched on.
+
+    Returns:
+        bool: Whether instrumentation is switched on.
+    """
+    return _enabled
+
+
+def count(name, value=1):
+    """
+    Add to a counter, such as the number of function evaluations or solver iterations.
+
+    Parameters:
+        name (str): Counter name, e.g. 'brentq.function_evaluations'.
+        value (int or float): Amount to add.
+    """
+    if _enabled:
+        metrics.add(name, value)
+
+
+def timer(name):
+    """
+    Time a block of code with a with statement.
+
+    Example:
+        with timer('plot.distributions'):
+            plot_distributions(data, fig)
+
+    Parameters:
+        name (str): Timer name; the part before the first dot is the stage category
+            ('numerics', 'plot', 'render', 'serialize', ...).
+
+    Returns:
+        context manager: A timer when instrumentation is enabled, otherwise a shared
+            no-op context manager.
+    """
+    return _Timer(name) if _enabled else _NULL_TIMER
+
+
+def timed(name):
+    """
+    Decorator that times every call of a function under the given timer name.
+
+    When instrumentation is disabled the wrapper only checks a module flag before
+    calling the function, so decorated functions cost next to nothing extra.
+
+    Parameters:
+        name (str): Timer name, see timer().
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def write_metrics(path, format=None):
+    """
+    Export the collected metrics to a file.
+
+    Parameters:
+        path (str or os.PathLike): Output file.
+        format (str, optional): 'json' or 'prometheus'; by default Prometheus text for
+            the extensions .prom and .txt and JSON otherwise.
+    """
+    if format is None:
+        format = 'prometheus' if str(path).lower().endswith(('.prom', '.txt')) else 'json'
+    if format not in ('json', 'prometheus'):
+        raise ValueError(f"Unknown format {format!r}, expected 'json' or 'prometheus'")
+    with open(path, 'w') as file:
+        file.write(metrics.to_json() if format == 'json' else metrics.to_prometheus())
+#endregion
+
+#region Classes
+class Metrics:
+    """
+    Timers and counters collected in one process.
+
+    A timer keeps the number of calls and the total, minimum and maximum duration in
+    seconds; a counter keeps a running sum. Worker processes of a pool have their own
+    Metrics, so only the work done in the calling process is included.
+    """
+
+    def __init__(self):
+        self.timers = {}
+        self.counters = {}
+        self.started = time.time()
+
+    def reset(self):
+        """
+        Discard all timers and counters.
+        """
+        self.timers.clear()
+        self.counters.clear()
+        self.started = time.time()
+
+    def record(self, name, seconds):
+        """
+        Add one timed call to a timer.
+
+        Parameters:
+            name (str): Timer name.
+            seconds (float): Duration of the call.
+        """
+        entry = self.timers.get(name)
+        if entry is None:
+            self.timers[name] = [1, seconds, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = min(entry[2], seconds)
+            entry[3] = max(entry[3], seconds)
+
+    def add(self, name, value=1):
+        """
+        Add to a counter.
+
+        Parameters:
+            name (str): Counter name.
+            value (int or float): Amount to add.
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def as_dict(self):
+        """
+        Collect the timers and counters in plain Python types.
+
+        Returns:
+            dict: {'started': Unix time of the last reset, 'timers': name -> {'count',
+                'total', 'min', 'max', 'mean'} in seconds, 'counters': name -> value}.
+        """
+        timers = {name: {'count': calls, 'total': total, 'min': low, 'max': high, 'mean': total / calls}
+                  for name, (calls, total, low, high) in sorted(self.timers.items())}
+        return {'started': self.started, 'timers': timers, 'counters': dict(sorted(self.counters.items()))}
+
+    def to_json(self):
+        """
+        Format the metrics as JSON.
+
+        Returns:
+            str: The metrics of as_dict() as JSON.
+        """
+        return json.dumps(self.as_dict(), indent=2)
+
+    def to_prometheus(self, prefix='mae3403'):
+        """
+        Format the metrics in the Prometheus text exposition format.
+
+        Timers become a summary <prefix>_stage_seconds (with _sum and _count) plus a
+        gauge <prefix>_stage_seconds_max, labelled with stage="<timer name>"; counters
+        become <prefix>_events_total labelled with event="<counter name>".
+
+        Parameters:
+            prefix (str): Prefix of the metric names.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        lines = [f"# HELP {prefix}_stage_seconds Time spent in instrumented stages.",
+                 f"# TYPE {prefix}_stage_seconds summary"]
+        for name, (calls, total, _, _) in sorted(self.timers.items()):
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {total!r}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {calls}')
+        lines += [f"# HELP {prefix}_stage_seconds_max Longest call of each instrumented stage.",
+                  f"# TYPE {prefix}_stage_seconds_max gauge"]
+        for name, (_, _, _, high) in sorted(self.timers.items()):
+            lines.append(f'{prefix}_stage_seconds_max{{stage="{name}"}} {high!r}')
+        lines += [f"# HELP {prefix}_events_total Function evaluations, solver iterations and cache lookups.",
+                  f"# TYPE {prefix}_events_total counter"]
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+class _Timer:
+    """
+    Context manager that records the duration of its block in the module metrics.
+
+    Parameters:
+        name (str): Timer name.
+    """
+
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        metrics.record(self.name, time.perf_counter() - self.start)
+#endregion
+
+#region Module state
+# Instrumentation is opt-in: until enable() is called, timers and counters do nothing
+_enabled = False
+
+# Metrics of the current process
+metrics = Metrics()
+
+_NULL_TIMER = nullcontext()
+#endregion
@@ -0,0 +1,180 @@
+#region Import
+import numpy as np
+from .instrumentation import count
+#endregion
+
+#region Constants
+ITERATIVE_METHODS = ('cg', 'gmres', 'jacobi', 'gauss_seidel')
+PRECONDITIONERS = (None, 'diagonal', 'ilu')
+
+# Inner iterations per GMRES restart cycle (SciPy's default)
+GMRES_RESTART = 20
+#endregion
+
+#region Functions
+# scipy.sparse is imported inside the functions that need them, as in linear_solvers
+
+def make_preconditioner(coeff_matrix, kind):
+    """
+    Build a preconditioner M ≈ A^-1 for the Krylov solvers.
+
+    Two kinds are available:
+    - 'diagonal' (Jacobi preconditioning) applies M = D^-1, where D is the diagonal of
+      A. It is almost free to build and helps when the rows are badly scaled.
+    - 'ilu' uses an incomplete LU factorization of A (scipy.sparse.linalg.spilu), which
+      keeps only the fill-in that falls within a drop tolerance. It is more expensive
+      to build but usually reduces the iteration count much further.
+
+    Parameters:
+        coeff_matrix (numpy.ndarray or scipy.sparse matrix): Coefficient matrix of shape (n, n).
+        kind (str or None): 'diagonal', 'ilu', or None for no preconditioning.
+
+    Returns:
+        scipy.sparse.linalg.LinearOperator or None: The preconditioner, applied as M @ r.
+    """
+    if kind is None:
+        return None
+    from scipy import sparse
+    from scipy.sparse.linalg import LinearOperator, spilu
+    n = coeff_matrix.shape[0]
+    if kind == 'diagonal':
+        diagonal = coeff_matrix.diagonal() if sparse.issparse(coeff_matrix) else np.diag(coeff_matrix)
+        if np.any(diagonal == 0):
+            raise ValueError("Diagonal preconditioning requires a non-zero diagonal")
+        inverse_diagonal = 1.0 / diagonal.astype(float)
+        return LinearOperator((n, n), matvec=lambda r: inverse_diagonal * r.ravel(), dtype=float)
+    if kind == 'ilu':
+        factors = spilu(sparse.csc_matrix(coeff_matrix, dtype=float))
+        return LinearOperator((n, n), matvec=factors.solve, dtype=float)
+    raise ValueError(f"Unknown preconditioner {kind!r}, expected one of {PRECONDITIONERS}")
+
+
+def _stationary_iteration(coeff_matrix, constant_vector, x, update, tol, maxiter, record):
+    """
+    Run a stationary iteration x_(k+1) = update(x_k) until the residual is small enough.
+
+    Parameters:
+        coeff_matrix (scipy.sparse matrix): Coefficient matrix in CSR format.
+        constant_vector (numpy.ndarray): Constant vector b.
+        x (numpy.ndarray): Starting vector.
+        update (callable): Function computing the next iterate from the current one.
+        tol (float): Relative residual tolerance ‖b - A x‖ <= tol * ‖b‖.
+        maxiter (int): Maximum number of iterations.
+        record (callable): Function called with every residual norm.
+
+    Returns:
+        tuple: The final iterate and whether the tolerance was reached.
+    """
+    threshold = tol * np.linalg.norm(constant_vector)
+    for _ in range(maxiter):
+        x = update(x)
+        residual_norm = np.linalg.norm(constant_vector - coeff_matrix @ x)
+        record(residual_norm)
+        if residual_norm <= threshold or not np.isfinite(residual_norm):
+            return x, residual_norm <= threshold
+    return x, False
+
+
+def solve_iterative(coeff_matrix, constant_vector, method='gmres', x0=None, preconditioner=None,
+                    tol=1e-8, maxiter=None, callback=None):
+    """
+    Solve A x = b iteratively, with optional warm start, preconditioning and residual telemetry.
+
+    Iterative solvers only need matrix-vector products with A, so they never form a
+    factorization and their cost per iteration is proportional to the number of
+    non-zeros. When a system changes only slightly between time steps, the previous
+    solution passed as x0 is already close to the new one and only a few iterations
+    are needed, which is far cheaper than a fresh direct factorization.
+
+    Available methods:
+    - 'cg': conjugate gradient, for symmetric positive definite A only; a non-symmetric
+      A is rejected, since CG would silently return a wrong vector for it.
+    - 'gmres' (default): restarted GMRES, for general non-symmetric A such as A1 in the
+      matrix script.
+    - 'jacobi': x_(k+1) = D^-1 (b - R x_k) with D the diagonal and R the rest of A.
+      Converges when the spectral radius of D^-1 R is below 1, which holds for every
+      strictly diagonally dominant matrix. A1 is not strictly diagonally dominant
+      (in row 3, |2| < |2| + |1|), but its spectral radius is about 0.42, so it converges.
+    - 'gauss_seidel': x_(k+1) = (D + L)^-1 (b - U x_k), using each updated component
+      immediately; usually converges about twice as fast as Jacobi.
+
+    The residual norm ‖b - A x‖ is recorded after every iteration. For GMRES the solver
+    only exposes the preconditioned residual of its inner iterations, so its history is
+    that value scaled by ‖b‖. For every method an iteration is one matrix-vector product
+    with A: the GMRES count is that of inner iterations, and maxiter is converted to
+    restart cycles of GMRES_RESTART inner iterations each, rounded up to a whole cycle.
+
+    Parameters:
+        coeff_matrix (numpy.ndarray or scipy.sparse matrix): Coefficient matrix of shape (n, n).
+        constant_vector (numpy.ndarray): Constant vector of shape (n,).
+        method (str): One of ITERATIVE_METHODS.
+        x0 (numpy.ndarray, optional): Warm-start vector, zeros if omitted.
+        preconditioner (str, optional): 'diagonal' or 'ilu' for CG and GMRES.
+        tol (float): Relative residual tolerance ‖b - A x‖ <= tol * ‖b‖.
+        maxiter (int, optional): Maximum number of iterations, 10 * n if omitted. For
+            GMRES this counts inner iterations and is rounded up to whole restart cycles.
+        callback (callable, optional): Called as callback(iteration, residual_norm)
+            after every iteration.
+
+    Returns:
+        tuple: Tuple containing the following elements:
+            - numpy array: solution vector of shape (n,)
+            - dict: telemetry with keys 'method', 'converged', 'iterations' and
+              'residual_history' (numpy array of residual norms, one per iteration)
+    """
+    if method not in ITERATIVE_METHODS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {ITERATIVE_METHODS}")
+    if preconditioner is not None and method in ('jacobi', 'gauss_seidel'):
+        raise ValueError(f"The {method} method does not take a preconditioner")
+    from scipy import sparse
+    from scipy.sparse.linalg import cg, gmres, spsolve_triangular
+
+    coeff_matrix = sparse.csr_matrix(coeff_matrix, dtype=float)
+    constant_vector = np.asarray(constant_vector, dtype=float)
+    n = coeff_matrix.shape[0]
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    if maxiter is None:
+        maxiter = 10 * n
+    residual_history = []
+
+    def record(residual_norm):
+        residual_history.append(residual_norm)
+        if callback is not None:
+            callback(len(residual_history), residual_norm)
+
+    if method == 'cg':
+        asymmetry = abs(coeff_matrix - coeff_matrix.T)
+        if asymmetry.nnz and asymmetry.max() > 1e-12 * abs(coeff_matrix).max():
+            raise ValueError("The cg method requires a symmetric matrix; use 'gmres' instead")
+        M = make_preconditioner(coeff_matrix, preconditioner)
+        x, info = cg(coeff_matrix, constant_vector, x0=x, rtol=tol, maxiter=maxiter, M=M,
+                     callback=lambda xk: record(np.linalg.norm(constant_vector - coeff_matrix @ xk)))
+        converged = info == 0
+    elif method == 'gmres':
+        M = make_preconditioner(coeff_matrix, preconditioner)
+        b_norm = np.linalg.norm(constant_vector)
+        # SciPy's maxiter counts restart cycles, not inner iterations
+        restart = min(GMRES_RESTART, n)
+        x, info = gmres(coeff_matrix, constant_vector, x0=x, rtol=tol, restart=restart,
+                        maxiter=-(-maxiter // restart), M=M,
+                        callback=lambda pr_norm: record(pr_norm * b_norm), callback_type='pr_norm')
+        converged = info == 0
+    else:
+        diagonal = coeff_matrix.diagonal()
+        if np.any(diagonal == 0):
+            raise ValueError(f"The {method} method requires a non-zero diagonal")
+        if method == 'jacobi':
+            remainder = coeff_matrix - sparse.diags(diagonal)
+            update = lambda xk: (constant_vector - remainder @ xk) / diagonal
+        else:
+            lower = sparse.tril(coeff_matrix, format='csr')
+            upper = sparse.triu(coeff_matrix, k=1, format='csr')
+            update = lambda xk: spsolve_triangular(lower, constant_vector - upper @ xk, lower=True)
+        x, converged = _stationary_iteration(coeff_matrix, constant_vector, x, update, tol, maxiter, record)
+
+    count('iterative_solver.iterations', len(residual_history))
+    return x, {'method': method,
+               'converged': bool(converged),
+               'iterations': len(residual_history),
+               'residual_history': np.array(residual_history)}
+#endregion
@@ -0,0 +1,482 @@
+#region Import
+import hashlib
+import sys
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+from .instrumentation import count, timed
+#endregion
+
+#region Constants
+# Backends that analyze_matrix() can choose and solve_structured() can use
+SOLVER_BACKENDS = ('triangular', 'banded', 'cholesky', 'sparse', 'dense')
+#endregion
+
+#region Functions
+# scipy.linalg and scipy.sparse take a large part of the import time of the package,
+# so they are imported inside the functions that need them, on their first call
+
+def _is_sparse(coeff_matrix):
+    """
+    Check for a scipy.sparse matrix without importing scipy.sparse.
+
+    A sparse matrix can only exist once scipy.sparse has been imported by someone, so
+    if it is not in sys.modules yet the answer is False.
+
+    Parameters:
+        coeff_matrix: Any matrix-like object.
+
+    Returns:
+        bool: Whether coeff_matrix is a scipy.sparse matrix or array.
+    """
+    sparse = sys.modules.get('scipy.sparse')
+    return sparse is not None and sparse.issparse(coeff_matrix)
+
+
+def solve_batched(coeff_matrices, constant_vectors):
+    """
+    Solve a stack of independent linear systems A[i] x[i] = b[i] in one call.
+
+    The systems are handed to numpy.linalg.solve together, which loops over the
+    stack inside LAPACK-backed compiled code instead of in Python. This is much
+    faster than calling scipy.linalg.solve once per system when there are many
+    small systems of the same size.
+
+    Parameters:
+        coeff_matrices (numpy.ndarray): Coefficient matrices of shape (k, n, n).
+        constant_vectors (numpy.ndarray): Constant vectors of shape (k, n).
+
+    Returns:
+        numpy.ndarray: Solution vectors of shape (k, n).
+    """
+    coeff_matrices = np.asarray(coeff_matrices, dtype=float)
+    constant_vectors = np.asarray(constant_vectors, dtype=float)
+    if coeff_matrices.ndim != 3 or coeff_matrices.shape[1] != coeff_matrices.shape[2]:
+        raise ValueError("coeff_matrices must have shape (k, n, n)")
+    if constant_vectors.shape != coeff_matrices.shape[:2]:
+        raise ValueError("constant_vectors must have shape (k, n)")
+    # Solve with explicit column vectors so that b is never mistaken for a matrix
+    return np.linalg.solve(coeff_matrices, constant_vectors[..., None])[..., 0]
+
+
+def matrix_key(coeff_matrix):
+    """
+    Compute a hashable key that identifies a coefficient matrix by its contents.
+
+    The key combines the shape, the dtype and a BLAKE2 digest of the raw matrix
+    data. Hashing costs O(n^2) operations, which is negligible next to the O(n^3)
+    cost of the factorization that the key is used to look up.
+
+    Parameters:
+        coeff_matrix (numpy.ndarray): Coefficient matrix of shape (n, n).
+
+    Returns:
+        tuple: Key (shape, dtype string, digest bytes).
+    """
+    coeff_matrix = np.ascontiguousarray(coeff_matrix)
+    digest = hashlib.blake2b(coeff_matrix.tobytes(), digest_size=16).digest()
+    return coeff_matrix.shape, coeff_matrix.dtype.str, digest
+
+
+def matrix_bandwidth(coeff_matrix):
+    """
+    Compute the lower and upper bandwidth of a matrix.
+
+    The lower bandwidth is the largest distance below the main diagonal at which
+    a non-zero entry occurs, and the upper bandwidth the largest distance above it.
+    A diagonal matrix has bandwidths (0, 0) and a lower triangular matrix has an
+    upper bandwidth of 0.
+
+    Parameters:
+        coeff_matrix (numpy.ndarray or scipy.sparse matrix): Square matrix of shape (n, n).
+
+    Returns:
+        tuple: (lower, upper) bandwidths as integers.
+    """
+    if _is_sparse(coeff_matrix):
+        rows, cols = coeff_matrix.nonzero()
+    else:
+        rows, cols = np.nonzero(coeff_matrix)
+    if rows.size == 0:
+        return 0, 0
+    offsets = cols - rows
+    return int(max(0, -offsets.min())), int(max(0, offsets.max()))
+
+
+def analyze_matrix(coeff_matrix, band_fraction=0.1, sparse_density=0.3, sparse_min_size=200):
+    """
+    Inspect a coefficient matrix and choose the fastest correct solver backend for it.
+
+    The checks are made from the cheapest and most specialised structure to the most
+    general one, and the first that applies is chosen:
+    1. 'sparse' for matrices that are already stored as scipy.sparse matrices, so they
+       are never converted to a dense array.
+    2. 'triangular' when every entry above or below the diagonal is zero; the system is
+       then solved by substitution in O(n^2) operations without any factorization.
+    3. 'banded' when all non-zeros lie within a narrow band around the diagonal
+       (lower + upper bandwidth below band_fraction * n); LAPACK's banded solver then
+       works in O(n * bandwidth^2) operations and memory.
+    4. 'cholesky' when the matrix is symmetric with a positive diagonal; the Cholesky
+       factorization A = L L^T takes half the work of LU. Positive definiteness is
+       confirmed by the factorization itself in solve_structured().
+    5. 'sparse' when the matrix has at least sparse_min_size rows and a fraction of
+       non-zero entries below sparse_density, using the SuperLU sparse direct solver.
+    6. 'dense' otherwise.
+
+    Parameters:
+        coeff_matrix (numpy.ndarray or scipy.sparse matrix): Square matrix of shape (n, n).
+        band_fraction (float): Largest total bandwidth, relative to n, treated as banded.
+        sparse_density (float): Largest fraction of non-zeros treated as sparse.
+        sparse_min_size (int): Smallest size for which a dense matrix is solved as sparse.
+
+    Returns:
+        str: One of the names in SOLVER_BACKENDS.
+    """
+    if _is_sparse(coeff_matrix):
+        return 'sparse'
+    coeff_matrix = np.asarray(coeff_matrix)
+    n = coeff_matrix.shape[0]
+    lower, upper = matrix_bandwidth(coeff_matrix)
+    if lower == 0 or upper == 0:
+        return 'triangular'
+    if lower + upper < band_fraction * n:
+        return 'banded'
+    if np.all(np.diag(coeff_matrix) > 0) and np.array_equal(coeff_matrix, coeff_matrix.T):
+        return 'cholesky'
+    if n >= sparse_min_size and np.count_nonzero(coeff_matrix) < sparse_density * n * n:
+        return 'sparse'
+    return 'dense'
+
+
+def solve_structured(coeff_matrix, constant_vector, backend=None):
+    """
+    Solve A x = b with the backend that best fits the structure of A and report the choice.
+
+    The backend is chosen with analyze_matrix() unless one is forced by the caller.
+    A matrix that looks symmetric positive definite but turns out not to be (the
+    Cholesky factorization fails) is solved with the dense backend instead, and the
+    backend that was actually used is the one reported.
+
+    Parameters:
+        coeff_matrix (numpy.ndarray or scipy.sparse matrix): Coefficient matrix of shape (n, n).
+        constant_vector (numpy.ndarray): Constant vector of shape (n,), or (n, m) for
+            several right-hand sides.
+        backend (str, optional): Name from SOLVER_BACKENDS to skip the automatic choice.
+
+    Returns:
+        tuple: Tuple containing the following elements:
+            - numpy array: solution with the same shape as constant_vector
+            - str: name of the backend that produced the solution
+    """
+    if backend is None:
+        backend = analyze_matrix(coeff_matrix)
+    if backend not in SOLVER_BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {SOLVER_BACKENDS}")
+    constant_vector = np.asarray(constant_vector, dtype=float)
+
+    if backend == 'sparse':
+        from scipy import sparse
+        from scipy.sparse.linalg import splu
+        return splu(sparse.csc_matrix(coeff_matrix, dtype=float)).solve(constant_vector), backend
+
+    from scipy.linalg import cho_factor, cho_solve, solve, solve_banded, solve_triangular
+    coeff_matrix = coeff_matrix.toarray() if _is_sparse(coeff_matrix) else np.asarray(coeff_matrix)
+    coeff_matrix = coeff_matrix.astype(float)
+    if backend == 'triangular':
+        lower = matrix_bandwidth(coeff_matrix)[1] == 0
+        return solve_triangular(coeff_matrix, constant_vector, lower=lower), backend
+    if backend == 'banded':
+        lower, upper = matrix_bandwidth(coeff_matrix)
+        n = coeff_matrix.shape[0]
+        # LAPACK band storage: entry A[i, j] goes to row upper + i - j of column j
+        banded = np.zeros((lower + upper + 1, n))
+        for offset in range(-lower, upper + 1):
+            diagonal = np.diagonal(coeff_matrix, offset)
+            if offset >= 0:
+                banded[upper - offset, offset:] = diagonal
+            else:
+                banded[upper - offset, :n + offset] = diagonal
+        return solve_banded((lower, upper), banded, constant_vector), backend
+    if backend == 'cholesky':
+        try:
+            return cho_solve(cho_factor(coeff_matrix), constant_vector), backend
+        except np.linalg.LinAlgError:
+            backend = 'dense'
+    return solve(coeff_matrix, constant_vector), backend
+
+
+def solve_with_diagnostics(coeff_matrix, constant_vector, precision='mixed', tol=None, maxiter=10, cache=None):
+    """
+    Solve A x = b and certify the accuracy of the solution.
+
+    Besides the solution the function reports how trustworthy it is:
+    1. The reciprocal condition number of A in the 1-norm is estimated from the LU
+       factors with LAPACK's gecon, which takes O(n^2) operations instead of the
+       O(n^3) of computing the inverse. A reciprocal condition number close to the
+       machine epsilon means that A is numerically singular.
+    2. The residual r = b - A x is computed in float64 and the solution is improved
+       by iterative refinement: solve A d = r with the existing factors and set
+       x = x + d, until the backward error (below) is at the float64 rounding level.
+    3. From the final residual, the backward error ‖r‖ / (‖A‖ ‖x‖ + ‖b‖) (the
+       relative change of A and b for which x is exact) and the forward error bound
+       ‖x - x_true‖ / ‖x‖ <= κ(A) ‖r‖ / (‖A‖ ‖x‖) are derived.
+
+    With precision='mixed' the LU factorization is computed in float32, which halves
+    its memory and roughly halves its O(n^3) cost, while the residuals are still
+    computed in float64. Refinement then recovers a float64-accurate solution as long
+    as κ(A) is well below 1 / eps(float32) ≈ 1.7e7. If it stops converging, the
+    matrix is factored again in float64 and refined from there, like LAPACK's dsgesv,
+    so the result is never less accurate than with precision='double'.
+
+    Parameters:
+        coeff_matrix (numpy.ndarray): Coefficient matrix of shape (n, n).
+        constant_vector (numpy.ndarray): Constant vector of shape (n,), or (n, m) for
+            several right-hand sides.
+        precision (str): 'mixed' (float32 factorization) or 'double' (float64).
+        tol (float, optional): Backward error ‖r‖ / (‖A‖ ‖x‖) at which the refinement
+            stops, eps(float64) * sqrt(n) by default (the criterion of LAPACK's dsgesv).
+        maxiter (int): Maximum number of refinement steps per factorization.
+        cache (linear_solvers.FactorizationCache, optional): Cache of LU factorizations.
+            Defaults to the shared linear_solvers.default_factorization_cache.
+
+    Returns:
+        tuple: Tuple containing the following elements:
+            - numpy array: solution with the same shape as constant_vector
+            - dict: diagnostics with the keys
+              'precision' (precision of the factorization that produced the solution),
+              'rcond' (reciprocal 1-norm condition number estimate),
+              'condition_number' (1 / rcond),
+              'near_singular' (whether rcond is below n * eps(float64)),
+              'residual_norm' (‖b - A x‖ in the 1-norm, per right-hand side),
+              'backward_error' and 'forward_error_bound' (per right-hand side),
+              'refinement_steps' (number of refinement steps taken) and
+              'converged' (whether the refinement reached tol)
+    """
+    if precision not in ('mixed', 'double'):
+        raise ValueError(f"Unknown precision {precision!r}, expected 'mixed' or 'double'")
+    from scipy.linalg import get_lapack_funcs, lu_solve
+    coeff_matrix = np.asarray(coeff_matrix, dtype=float)
+    constant_vector = np.asarray(constant_vector, dtype=float)
+    n = coeff_matrix.shape[0]
+    if coeff_matrix.ndim != 2 or coeff_matrix.shape[1] != n or constant_vector.shape[0] != n:
+        raise ValueError("coeff_matrix must have shape (n, n) and constant_vector shape (n,) or (n, m)")
+    if cache is None:
+        cache = default_factorization_cache
+    if tol is None:
+        tol = np.finfo(float).eps * np.sqrt(n)
+    matrix_norm = np.linalg.norm(coeff_matrix, 1)
+
+    def norms(vectors):
+        return np.abs(vectors).sum(axis=0)
+
+    def refine(factorization):
+        # Solve in the precision of the factors; corrections and the solution stay in float64
+        dtype = factorization[0].dtype
+        x = lu_solve(factorization, constant_vector.astype(dtype)).astype(float)
+        previous = np.inf
+        for step in range(maxiter + 1):
+            residual = constant_vector - coeff_matrix @ x
+            error = np.max(norms(residual) / np.maximum(matrix_norm * norms(x), np.finfo(float).tiny))
+            if not np.isfinite(error) or error <= tol:
+                return x, step, bool(np.isfinite(error))
+            # Stagnation: the residual no longer shrinks, so the factors are too inaccurate
+            if step == maxiter or error > 0.5 * previous:
+                return x, step, False
+            previous = error
+            x += lu_solve(factorization, residual.astype(dtype)).astype(float)
+
+    def factorize(dtype):
+        lu, piv = factorization = cache.factorize(coeff_matrix, dtype=dtype)
+        gecon, = get_lapack_funcs(('gecon',), (lu,))
+        rcond, info = gecon(lu, matrix_norm, norm='1')
+        return factorization, float(rcond)
+
+    used, steps, converged = precision, 0, False
+    if precision == 'mixed':
+        try:
+            factorization, rcond = factorize(np.float32)
+            solution, steps, converged = refine(factorization)
+        except np.linalg.LinAlgError:
+            # A zero pivot in float32 need not mean that A is singular in float64
+            pass
+    else:
+        factorization, rcond = factorize(np.float64)
+        solution, steps, converged = refine(factorization)
+    if not converged and used == 'mixed':
+        used = 'double'
+        factorization, rcond = factorize(np.float64)
+        solution, more_steps, converged = refine(factorization)
+        steps += more_steps
+
+    count('refinement.iterations', steps)
+    residual_norm = norms(constant_vector - coeff_matrix @ solution)
+    solution_norm = np.maximum(norms(solution), np.finfo(float).tiny)
+    condition_number = 1.0 / rcond if rcond > 0 else np.inf
+    return solution, {'precision': used,
+                      'rcond': rcond,
+                      'condition_number': condition_number,
+                      'near_singular': bool(rcond < n * np.finfo(float).eps),
+                      'residual_norm': residual_norm,
+                      'backward_error': residual_norm / (matrix_norm * solution_norm + norms(constant_vector)),
+                      'forward_error_bound': condition_number * residual_norm / (matrix_norm * solution_norm),
+                      'refinement_steps': steps,
+                      'converged': converged}
+
+
+@timed('numerics.solve_matrix_equation')
+def solve_matrix_equation(coeff_matrix, constant_vector, cache=None, diagnostics=False, method='direct',
+                          **iterative_options):
+    """
+    Solves a system of linear equations represented by a coefficient matrix and a constant vector.
+
+    Parameters:
+        coeff_matrix (numpy.ndarray): Coefficient matrix of shape (n, n), or a stack of
+            coefficient matrices of shape (k, n, n).
+        constant_vector (numpy.ndarray): Constant vector of shape (n,), or a stack of
+            constant vectors of shape (k, n) matching a stack of matrices.
+        cache (linear_solvers.FactorizationCache, optional): Cache of LU factorizations.
+            Defaults to the shared linear_solvers.default_factorization_cache.
+        diagnostics (bool): Solve a single system with solve_with_diagnostics() (mixed
+            precision with iterative refinement) and also return its diagnostics dict.
+        method (str): 'direct' (LU factorization) or one of the iterative methods of
+            iterative_solvers.solve_iterative() ('cg', 'gmres', 'jacobi', 'gauss_seidel')
+            for a single system, which also returns the solver telemetry.
+        **iterative_options: Further arguments of solve_iterative() for an iterative
+            method, such as x0, preconditioner, tol, maxiter and callback.
+
+    Returns:
+        numpy.ndarray: Solution vector of shape (n,), or solution vectors of shape (k, n).
+            With diagnostics=True, a tuple of the solution and the diagnostics dict, and
+            with an iterative method a tuple of the solution and the telemetry dict.
+
+    Details:
+        A single system is solved by factoring the coefficient matrix into P L U with
+        LAPACK (scipy.linalg.lu_factor) and then applying forward and back substitution
+        (scipy.linalg.lu_solve). The factorization is the expensive O(n^3) part, so it is
+        kept in a cache keyed on the matrix contents: solving the same coefficient matrix
+        again with a new constant vector only costs the O(n^2) substitution.
+
+        A stack of systems is passed to linear_solvers.solve_batched, which solves all of
+        them in one batched LAPACK call rather than one Python-level call per system.
+    """
+    if method != 'direct':
+        if diagnostics:
+            raise ValueError("Diagnostics are only available for the direct method")
+        from .iterative_solvers import solve_iterative
+        return solve_iterative(coeff_matrix, constant_vector, method=method, **iterative_options)
+    if iterative_options:
+        raise ValueError(f"Options {', '.join(sorted(iterative_options))} are only available for iterative methods")
+    coeff_matrix = np.asarray(coeff_matrix)
+    if diagnostics:
+        if coeff_matrix.ndim == 3:
+            raise ValueError("Diagnostics are only available for a single system")
+        return solve_with_diagnostics(coeff_matrix, constant_vector, cache=cache)
+    if coeff_matrix.ndim == 3:
+        return solve_batched(coeff_matrix, constant_vector)
+    if cache is None:
+        cache = default_factorization_cache
+    return cache.solve(coeff_matrix, constant_vector)
+#endregion
+
+#region Classes
+class FactorizationCache:
+    """
+    Least-recently-used cache of LU factorizations keyed on the coefficient matrix.
+
+    Solving A x = b with a dense direct method costs O(n^3) operations for the LU
+    factorization of A and only O(n^2) for the forward and back substitution. When
+    the same coefficient matrix is solved with many different constant vectors, the
+    factorization is computed once with scipy.linalg.lu_factor, stored here, and
+    every later solve reuses it through scipy.linalg.lu_solve.
+
+    The cache holds at most maxsize factorizations and evicts the least recently
+    used one when it is full. The hits and misses counters show how effective the
+    reuse is.
+
+    Parameters:
+        maxsize (int): Maximum number of factorizations kept in the cache.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._factorizations = OrderedDict()
+
+    def __len__(self):
+        return len(self._factorizations)
+
+    def factorize(self, coeff_matrix, key=None, dtype=np.float64):
+        """
+        Return the LU factorization of a coefficient matrix, computing it only on a cache miss.
+
+        Parameters:
+            coeff_matrix (numpy.ndarray): Coefficient matrix of shape (n, n).
+            key (hashable, optional): Caller-supplied key for the matrix. When omitted,
+                matrix_key() is used to derive one from the matrix contents.
+            dtype (numpy.dtype): Precision of the factorization. float64 unless a caller
+                such as solve_with_diagnostics() asks for float32 factors explicitly;
+                factors of different precisions are cached separately.
+
+        Returns:
+            tuple: The (lu, piv) pair returned by scipy.linalg.lu_factor.
+
+        Raises:
+            numpy.linalg.LinAlgError: If the matrix is singular (a zero or non-finite
+                pivot), as scipy.linalg.solve does; the factorization is not cached.
+        """
+        if key is None:
+            key = matrix_key(coeff_matrix)
+        key = (key, np.dtype(dtype).str)
+        factorization = self._factorizations.get(key)
+        if factorization is not None:
+            self.hits += 1
+            count('factorization_cache.hits')
+            self._factorizations.move_to_end(key)
+            return factorization
+
+        self.misses += 1
+        count('factorization_cache.misses')
+        from scipy.linalg import LinAlgWarning, lu_factor
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', LinAlgWarning)
+            factorization = lu_factor(np.asarray(coeff_matrix, dtype=dtype))
+        # lu_factor only warns about a singular matrix; solving with its factors would give nan or inf
+        pivots = np.diagonal(factorization[0])
+        if np.any(pivots == 0) or not np.all(np.isfinite(pivots)):
+            raise np.linalg.LinAlgError("Matrix is singular.")
+        self._factorizations[key] = factorization
+        if len(self._factorizations) > self.maxsize:
+            self._factorizations.popitem(last=False)
+        return factorization
+
+    def solve(self, coeff_matrix, constant_vector, key=None):
+        """
+        Solve A x = b, reusing a cached LU factorization of A when one is available.
+
+        Parameters:
+            coeff_matrix (numpy.ndarray): Coefficient matrix of shape (n, n).
+            constant_vector (numpy.ndarray): Constant vector of shape (n,), or a matrix
+                of shape (n, m) holding m right-hand sides.
+            key (hashable, optional): Caller-supplied key for the matrix.
+
+        Returns:
+            numpy.ndarray: Solution with the same shape as constant_vector.
+        """
+        from scipy.linalg import lu_solve
+        return lu_solve(self.factorize(coeff_matrix, key), np.asarray(constant_vector, dtype=float))
+
+    def clear(self):
+        """
+        Remove all cached factorizations and reset the hit and miss counters.
+        """
+        self._factorizations.clear()
+        self.hits = 0
+        self.misses = 0
+#endregion
+
+#region Module state
+# Shared cache used by solve_matrix_equation() when no cache is passed explicitly
+default_factorization_cache = FactorizationCache()
+#endregion
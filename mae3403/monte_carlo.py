@@ -0,0 +1,276 @@
+#region Import
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from .normal_kernel import norm_cdf
+#endregion
+
+#region Functions
+def spawn_generators(seed, num_streams):
+    """
+    Create independent, reproducible random number generators for parallel workers.
+
+    The seed is expanded with numpy.random.SeedSequence and split into num_streams
+    child sequences with spawn(). The children are statistically independent, so
+    every worker can draw from its own stream without overlapping the others, and
+    the whole run is reproducible from the single seed regardless of how the
+    streams are scheduled over processes.
+
+    Parameters:
+        seed (int or None): Root seed; None draws fresh entropy from the OS.
+        num_streams (int): Number of independent streams.
+
+    Returns:
+        list: numpy.random.Generator objects, one per stream.
+    """
+    return [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(num_streams)]
+
+
+def sample_batches(rng, mean, std, num_samples, batch_size=1_000_000):
+    """
+    Draw normal samples in fixed-size batches so that memory use stays bounded.
+
+    Parameters:
+        rng (numpy.random.Generator): Random number generator to draw from.
+        mean (float): Mean μ of the distribution.
+        std (float): Standard deviation σ of the distribution.
+        num_samples (int): Total number of samples to draw.
+        batch_size (int): Largest number of samples held in memory at once.
+
+    Yields:
+        numpy.ndarray: Batches of at most batch_size samples.
+    """
+    remaining = num_samples
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        yield rng.normal(mean, std, size)
+        remaining -= size
+
+
+def goodness_of_fit(samples, mean, std):
+    """
+    Compute the exact Kolmogorov-Smirnov and Anderson-Darling statistics of samples against N(μ, σ).
+
+    For sorted samples x_1 <= ... <= x_n and the model CDF F:
+    - KS: D = max_i max(i/n - F(x_i), F(x_i) - (i-1)/n), the largest vertical gap
+      between the empirical and the theoretical CDF.
+    - AD: A^2 = -n - (1/n) Σ (2i - 1) [ln F(x_i) + ln(1 - F(x_(n+1-i)))], which weights
+      the tails more heavily than KS. The logarithms are taken with log_ndtr so that
+      extreme samples do not produce log(0).
+    Both statistics require all samples in memory; for streamed runs use
+    StreamingHistogram.goodness_of_fit() instead.
+
+    Parameters:
+        samples (array_like): Sample values.
+        mean (float): Mean μ of the model distribution.
+        std (float): Standard deviation σ of the model distribution.
+
+    Returns:
+        dict: {'n': sample count, 'ks': KS statistic D, 'anderson_darling': A^2}.
+    """
+    x = np.sort(np.asarray(samples, dtype=float))
+    n = x.size
+    z = (x - mean) / std
+    cdf = norm_cdf(z)
+    i = np.arange(1, n + 1)
+    ks = max(np.max(i / n - cdf), np.max(cdf - (i - 1) / n))
+    # ln(1 - F(x_(n+1-i))) = ln F(-z_(n+1-i)) by the symmetry of the normal distribution
+    from scipy.special import log_ndtr
+    anderson_darling = -n - np.sum((2 * i - 1) * (log_ndtr(z) + log_ndtr(-z[::-1]))) / n
+    return {'n': n, 'ks': float(ks), 'anderson_darling': float(anderson_darling)}
+
+
+def _sample_stream(rng, mean, std, num_samples, edges, batch_size):
+    """
+    Worker task that draws one stream of samples into a StreamingHistogram.
+
+    Parameters:
+        rng (numpy.random.Generator): Generator of the stream.
+        mean, std (float): Parameters of the distribution.
+        num_samples (int): Number of samples in the stream.
+        edges (numpy.ndarray): Histogram bin edges.
+        batch_size (int): Largest number of samples held in memory at once.
+
+    Returns:
+        StreamingHistogram: Histogram of the stream's samples.
+    """
+    histogram = StreamingHistogram(edges)
+    for batch in sample_batches(rng, mean, std, num_samples, batch_size):
+        histogram.add(batch)
+    return histogram
+
+
+def run_monte_carlo(mean, std, num_samples, edges, num_streams=16, seed=None,
+                    batch_size=1_000_000, processes=None):
+    """
+    Draw a large normal sample in parallel and compare it with the analytic distribution.
+
+    The sample is divided over num_streams independent generators (see
+    spawn_generators), whose streams are drawn in a pool of worker processes. Each
+    stream is binned batch by batch into a StreamingHistogram, so no worker ever
+    holds more than batch_size samples, and the partial histograms are merged in
+    the parent. Because the division into streams does not depend on the number of
+    processes, a given seed always produces the same result.
+
+    Parameters:
+        mean (float): Mean μ of the distribution.
+        std (float): Standard deviation σ of the distribution.
+        num_samples (int): Total number of samples.
+        edges (array_like): Increasing histogram bin edges.
+        num_streams (int): Number of independent random streams.
+        seed (int, optional): Root seed for reproducible runs.
+        batch_size (int): Largest number of samples held in memory at once per worker.
+        processes (int, optional): Number of worker processes, os.cpu_count() if None;
+            1 draws all streams in the calling process.
+
+    Returns:
+        tuple: Tuple containing the following elements:
+            - StreamingHistogram: histogram of all samples
+            - dict: goodness-of-fit statistics, see StreamingHistogram.goodness_of_fit()
+    """
+    edges = np.asarray(edges, dtype=float)
+    generators = spawn_generators(seed, num_streams)
+    counts = [num_samples // num_streams + (i < num_samples % num_streams) for i in range(num_streams)]
+    tasks = [(rng, mean, std, count, edges, batch_size) for rng, count in zip(generators, counts)]
+
+    if processes == 1:
+        partials = [_sample_stream(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            partials = list(executor.map(_sample_stream, *zip(*tasks)))
+
+    histogram = StreamingHistogram(edges)
+    for partial in partials:
+        histogram.merge(partial)
+    return histogram, histogram.goodness_of_fit(mean, std)
+#endregion
+
+#region Classes
+class StreamingHistogram:
+    """
+    Histogram and empirical CDF that are accumulated batch by batch in constant memory.
+
+    Only the bin counts (plus one underflow and one overflow bin), the running mean
+    and the running sum of squared deviations from it (M2) are stored, so the memory
+    use does not depend on the number of samples. Each batch and each merged histogram
+    is combined with Chan's parallel update of the mean and M2, which unlike the raw
+    sums of x and x^2 does not lose the variance to cancellation when the mean is large
+    compared with the spread. Histograms with identical edges built by different
+    workers can be combined with merge().
+
+    Parameters:
+        edges (array_like): Increasing bin edges, shape (num_bins + 1,).
+    """
+
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype=float)
+        # counts[0] is the underflow bin and counts[-1] the overflow bin
+        self.counts = np.zeros(self.edges.size + 1, dtype=np.int64)
+        self.n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _combine(self, n, mean, m2):
+        """
+        Fold the count, mean and M2 of another set of samples into the running moments.
+
+        Parameters:
+            n (int): Number of samples of the other set.
+            mean (float): Their mean.
+            m2 (float): Their sum of squared deviations from the mean.
+        """
+        if n == 0:
+            return
+        total = self.n + n
+        delta = mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += m2 + delta ** 2 * self.n * n / total
+        self.n = total
+
+    def add(self, samples):
+        """
+        Add a batch of samples to the histogram.
+
+        Parameters:
+            samples (array_like): Sample values.
+        """
+        samples = np.asarray(samples, dtype=float).ravel()
+        index = np.searchsorted(self.edges, samples, side='right')
+        self.counts += np.bincount(index, minlength=self.counts.size)
+        if samples.size:
+            batch_mean = samples.mean()
+            deviations = samples - batch_mean
+            self._combine(samples.size, batch_mean, np.dot(deviations, deviations))
+
+    def merge(self, other):
+        """
+        Add the counts of another histogram with the same edges to this one.
+
+        Parameters:
+            other (StreamingHistogram): Histogram to merge in.
+        """
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Only histograms with identical bin edges can be merged")
+        self.counts += other.counts
+        self._combine(other.n, other._mean, other._m2)
+
+    @property
+    def mean(self):
+        """Sample mean of all samples added so far."""
+        return self._mean if self.n else np.nan
+
+    @property
+    def std(self):
+        """Sample standard deviation (with Bessel's correction) of all samples added so far."""
+        return np.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else np.nan
+
+    def density(self):
+        """
+        Return the histogram normalized as a probability density over its bins.
+
+        Returns:
+            numpy.ndarray: Density of each bin, shape (num_bins,), comparable with the PDF.
+        """
+        return self.counts[1:-1] / (self.n * np.diff(self.edges))
+
+    def ecdf(self):
+        """
+        Return the empirical CDF evaluated at the bin edges.
+
+        Returns:
+            numpy.ndarray: Fraction of the samples below each edge, shape (num_bins + 1,).
+        """
+        return np.cumsum(self.counts[:-1]) / self.n
+
+    def goodness_of_fit(self, mean, std):
+        """
+        Compare the binned sample with N(μ, σ) using Kolmogorov-Smirnov and Anderson-Darling statistics.
+
+        Since the individual samples are not kept, the statistics are computed from the
+        empirical CDF at the bin edges:
+        - KS is the largest gap |F_n(e) - F(e)| over the edges. It is a lower bound of the
+          exact statistic, short by at most the largest probability of a single bin.
+        - AD integrates n (F_n - F)^2 / (F (1 - F)) dF over the probability scale, with the
+          gap in each bin (including the two open tail bins) taken as the average of its
+          values at the bin ends.
+
+        Parameters:
+            mean (float): Mean μ of the model distribution.
+            std (float): Standard deviation σ of the model distribution.
+
+        Returns:
+            dict: {'n', 'ks', 'anderson_darling', 'mean', 'std'} for the binned sample.
+        """
+        model = np.concatenate(([0.0], norm_cdf(self.edges, mean, std), [1.0]))
+        empirical = np.concatenate(([0.0], self.ecdf(), [1.0]))
+        gap = empirical - model
+        ks = np.max(np.abs(gap))
+
+        width = np.diff(model)
+        midpoint = 0.5 * (model[:-1] + model[1:])
+        mean_gap_squared = 0.5 * (gap[:-1] ** 2 + gap[1:] ** 2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            terms = np.where(width > 0, width * mean_gap_squared / (midpoint * (1 - midpoint)), 0.0)
+        return {'n': self.n, 'ks': float(ks), 'anderson_darling': float(self.n * np.sum(terms)),
+                'mean': float(self.mean), 'std': float(self.std)}
+#endregion
@@ -0,0 +1,176 @@
+#region Import
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from .equations import DEFAULT_PARAMETERS, PARAMETER_NAMES, find_intersections
+#endregion
+
+#region Functions
+def make_parameter_grid(**values):
+    """
+    Build the Cartesian product of coefficient values as an array of parameter tuples.
+
+    Every coefficient named in PARAMETER_NAMES may be given as a scalar or a sequence
+    of values; coefficients that are not given keep their DEFAULT_PARAMETERS value.
+    The result has one row per combination, in the (a, b, c, d, e) column order.
+
+    Example:
+        make_parameter_grid(b=np.linspace(1, 5, 50), d=[1.5, 2.0, 2.5])
+        gives a (150, 5) array in which a, c and e stay at their defaults.
+
+    Parameters:
+        **values (float or array_like): Values for any of the coefficients a, b, c, d, e.
+
+    Returns:
+        numpy.ndarray: Parameter grid of shape (n_combinations, 5).
+    """
+    unknown = set(values) - set(PARAMETER_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown parameter name(s): {', '.join(sorted(unknown))}")
+    axes = [np.atleast_1d(np.asarray(values.get(name, default), dtype=float))
+            for name, default in zip(PARAMETER_NAMES, DEFAULT_PARAMETERS)]
+    mesh = np.meshgrid(*axes, indexing='ij')
+    return np.stack([m.ravel() for m in mesh], axis=1)
+
+
+def _solve_chunk(start, parameter_rows, lower, upper, num_points):
+    """
+    Worker task that finds the intersections for a contiguous chunk of parameter tuples.
+
+    Parameter tuples are sent to the workers in chunks so that the cost of
+    transferring work to another process is shared by many root searches.
+
+    Parameters:
+        start (int): Row index of the first tuple of the chunk in the full grid.
+        parameter_rows (numpy.ndarray): Parameter tuples of the chunk, shape (m, 5).
+        lower, upper (float): Search interval.
+        num_points (int): Number of grid points used to bracket the roots.
+
+    Returns:
+        tuple: The start index and a list with the roots of every tuple in the chunk.
+    """
+    return start, [find_intersections(tuple(row), lower, upper, num_points) for row in parameter_rows]
+
+
+def iter_sweep(parameter_grid, lower=-5.0, upper=5.0, num_points=1000, processes=None, chunksize=256):
+    """
+    Compute the intersection set for every parameter tuple and yield results as they finish.
+
+    The grid is split into chunks of chunksize rows that are distributed over a pool
+    of worker processes. Completed chunks are yielded immediately, in whatever order
+    they finish, so callers can consume or store results while the rest of the sweep
+    is still running. With processes=1 the chunks are solved in the calling process,
+    which avoids the pool start-up cost for small sweeps.
+
+    Parameters:
+        parameter_grid (array_like): Parameter tuples of shape (n, 5), see make_parameter_grid.
+        lower, upper (float): Search interval for the intersections.
+        num_points (int): Number of grid points used to bracket the roots.
+        processes (int, optional): Number of worker processes, os.cpu_count() if None.
+        chunksize (int): Number of parameter tuples per worker task.
+
+    Yields:
+        tuple: (index, roots) for every parameter tuple, where index is the row in
+        parameter_grid and roots is a sorted numpy array of intersections.
+    """
+    parameter_grid = np.asarray(parameter_grid, dtype=float)
+    starts = range(0, len(parameter_grid), chunksize)
+
+    if processes == 1:
+        for start in starts:
+            _, roots = _solve_chunk(start, parameter_grid[start:start + chunksize], lower, upper, num_points)
+            yield from zip(itertools.count(start), roots)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(_solve_chunk, start, parameter_grid[start:start + chunksize],
+                                   lower, upper, num_points)
+                   for start in starts]
+        for future in as_completed(futures):
+            start, roots = future.result()
+            yield from zip(itertools.count(start), roots)
+
+
+def run_sweep(parameter_grid, lower=-5.0, upper=5.0, num_points=1000, processes=None, chunksize=256):
+    """
+    Run a parameter sweep and collect all intersection sets in a columnar table.
+
+    The number of intersections differs between parameter tuples, so the roots are
+    stored in one flat column together with offsets, in the same way as a compressed
+    sparse row matrix: the roots of tuple i are roots[root_offsets[i]:root_offsets[i + 1]].
+    The coefficient columns and n_roots have one entry per parameter tuple.
+
+    Parameters:
+        parameter_grid (array_like): Parameter tuples of shape (n, 5), see make_parameter_grid.
+        lower, upper (float): Search interval for the intersections.
+        num_points (int): Number of grid points used to bracket the roots.
+        processes (int, optional): Number of worker processes, os.cpu_count() if None.
+        chunksize (int): Number of parameter tuples per worker task.
+
+    Returns:
+        dict: Columnar table with the following numpy array columns:
+            - 'a', 'b', 'c', 'd', 'e': coefficients of each tuple, shape (n,)
+            - 'n_roots': number of intersections of each tuple, shape (n,)
+            - 'root_offsets': start of each tuple's roots in 'roots', shape (n + 1,)
+            - 'roots': all intersections, concatenated in tuple order
+    """
+    parameter_grid = np.asarray(parameter_grid, dtype=float)
+    results = [None] * len(parameter_grid)
+    for index, roots in iter_sweep(parameter_grid, lower, upper, num_points, processes, chunksize):
+        results[index] = roots
+
+    n_roots = np.array([len(roots) for roots in results], dtype=np.int64)
+    table = {name: parameter_grid[:, i].copy() for i, name in enumerate(PARAMETER_NAMES)}
+    table['n_roots'] = n_roots
+    table['root_offsets'] = np.concatenate(([0], np.cumsum(n_roots)))
+    table['roots'] = np.concatenate(results) if results else np.empty(0)
+    return table
+
+
+def write_sweep(parameter_grid, sink, lower=-5.0, upper=5.0, num_points=1000, processes=None, chunksize=256):
+    """
+    Run a parameter sweep and append the results to a result sink as they finish.
+
+    Unlike run_sweep(), the results are never collected in memory: every chunksize
+    finished parameter tuples are appended to the sink as one chunk with the columns
+    'index' (row in parameter_grid), 'a' to 'e', 'n_roots' and the ragged column
+    'roots'. Rows are written in completion order, so use 'index' to restore the grid
+    order; load_results() returns the roots with their 'roots_offsets'.
+
+    Parameters:
+        parameter_grid (array_like): Parameter tuples of shape (n, 5), see make_parameter_grid.
+        sink (ResultSink): Open sink, see result_sinks.open_sink(); it is not closed here.
+        lower, upper (float): Search interval for the intersections.
+        num_points (int): Number of grid points used to bracket the roots.
+        processes (int, optional): Number of worker processes, os.cpu_count() if None.
+        chunksize (int): Number of parameter tuples per worker task and per appended chunk.
+
+    Returns:
+        int: Number of parameter tuples written.
+    """
+    parameter_grid = np.asarray(parameter_grid, dtype=float)
+    sink.metadata.setdefault('lower', lower)
+    sink.metadata.setdefault('upper', upper)
+    sink.metadata.setdefault('num_points', num_points)
+    indices, results = [], []
+
+    def flush():
+        rows = parameter_grid[indices]
+        columns = {'index': np.array(indices, dtype=np.int64)}
+        columns.update((name, rows[:, i]) for i, name in enumerate(PARAMETER_NAMES))
+        columns['n_roots'] = np.array([len(roots) for roots in results], dtype=np.int64)
+        columns['roots'] = [np.asarray(roots, dtype=float) for roots in results]
+        sink.append(**columns)
+        indices.clear()
+        results.clear()
+
+    for index, roots in iter_sweep(parameter_grid, lower, upper, num_points, processes, chunksize):
+        indices.append(index)
+        results.append(roots)
+        if len(indices) >= chunksize:
+            flush()
+    if indices:
+        flush()
+    return len(parameter_grid)
+#endregion
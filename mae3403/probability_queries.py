@@ -0,0 +1,133 @@
+#region Import
+import numpy as np
+from .normal_kernel import norm_cdf, norm_sf
+#endregion
+
+#region Functions
+def probability_below(a, mean=0.0, std=1.0):
+    """
+    Compute P(X < a) for X ~ N(μ, σ) for any batch of thresholds.
+
+    Parameters:
+        a (float or array_like): Upper threshold(s) a.
+        mean (float or array_like): Mean(s) μ, broadcast against a.
+        std (float or array_like): Standard deviation(s) σ, broadcast against a.
+
+    Returns:
+        numpy.ndarray: The probabilities P(X < a).
+    """
+    return norm_cdf(a, mean, std)
+
+
+def probability_above(b, mean=0.0, std=1.0):
+    """
+    Compute P(X > b) for X ~ N(μ, σ) for any batch of thresholds.
+
+    The survival function is used directly so that small upper-tail probabilities
+    are not lost to round-off in 1 - P(X < b).
+
+    Parameters:
+        b (float or array_like): Lower threshold(s) b.
+        mean (float or array_like): Mean(s) μ, broadcast against b.
+        std (float or array_like): Standard deviation(s) σ, broadcast against b.
+
+    Returns:
+        numpy.ndarray: The probabilities P(X > b).
+    """
+    return norm_sf(b, mean, std)
+
+
+def probability_between(a, b, mean=0.0, std=1.0):
+    """
+    Compute P(a < X < b) for X ~ N(μ, σ) for any batch of intervals.
+
+    The interval probability is the difference of two CDF values. When the interval
+    lies above the mean both CDF values are close to 1 and their difference would
+    cancel catastrophically, so the difference of the survival functions
+    P(X > a) - P(X > b) is used there instead.
+
+    Parameters:
+        a (float or array_like): Lower end(s) of the interval.
+        b (float or array_like): Upper end(s) of the interval.
+        mean (float or array_like): Mean(s) μ, broadcast against a and b.
+        std (float or array_like): Standard deviation(s) σ, broadcast against a and b.
+
+    Returns:
+        numpy.ndarray: The probabilities P(a < X < b), zero for empty intervals.
+    """
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    upper_side = a > np.asarray(mean, dtype=float)
+    probability = np.where(upper_side, norm_sf(a, mean, std) - norm_sf(b, mean, std),
+                           norm_cdf(b, mean, std) - norm_cdf(a, mean, std))
+    return np.maximum(probability, 0.0)
+
+
+def quantile(p, mean=0.0, std=1.0):
+    """
+    Compute the threshold a with P(X < a) = p (the inverse CDF) for X ~ N(μ, σ).
+
+    Parameters:
+        p (float or array_like): Target probabilities in [0, 1].
+        mean (float or array_like): Mean(s) μ, broadcast against p.
+        std (float or array_like): Standard deviation(s) σ, broadcast against p.
+
+    Returns:
+        numpy.ndarray: The thresholds a = μ + σ * Φ^-1(p).
+    """
+    from scipy.special import ndtri
+    return mean + std * ndtri(np.asarray(p, dtype=float))
+
+
+def upper_quantile(p, mean=0.0, std=1.0):
+    """
+    Compute the threshold b with P(X > b) = p (the inverse survival function) for X ~ N(μ, σ).
+
+    The threshold is computed as μ - σ * Φ^-1(p), which by symmetry of the normal
+    distribution equals μ + σ * Φ^-1(1 - p) but stays accurate for tiny p.
+
+    Parameters:
+        p (float or array_like): Target upper-tail probabilities in [0, 1].
+        mean (float or array_like): Mean(s) μ, broadcast against p.
+        std (float or array_like): Standard deviation(s) σ, broadcast against p.
+
+    Returns:
+        numpy.ndarray: The thresholds b.
+    """
+    from scipy.special import ndtri
+    return mean - std * ndtri(np.asarray(p, dtype=float))
+
+
+def resolve_tail_annotations(annotations):
+    """
+    Fill in the thresholds and tail probabilities of a batch of plot annotations.
+
+    Every annotation is a dict with the keys 'mean', 'std' and 'tail' ('lower' for
+    P(X < threshold) or 'upper' for P(X > threshold)) and either a 'threshold' or a
+    target 'probability'. Missing thresholds are obtained from the quantile of the
+    target probability, and then the probability of every annotation is computed
+    from its threshold. Both steps are single vectorized calls over the whole batch,
+    so thousands of annotations cost about as much as one.
+
+    Parameters:
+        annotations (list): Annotation dicts as described above.
+
+    Returns:
+        list: New annotation dicts that all contain 'threshold' and 'probability'.
+    """
+    means = np.array([note['mean'] for note in annotations], dtype=float)
+    stds = np.array([note['std'] for note in annotations], dtype=float)
+    lower = np.array([note['tail'] == 'lower' for note in annotations])
+    thresholds = np.array([note.get('threshold', np.nan) for note in annotations], dtype=float)
+    targets = np.array([note.get('probability', np.nan) for note in annotations], dtype=float)
+
+    missing = np.isnan(thresholds)
+    if np.any(missing & np.isnan(targets)):
+        raise ValueError("Every annotation needs a 'threshold' or a 'probability'")
+    thresholds = np.where(missing, np.where(lower, quantile(targets, means, stds),
+                                            upper_quantile(targets, means, stds)), thresholds)
+    probabilities = np.where(lower, probability_below(thresholds, means, stds),
+                             probability_above(thresholds, means, stds))
+
+    return [dict(note, threshold=float(threshold), probability=float(probability))
+            for note, threshold, probability in zip(annotations, thresholds, probabilities)]
+#endregion
@@ -0,0 +1,98 @@
+#region Import
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from .instrumentation import timed
+#endregion
+
+#region Functions
+@timed('render.figure')
+def render_figure(fig, path=None, format=None, dpi=100):
+    """
+    Render a figure to a file or to in-memory bytes without any GUI backend.
+
+    Figures that are not managed by pyplot are attached to the non-interactive Agg
+    canvas before saving, so rendering never starts a GUI event loop and works on
+    machines without a display. Vector formats (SVG, PDF) are written by matplotlib's
+    own vector backends. When path is given the file format is taken from its
+    extension unless format is set explicitly; otherwise the figure is rendered into
+    a bytes object, which is useful for sending figures between processes or
+    embedding them in reports.
+
+    Parameters:
+        fig (matplotlib.figure.Figure): Figure to render.
+        path (str or os.PathLike, optional): Output file. If omitted, bytes are returned.
+        format (str, optional): 'png', 'svg', 'pdf', ... ('png' when rendering to bytes).
+        dpi (float): Resolution for raster formats.
+
+    Returns:
+        str or bytes: The output path as a string, or the rendered bytes.
+    """
+    if fig.canvas.manager is None:
+        FigureCanvasAgg(fig)
+    if path is not None:
+        fig.savefig(path, format=format, dpi=dpi)
+        return os.fspath(path)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=format or 'png', dpi=dpi)
+    return buffer.getvalue()
+
+
+def _render_task(builder, kwargs, path, format, dpi):
+    """
+    Worker task that builds one figure and renders it.
+
+    Parameters:
+        builder (callable): Module-level function returning a Figure, e.g. figures.plot_distributions.
+        kwargs (dict): Keyword arguments for the builder.
+        path (str or None): Output file, or None to return bytes.
+        format (str or None): Output format.
+        dpi (float): Resolution for raster formats.
+
+    Returns:
+        str or bytes: Result of render_figure().
+    """
+    return render_figure(builder(**kwargs), path, format, dpi)
+
+
+def render_many(tasks, output_dir=None, format='png', dpi=100, processes=None):
+    """
+    Build and render many figures in parallel worker processes.
+
+    Each task is a tuple (builder, kwargs, filename). The builder is called in a
+    worker process with the keyword arguments to create the figure, which is then
+    rendered headlessly with render_figure(). Builders must be module-level functions
+    (such as those in figures.py) so that they can be sent to the workers. Results are
+    returned in the order of the tasks. With processes=1 all figures are rendered in
+    the calling process.
+
+    Parameters:
+        tasks (iterable): Tuples (builder, kwargs, filename). A filename of None renders
+            that figure to bytes instead of a file.
+        output_dir (str, optional): Directory in which the filenames are created; it is
+            created if it does not exist. Filenames are used as given if omitted.
+        format (str): Output format used for tasks rendered to bytes, and for files whose
+            names have no extension.
+        dpi (float): Resolution for raster formats.
+        processes (int, optional): Number of worker processes, os.cpu_count() if None.
+
+    Returns:
+        list: Output paths (str) or rendered bytes, one per task.
+    """
+    jobs = []
+    for builder, kwargs, filename in tasks:
+        path = None
+        if filename is not None:
+            path = os.path.join(output_dir, filename) if output_dir is not None else os.fspath(filename)
+        job_format = format if path is None or not os.path.splitext(path)[1] else None
+        jobs.append((builder, kwargs or {}, path, job_format, dpi))
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    if processes == 1:
+        return [_render_task(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(_render_task, *zip(*jobs))) if jobs else []
+#endregion
@@ -0,0 +1,508 @@
+#region Import
+import abc
+import json
+import os
+import shutil
+import struct
+import zipfile
+
+import numpy as np
+from .instrumentation import timed
+#endregion
+
+#region Constants
+SINK_FORMATS = ('npz', 'parquet', 'hdf5')
+
+# File extension -> format, used when no format is given explicitly
+FORMAT_EXTENSIONS = {'.npz': 'npz', '.parquet': 'parquet', '.pq': 'parquet', '.h5': 'hdf5', '.hdf5': 'hdf5'}
+
+# Name of the NPZ member (and Parquet schema key) holding the JSON metadata
+METADATA_KEY = '__metadata__'
+
+# Size of the fixed part of a ZIP local file header, which precedes every member's data
+_ZIP_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+#endregion
+
+#region Functions
+def sink_format(path, format=None):
+    """
+    Determine the storage format of a results file from the explicit choice or the extension.
+
+    Parameters:
+        path (str or os.PathLike): Results file.
+        format (str, optional): One of SINK_FORMATS.
+
+    Returns:
+        str: The format name.
+    """
+    if format is None:
+        format = FORMAT_EXTENSIONS.get(os.path.splitext(os.fspath(path))[1].lower())
+        if format is None:
+            raise ValueError(f"Cannot infer the format of {os.fspath(path)!r}; pass one of {SINK_FORMATS}")
+    if format not in SINK_FORMATS:
+        raise ValueError(f"Unknown format {format!r}, expected one of {SINK_FORMATS}")
+    return format
+
+
+def open_sink(path, format=None, metadata=None, compress=True):
+    """
+    Create a result sink that writes columns chunk by chunk to a binary file.
+
+    Parameters:
+        path (str or os.PathLike): Results file; existing files are replaced.
+        format (str, optional): 'npz', 'parquet' or 'hdf5'; inferred from the extension if omitted.
+        metadata (dict, optional): JSON-serializable description of the run, such as the
+            parameters, tolerances and solver used.
+        compress (bool): Whether to compress the columns, see the sink classes for the
+            effect on memory mapping.
+
+    Returns:
+        ResultSink: The sink; use it as a context manager or call close() when done.
+    """
+    sink_class = {'npz': NpzSink, 'parquet': ParquetSink, 'hdf5': Hdf5Sink}[sink_format(path, format)]
+    return sink_class(path, metadata, compress)
+
+
+def _normalize_chunk(columns, schema=None, dtypes=None):
+    """
+    Classify the columns of a chunk as fixed-width arrays or ragged lists of arrays.
+
+    An empty list has no element to tell the two kinds apart, so it takes the kind of
+    the column in the schema of the earlier chunks, and is a ragged column without
+    rows for the first chunk.
+
+    Parameters:
+        columns (dict): Column name -> array of shape (k, ...) or list of k 1-D arrays.
+        schema (dict, optional): Column name -> (kind, row shape) of the earlier chunks.
+        dtypes (dict, optional): Column name -> dtype of the earlier chunks.
+
+    Returns:
+        tuple: Column name -> ('fixed', array) or ('ragged', values, lengths), and the number of rows k.
+    """
+    chunk = {}
+    num_rows = None
+    for name, value in columns.items():
+        if isinstance(value, (list, tuple)) and not len(value):
+            kind = schema[name][0] if schema is not None and name in schema else 'ragged'
+            if kind == 'fixed':
+                value = np.empty((0,) + schema[name][1], dtype=dtypes[name])
+        else:
+            kind = 'ragged' if isinstance(value, (list, tuple)) and np.ndim(value[0]) > 0 else 'fixed'
+        if kind == 'ragged':
+            parts = [np.ravel(part) for part in value]
+            values = np.concatenate(parts) if parts else np.empty(0, dtype=(dtypes or {}).get(name, float))
+            chunk[name] = ('ragged', values, np.array([part.size for part in parts], dtype=np.int64))
+            rows = len(parts)
+        else:
+            array = np.asarray(value)
+            if array.ndim == 0:
+                raise ValueError(f"Column {name!r} must have one entry per row")
+            chunk[name] = ('fixed', array)
+            rows = len(array)
+        if num_rows is not None and rows != num_rows:
+            raise ValueError("All columns of a chunk must have the same number of rows")
+        num_rows = rows
+    return chunk, num_rows or 0
+
+
+def _read_npy_header(file):
+    """
+    Read the header of a .npy image, leaving the file positioned at the start of its data.
+
+    Parameters:
+        file (file object): Binary file positioned at the .npy magic string.
+
+    Returns:
+        tuple: The shape, whether the data is in Fortran order, and the dtype.
+    """
+    version = np.lib.format.read_magic(file)
+    read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+    return read_header(file)
+
+
+def _chunk_directories(parts):
+    """
+    List the complete chunk directories of an NpzSink spill directory in append order.
+
+    Parameters:
+        parts (str): Spill directory '<path>.parts'.
+
+    Returns:
+        list: Paths of the chunk directories; chunks still being written are left out.
+    """
+    return [os.path.join(parts, name) for name in sorted(os.listdir(parts)) if name.isdigit()]
+
+
+def _recover_npz_parts(parts):
+    """
+    Read the chunks that an unfinished NpzSink left in its spill directory.
+
+    Parameters:
+        parts (str): Spill directory '<path>.parts'.
+
+    Returns:
+        tuple: The columns as a dict of numpy arrays and the metadata dict, as load_results().
+    """
+    chunks = [{name[:-len('.npy')]: np.load(os.path.join(directory, name))
+               for name in sorted(os.listdir(directory))} for directory in _chunk_directories(parts)]
+    columns = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in (chunks[0] if chunks else ())}
+    metadata = json.loads(str(np.load(os.path.join(parts, METADATA_KEY + '.npy'))[()]))
+    return columns, metadata
+
+
+def _mmap_zip_member(path, info):
+    """
+    Memory-map an uncompressed .npy member of a ZIP (NPZ) archive in place.
+
+    An NPZ file is a ZIP archive of .npy files. A member that is stored without
+    compression is a plain .npy image inside the archive, so it can be mapped once the
+    offset of its data is known: the local file header at info.header_offset is followed
+    by the file name, an extra field and then the .npy header.
+
+    Parameters:
+        path (str or os.PathLike): NPZ file.
+        info (zipfile.ZipInfo): The member.
+
+    Returns:
+        numpy.ndarray: Read-only numpy.memmap of the member (a plain array if it is empty).
+    """
+    with open(path, 'rb') as file:
+        file.seek(info.header_offset)
+        fields = _ZIP_LOCAL_HEADER.unpack(file.read(_ZIP_LOCAL_HEADER.size))
+        file.seek(fields[-2] + fields[-1], os.SEEK_CUR)
+        shape, fortran_order, dtype = _read_npy_header(file)
+        offset = file.tell()
+    if np.prod(shape) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape, order='F' if fortran_order else 'C')
+
+
+def load_results(path, format=None, mmap=True):
+    """
+    Read a results file written by a ResultSink.
+
+    All formats return the same layout: one numpy array per fixed-width column, and for
+    every ragged column its concatenated values under the column name plus offsets under
+    '<name>_offsets', so that the entries of row i are values[offsets[i]:offsets[i + 1]]
+    (as in parameter_sweep.run_sweep()).
+
+    With mmap=True the data is memory-mapped where the format allows it, so only the
+    pages that are accessed are read: uncompressed NPZ columns are mapped directly,
+    and Parquet files are read through a memory map (compressed pages still have to
+    be decompressed). HDF5 columns are always read into memory.
+
+    An NPZ file whose sink was not closed, because the run crashed or was killed, is
+    recovered from the chunks in its spill directory '<path>.parts' (read into memory).
+
+    Parameters:
+        path (str or os.PathLike): Results file.
+        format (str, optional): Format; inferred from the extension if omitted.
+        mmap (bool): Whether to memory-map the data where possible.
+
+    Returns:
+        tuple: The columns as a dict of numpy arrays and the metadata dict.
+    """
+    format = sink_format(path, format)
+    columns = {}
+    if format == 'npz':
+        parts = os.fspath(path) + '.parts'
+        if os.path.isdir(parts):
+            return _recover_npz_parts(parts)
+        metadata = {}
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                name = info.filename[:-len('.npy')]
+                if mmap and info.compress_type == zipfile.ZIP_STORED:
+                    array = _mmap_zip_member(path, info)
+                else:
+                    with archive.open(info) as member:
+                        array = np.lib.format.read_array(member)
+                if name == METADATA_KEY:
+                    metadata = json.loads(str(array[()]))
+                else:
+                    columns[name] = array
+        return columns, metadata
+
+    if format == 'parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pq.read_table(path, memory_map=mmap)
+        stored = json.loads(table.schema.metadata[METADATA_KEY.encode()]) if table.schema.metadata else {}
+        shapes = stored.get('shapes', {})
+        for name in table.column_names:
+            column = table.column(name).combine_chunks()
+            if pa.types.is_large_list(column.type):
+                columns[name] = column.values.to_numpy(zero_copy_only=False)
+                columns[name + '_offsets'] = column.offsets.to_numpy()
+            elif pa.types.is_fixed_size_list(column.type):
+                values = column.flatten().to_numpy(zero_copy_only=False)
+                columns[name] = values.reshape((len(column),) + tuple(shapes[name]))
+            else:
+                columns[name] = column.to_numpy(zero_copy_only=False)
+        return columns, stored.get('metadata', {})
+
+    import h5py
+    with h5py.File(path, 'r') as file:
+        for name, dataset in file.items():
+            columns[name] = dataset[()]
+        metadata = json.loads(file.attrs.get(METADATA_KEY, '{}'))
+    return columns, metadata
+#endregion
+
+#region Classes
+class ResultSink(abc.ABC):
+    """
+    Base class of the writers that store results as compressed columnar files.
+
+    Results are appended in chunks of rows with append(), for example one chunk per
+    finished batch of a parameter sweep, so a run never has to hold all its results
+    in memory, and the file can be read back with load_results() (memory-mapped where
+    possible) instead of parsing printed text.
+
+    Each keyword of append() is a column:
+    - an array of shape (k, ...) is a fixed-width column with one entry per row, e.g. a
+      parameter value or a PDF sampled on a fixed number of points;
+    - a list of k 1-D arrays is a ragged column whose rows have different lengths, e.g.
+      the roots of each parameter tuple or solution vectors of different sizes.
+    Every chunk must have the same columns; later chunks are cast to the dtypes of the
+    first one.
+
+    Parameters:
+        path (str or os.PathLike): Results file; an existing file is replaced.
+        metadata (dict, optional): JSON-serializable description of the run.
+        compress (bool): Whether to compress the columns.
+    """
+
+    def __init__(self, path, metadata=None, compress=True):
+        self.path = os.fspath(path)
+        self.metadata = dict(metadata or {})
+        self.compress = compress
+        self.num_rows = 0
+        self.closed = False
+        self._schema = None
+        self._dtypes = None
+        self._offset_totals = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        # Close even after an error so that the chunks written so far are kept
+        self.close()
+
+    @timed('serialize.append')
+    def append(self, **columns):
+        """
+        Append a chunk of rows.
+
+        Parameters:
+            **columns: Column name -> array of shape (k, ...) or list of k 1-D arrays.
+        """
+        if self.closed:
+            raise ValueError("Cannot append to a closed sink")
+        chunk, num_rows = _normalize_chunk(columns, self._schema, self._dtypes)
+        schema = {name: (column[0], column[1].shape[1:] if column[0] == 'fixed' else ())
+                  for name, column in chunk.items()}
+        if self._schema is None:
+            self._schema = schema
+            self._dtypes = {name: column[1].dtype for name, column in chunk.items()}
+        elif schema != self._schema:
+            raise ValueError("Every chunk must have the same columns, kinds and row shapes as the first one")
+        else:
+            chunk = {name: (column[0], column[1].astype(self._dtypes[name], casting='same_kind', copy=False))
+                     + column[2:] for name, column in chunk.items()}
+        self._write(chunk)
+        self.num_rows += num_rows
+
+    def _stored_arrays(self, chunk):
+        """
+        Convert a normalized chunk to the flat arrays stored by NPZ and HDF5.
+
+        A ragged column becomes its values plus running offsets; the offsets of the
+        first chunk start with 0 and later chunks continue from the previous total.
+
+        Returns:
+            dict: Stored name -> array of the chunk.
+        """
+        arrays = {}
+        for name, column in chunk.items():
+            if column[0] == 'fixed':
+                arrays[name] = column[1]
+                continue
+            values, lengths = column[1], column[2]
+            total = self._offset_totals.get(name)
+            offsets = (0 if total is None else total) + np.cumsum(lengths)
+            if total is None:
+                offsets = np.concatenate(([0], offsets))
+            self._offset_totals[name] = int(offsets[-1]) if offsets.size else (total or 0)
+            arrays[name] = values
+            arrays[name + '_offsets'] = offsets
+        return arrays
+
+    @abc.abstractmethod
+    def _write(self, chunk):
+        """
+        Store a normalized chunk; implemented by every format.
+
+        Parameters:
+            chunk (dict): Column name -> ('fixed', array) or ('ragged', values, lengths).
+        """
+
+    def close(self):
+        """
+        Finish the file. Further appends are not possible.
+        """
+        self.closed = True
+
+
+class NpzSink(ResultSink):
+    """
+    Result sink writing a NumPy .npz archive with one .npy member per column.
+
+    While the sink is open, each chunk is saved as one .npy file per column in a
+    numbered subdirectory of the spill directory '<path>.parts'; close() then streams
+    every column into the archive behind a single .npy header, so the chunks never
+    have to be in memory together. A chunk directory is renamed into place once all
+    its columns are written, so if the run dies before close(), load_results() can
+    still recover every complete chunk from the spill directory. The metadata is
+    stored as a JSON string in the member '__metadata__'.
+
+    With compress=True the members are deflated, which makes the archive smaller but
+    means it has to be decompressed to be read; with compress=False the members are
+    stored as they are and load_results() memory-maps them.
+    """
+
+    def __init__(self, path, metadata=None, compress=True):
+        super().__init__(path, metadata, compress)
+        self._parts = self.path + '.parts'
+        shutil.rmtree(self._parts, ignore_errors=True)
+        os.makedirs(self._parts)
+        np.save(os.path.join(self._parts, METADATA_KEY + '.npy'), np.array(json.dumps(self.metadata)))
+        self._layouts = {}
+        self._num_chunks = 0
+
+    def _write(self, chunk):
+        directory = os.path.join(self._parts, f'{self._num_chunks:08d}')
+        temporary = directory + '.tmp'
+        os.makedirs(temporary)
+        for name, array in self._stored_arrays(chunk).items():
+            array = np.ascontiguousarray(array)
+            rows, dtype, row_shape = self._layouts.get(name, (0, array.dtype, array.shape[1:]))
+            self._layouts[name] = (rows + len(array), dtype, row_shape)
+            np.save(os.path.join(temporary, name + '.npy'), array)
+        os.replace(temporary, directory)
+        self._num_chunks += 1
+
+    @timed('serialize.close')
+    def close(self):
+        if self.closed:
+            return
+        temporary = self.path + '.tmp'
+        compression = zipfile.ZIP_DEFLATED if self.compress else zipfile.ZIP_STORED
+        with zipfile.ZipFile(temporary, 'w', compression=compression, allowZip64=True) as archive:
+            for name, (rows, dtype, row_shape) in self._layouts.items():
+                header = {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False,
+                          'shape': (rows,) + row_shape}
+                with archive.open(name + '.npy', 'w', force_zip64=True) as member:
+                    np.lib.format.write_array_header_1_0(member, header)
+                    for directory in _chunk_directories(self._parts):
+                        with open(os.path.join(directory, name + '.npy'), 'rb') as part:
+                            _read_npy_header(part)
+                            shutil.copyfileobj(part, member)
+            with archive.open(METADATA_KEY + '.npy', 'w') as member:
+                np.lib.format.write_array(member, np.array(json.dumps(self.metadata)))
+        os.replace(temporary, self.path)
+        shutil.rmtree(self._parts, ignore_errors=True)
+        super().close()
+
+
+class ParquetSink(ResultSink):
+    """
+    Result sink writing an Apache Parquet file through pyarrow (an optional dependency).
+
+    Every append() becomes one row group, so the file grows chunk by chunk. Ragged
+    columns are stored as list columns and fixed-width columns with more than one
+    dimension as fixed-size lists. With compress=True the pages are compressed with
+    zstd. The metadata is kept in the schema under '__metadata__', so changes to
+    self.metadata after the first append() are not stored.
+    """
+
+    def __init__(self, path, metadata=None, compress=True):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Writing Parquet files requires pyarrow") from None
+        super().__init__(path, metadata, compress)
+        self._pa, self._pq = pyarrow, pyarrow.parquet
+        self._writer = None
+
+    def _write(self, chunk):
+        pa = self._pa
+        arrays, shapes = {}, {}
+        for name, column in chunk.items():
+            if column[0] == 'ragged':
+                offsets = np.concatenate(([0], np.cumsum(column[2])))
+                arrays[name] = pa.LargeListArray.from_arrays(pa.array(offsets), pa.array(column[1]))
+            elif column[1].ndim > 1:
+                shapes[name] = column[1].shape[1:]
+                width = int(np.prod(shapes[name]))
+                arrays[name] = pa.FixedSizeListArray.from_arrays(pa.array(column[1].ravel()), width)
+            else:
+                arrays[name] = pa.array(column[1])
+        table = pa.table(arrays)
+        if self._writer is None:
+            stored = json.dumps({'metadata': self.metadata, 'shapes': shapes})
+            self._schema_out = table.schema.with_metadata({METADATA_KEY: stored})
+            self._writer = self._pq.ParquetWriter(self.path, self._schema_out,
+                                                  compression='zstd' if self.compress else 'none')
+        self._writer.write_table(table.cast(self._schema_out))
+
+    @timed('serialize.close')
+    def close(self):
+        if self.closed:
+            return
+        if self._writer is None:
+            stored = json.dumps({'metadata': self.metadata, 'shapes': {}})
+            self._pq.write_table(self._pa.table({}).replace_schema_metadata({METADATA_KEY: stored}), self.path)
+        else:
+            self._writer.close()
+        super().close()
+
+
+class Hdf5Sink(ResultSink):
+    """
+    Result sink writing an HDF5 file through h5py (an optional dependency).
+
+    Every stored column is a chunked dataset that is resized on each append(); with
+    compress=True the chunks are gzip-compressed. The metadata is kept as a JSON string
+    in the file attribute '__metadata__', written by close().
+    """
+
+    def __init__(self, path, metadata=None, compress=True):
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError("Writing HDF5 files requires h5py") from None
+        super().__init__(path, metadata, compress)
+        self._file = h5py.File(self.path, 'w')
+
+    def _write(self, chunk):
+        for name, array in self._stored_arrays(chunk).items():
+            if name not in self._file:
+                self._file.create_dataset(name, shape=(0,) + array.shape[1:], maxshape=(None,) + array.shape[1:],
+                                          dtype=array.dtype, chunks=True,
+                                          compression='gzip' if self.compress else None)
+            dataset = self._file[name]
+            start = dataset.shape[0]
+            dataset.resize(start + len(array), axis=0)
+            dataset[start:] = array
+
+    @timed('serialize.close')
+    def close(self):
+        if self.closed:
+            return
+        self._file.attrs[METADATA_KEY] = json.dumps(self.metadata)
+        self._file.close()
+        super().close()
+#endregion
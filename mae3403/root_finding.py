@@ -0,0 +1,173 @@
+#region Import
+import numpy as np
+from .instrumentation import count
+#endregion
+
+#region Functions
+def find_sign_change_brackets(x_values, f_values):
+    """
+    Locate the grid intervals over which a sampled function changes sign.
+
+    Given a function sampled on an increasing grid, every pair of neighbouring
+    samples whose values have strictly opposite signs encloses at least one root
+    (by the intermediate value theorem, for a continuous function). The test is
+    done for the whole grid at once with array operations instead of a Python loop.
+    Samples that are exactly zero are reported separately since they are already
+    roots and do not need to be refined.
+
+    Parameters:
+        x_values (numpy.ndarray): Increasing grid of x values of shape (n,).
+        f_values (numpy.ndarray): Function values sampled on the grid, shape (n,).
+
+    Returns:
+        tuple: Tuple containing the following elements:
+            - numpy array: left end points of the sign-change brackets
+            - numpy array: right end points of the sign-change brackets
+            - numpy array: grid points at which the function is exactly zero
+    """
+    x_values = np.asarray(x_values, dtype=float)
+    f_values = np.asarray(f_values, dtype=float)
+    # Non-finite samples cannot be trusted to bracket a root
+    finite = np.isfinite(f_values)
+    exact_roots = x_values[finite & (f_values == 0)]
+    sign_change = (f_values[:-1] * f_values[1:] < 0) & finite[:-1] & finite[1:]
+    index = np.nonzero(sign_change)[0]
+    return x_values[index], x_values[index + 1], exact_roots
+
+
+def merge_roots(roots, tol=1e-8):
+    """
+    Sort a collection of roots and merge those that lie within a tolerance of each other.
+
+    Roots found from neighbouring brackets, or reported both as an exact grid zero and
+    as a refined bracket end point, can differ only by round-off. Comparing them with
+    set() keeps every one of those near-duplicates, so instead the roots are sorted and
+    any run of roots closer than tol to its neighbour is replaced by the run's mean.
+
+    Parameters:
+        roots (array_like): Root locations in any order.
+        tol (float): Largest gap between two roots that are considered the same root.
+
+    Returns:
+        numpy.ndarray: Sorted array of distinct roots.
+    """
+    roots = np.sort(np.asarray(roots, dtype=float).ravel())
+    if roots.size == 0:
+        return roots
+    # Start a new group wherever the gap to the previous root exceeds the tolerance
+    new_group = np.concatenate(([True], np.diff(roots) > tol))
+    group = np.cumsum(new_group) - 1
+    return np.bincount(group, weights=roots) / np.bincount(group)
+
+
+def find_roots_bracketed(func, lower, upper, num_points=1000, xtol=1e-12, merge_tol=1e-8):
+    """
+    Find all roots of a function on an interval with a bracket-and-refine search.
+
+    The function is evaluated once over a uniform grid of num_points values as a
+    single vectorized call. Sign changes between neighbouring grid values give
+    brackets that each contain a root, and every bracket is then refined with
+    Brent's method (scipy.optimize.brentq), which is guaranteed to converge inside
+    the bracket. Finally the roots are merged within merge_tol so that each root is
+    reported once.
+
+    Because only sign changes are detected, roots of even multiplicity (where the
+    function touches zero without crossing it) and pairs of roots closer together
+    than the grid spacing can be missed; increase num_points if that is a concern.
+
+    Parameters:
+        func (callable): Function of one variable that accepts numpy arrays.
+        lower (float): Lower end of the search interval.
+        upper (float): Upper end of the search interval.
+        num_points (int): Number of grid points used to search for sign changes.
+        xtol (float): Absolute tolerance passed to brentq for each root.
+        merge_tol (float): Tolerance used to merge duplicate roots.
+
+    Returns:
+        numpy.ndarray: Sorted array of the distinct roots found in [lower, upper].
+    """
+    x_values = np.linspace(lower, upper, num_points)
+    f_values = func(x_values)
+    left, right, exact_roots = find_sign_change_brackets(x_values, f_values)
+    # Imported on first use to keep scipy.optimize out of the package import time
+    from scipy.optimize import brentq
+    results = [brentq(func, a, b, xtol=xtol, full_output=True) for a, b in zip(left, right)]
+    refined = [root for root, _ in results]
+    count('bracket_search.function_evaluations', len(x_values))
+    count('brentq.function_evaluations', sum(result.function_calls for _, result in results))
+    count('brentq.iterations', sum(result.iterations for _, result in results))
+    return merge_roots(np.concatenate((exact_roots, refined)), merge_tol)
+
+
+def batch_newton(func, x0, fprime=None, args=(), tol=1e-10, maxiter=50):
+    """
+    Solve many scalar root-finding problems at once with a vectorized Newton iteration.
+
+    All starting points in x0 are iterated together with numpy array operations, so
+    the Python overhead is paid once per iteration rather than once per starting
+    point. Each starting point is an independent "lane" of the computation: a
+    convergence mask keeps track of which lanes are still active, and only those
+    lanes are evaluated and updated on the next iteration. Extra arguments in args
+    are broadcast against x0, which allows every lane to solve a different parameter
+    variant of the same equation.
+
+    When fprime is given, the Newton step x_new = x - f(x) / f'(x) uses the analytic
+    derivative. Otherwise the derivative is approximated with a forward finite
+    difference using a step of sqrt(machine epsilon) scaled by |x|. A lane is
+    converged when its Newton step drops below tol * (1 + |x|) or its residual is
+    exactly zero, and it is marked as failed if the derivative vanishes or the step
+    becomes non-finite.
+
+    Parameters:
+        func (callable): Function f(x, *args) that accepts numpy arrays elementwise.
+        x0 (array_like): Starting points, one per lane.
+        fprime (callable, optional): Analytic derivative f'(x, *args). If None, a
+            finite-difference derivative is used.
+        args (tuple): Extra arguments for func and fprime, each broadcastable to x0.
+        tol (float): Relative step tolerance used to declare convergence.
+        maxiter (int): Maximum number of Newton iterations.
+
+    Returns:
+        tuple: Tuple containing the following elements:
+            - numpy array: final iterate for every lane, same shape as x0
+            - numpy array: boolean mask of the lanes that converged
+    """
+    x = np.array(x0, dtype=float, ndmin=1)
+    args = tuple(np.broadcast_to(np.asarray(arg, dtype=float), x.shape) for arg in args)
+    active = np.ones(x.shape, dtype=bool)
+    converged = np.zeros(x.shape, dtype=bool)
+    fd_step = np.sqrt(np.finfo(float).eps)
+    iterations = evaluations = 0
+
+    for _ in range(maxiter):
+        index = np.nonzero(active)
+        if index[0].size == 0:
+            break
+        iterations += 1
+        evaluations += (1 if fprime is not None else 2) * index[0].size
+        x_lane = x[index]
+        lane_args = tuple(arg[index] for arg in args)
+
+        f = func(x_lane, *lane_args)
+        if fprime is None:
+            h = fd_step * np.maximum(1.0, np.abs(x_lane))
+            df = (func(x_lane + h, *lane_args) - f) / h
+        else:
+            df = fprime(x_lane, *lane_args)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.where(f == 0, 0.0, f / df)
+        failed = ~np.isfinite(step)
+        step[failed] = 0.0
+        x_lane = x_lane - step
+        x[index] = x_lane
+
+        # Finished lanes (converged or failed) stop updating from here on
+        done = ~failed & (np.abs(step) <= tol * (1.0 + np.abs(x_lane)))
+        converged[index] = done
+        active[index] = ~(done | failed)
+
+    count('newton.iterations', iterations)
+    count('newton.function_evaluations', evaluations)
+    return x, converged
+#endregion
@@ -0,0 +1,46 @@
+import numpy as np
+
+from mae3403.adaptive_grid import cdf_spaced_grid, generate_data_adaptive, refine_grid
+from mae3403.normal_kernel import norm_cdf, norm_pdf
+
+
+def test_interpolation_error_is_within_tolerance():
+    func = lambda x: np.stack((norm_pdf(x, 0.0, 1.0), norm_cdf(x, 0.0, 1.0)))
+    x, y = refine_grid(func, -5.0, 5.0, tol=1e-3)
+    assert np.all(np.diff(x) > 0) and x[0] == -5.0 and x[-1] == 5.0
+    np.testing.assert_array_equal(y, func(x))
+    dense = np.linspace(-5.0, 5.0, 20001)
+    for curve, exact in zip(y, func(dense)):
+        assert np.max(np.abs(np.interp(dense, x, curve) - exact)) <= 1e-3 * np.ptp(exact)
+
+
+def test_converged_intervals_are_not_evaluated_again():
+    evaluations = []
+
+    def func(x):
+        evaluations.append(np.size(x))
+        return norm_pdf(x, 0.0, 1.0)
+
+    x, _ = refine_grid(func, -5.0, 5.0)
+    # The initial grid, each kept midpoint, and one final check of the last new intervals
+    assert sum(evaluations) < 2 * x.size
+    assert evaluations[1] == 16 and all(b <= 2 * a for a, b in zip(evaluations[1:], evaluations[2:]))
+
+
+def test_max_points_limits_the_grid():
+    x, _ = refine_grid(np.sin, 0.0, 20.0, tol=1e-9, max_points=200)
+    assert x.size <= 200
+
+
+def test_cdf_spaced_grid_holds_equal_probability_mass():
+    x = cdf_spaced_grid(175.0, 3.0, (160.0, 190.0), num_points=51)
+    assert x[0] == 160.0 and x[-1] == 190.0
+    mass = np.diff(norm_cdf(x, 175.0, 3.0))
+    np.testing.assert_allclose(mass, mass[0], rtol=1e-8)
+
+
+def test_adaptive_data_for_several_distributions():
+    x_values, pdfs, cdfs = generate_data_adaptive([0.0, 175.0], [1.0, 3.0], [(-5.0, 5.0), (160.0, 190.0)])
+    for x, pdf, cdf, mean, std in zip(x_values, pdfs, cdfs, [0.0, 175.0], [1.0, 3.0]):
+        np.testing.assert_allclose(pdf, norm_pdf(x, mean, std))
+        np.testing.assert_allclose(cdf, norm_cdf(x, mean, std))
@@ -0,0 +1,26 @@
+import json
+
+from mae3403.batch import run_batch, run_job
+
+
+def _reject_constant(token):
+    raise ValueError(f"Non-standard JSON constant {token}")
+
+
+def test_non_finite_solution_is_an_error():
+    outcome = run_job({'id': 1, 'type': 'matrix', 'matrix': [[1e-300, 0.0], [0.0, 1.0]], 'vector': [1e300, 1.0]})
+    assert outcome['status'] == 'error'
+    assert 'result' not in outcome
+
+
+def test_output_is_valid_json(tmp_path):
+    manifest = tmp_path / 'jobs.jsonl'
+    jobs = [{'type': 'matrix', 'matrix': [[1e-300, 0.0], [0.0, 1.0]], 'vector': [1e300, 1.0]},
+            {'type': 'matrix', 'matrix': [[1.0, 2.0], [2.0, 4.0]], 'vector': [1.0, 2.0]},
+            {'type': 'matrix', 'matrix': [[2.0, 0.0], [0.0, 4.0]], 'vector': [2.0, 4.0]}]
+    manifest.write_text(''.join(json.dumps(job) + '\n' for job in jobs))
+    output = tmp_path / 'results.jsonl'
+    summary = run_batch(manifest, output, processes=1)
+    assert summary == {'ok': 1, 'error': 2, 'skipped': 0}
+    outcomes = [json.loads(line, parse_constant=_reject_constant) for line in output.read_text().splitlines()]
+    assert [outcome['status'] for outcome in outcomes] == ['error', 'error', 'ok']
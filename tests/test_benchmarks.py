@@ -0,0 +1,17 @@
+import benchmarks
+
+
+def test_every_benchmark_case_runs_and_reports_throughput():
+    report = benchmarks.run_benchmarks(benchmarks.QUICK_PARAMETERS, repeats=1, min_time=0.0)
+    cases = [case for case, _, _ in benchmarks.iter_cases(benchmarks.QUICK_PARAMETERS)]
+    assert list(report['results']) == cases
+    assert set(benchmarks.QUICK_PARAMETERS) <= set(benchmarks.BENCHMARKS)
+    assert all(result['throughput'] > 0 for result in report['results'].values())
+
+
+def test_compare_to_baseline_flags_only_slowdowns_above_threshold():
+    baseline = {'results': {'a': {'median': 1.0}, 'b': {'median': 1.0}, 'gone': {'median': 1.0}}}
+    report = {'results': {'a': {'median': 1.2}, 'b': {'median': 2.0}, 'new': {'median': 5.0}}}
+    comparisons, regressions = benchmarks.compare_to_baseline(report, baseline, threshold=0.25)
+    assert [item[0] for item in comparisons] == ['b', 'a']
+    assert [item[0] for item in regressions] == ['b']
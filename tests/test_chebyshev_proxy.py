@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from mae3403.chebyshev_proxy import ChebyshevProxy
+from mae3403.equations import (find_intersections, find_intersections_chebyshev, intersection_derivative,
+                               intersection_function)
+
+
+def test_proxy_approximates_the_function_to_machine_precision():
+    proxy = ChebyshevProxy(intersection_function, -5.0, 5.0)
+    x = np.linspace(-5.0, 5.0, 2001)
+    assert proxy.converged and proxy.degree < 100
+    np.testing.assert_allclose(proxy(x), intersection_function(x), atol=1e-11)
+    np.testing.assert_allclose(proxy.derivative()(x), intersection_derivative(x), atol=1e-9)
+
+
+def test_integral():
+    proxy = ChebyshevProxy(np.cos, 0.0, np.pi)
+    np.testing.assert_allclose(proxy.integral(), 0.0, atol=1e-14)
+    np.testing.assert_allclose(proxy.integral(0.0, np.pi / 2), 1.0, rtol=1e-14)
+
+
+def test_all_roots_match_the_bracketed_search():
+    roots, proxy = find_intersections_chebyshev()
+    np.testing.assert_allclose(roots, find_intersections(), atol=1e-10)
+    np.testing.assert_allclose(intersection_function(roots), 0.0, atol=1e-10)
+    assert proxy.num_evaluations < 300
+
+
+def test_roots_of_a_polynomial_and_a_function_without_roots():
+    roots = ChebyshevProxy(lambda x: (x + 0.5) * (x - 0.25) * (x - 0.9), -1.0, 1.0).roots()
+    np.testing.assert_allclose(roots, [-0.5, 0.25, 0.9], atol=1e-14)
+    assert ChebyshevProxy(lambda x: 2.0 + np.sin(x), -3.0, 3.0).roots().size == 0
+
+
+def test_non_finite_function_is_rejected():
+    with np.errstate(divide='ignore', invalid='ignore'), pytest.raises(ValueError):
+        ChebyshevProxy(lambda x: 1.0 / x, -1.0, 1.0)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from mae3403.chunked_evaluation import evaluate_chunked, iter_evaluate_chunks
+from mae3403.normal_kernel import norm_cdf, norm_pdf
+
+X = np.random.default_rng(0).normal(175.0, 3.0, 10_001)
+
+
+@pytest.mark.parametrize('threads', [1, 3])
+def test_chunked_results_match_a_single_evaluation(tmp_path, threads):
+    np.save(tmp_path / 'x.npy', X)
+    pdf, cdf = evaluate_chunked(tmp_path / 'x.npy', 175.0, 3.0, tmp_path / 'pdf.npy', tmp_path / 'cdf.npy',
+                                chunk_size=1000, threads=threads)
+    assert isinstance(pdf, np.memmap) and isinstance(cdf, np.memmap)
+    np.testing.assert_array_equal(pdf, norm_pdf(X, 175.0, 3.0))
+    np.testing.assert_array_equal(cdf, norm_cdf(X, 175.0, 3.0))
+    np.testing.assert_array_equal(np.load(tmp_path / 'cdf.npy'), cdf)
+
+
+def test_float32_outputs(tmp_path):
+    pdf, cdf = evaluate_chunked(X, 175.0, 3.0, tmp_path / 'pdf.npy', tmp_path / 'cdf.npy', chunk_size=4096,
+                                dtype=np.float32)
+    assert pdf.dtype == cdf.dtype == np.float32
+    np.testing.assert_allclose(cdf, norm_cdf(X, 175.0, 3.0), rtol=1e-4, atol=1e-7)
+
+
+def test_input_must_be_one_dimensional(tmp_path):
+    with pytest.raises(ValueError):
+        evaluate_chunked(X.reshape(1, -1), 175.0, 3.0, tmp_path / 'pdf.npy', tmp_path / 'cdf.npy')
+
+
+def test_streamed_chunks():
+    chunks = np.array_split(X, 7)
+    results = list(iter_evaluate_chunks(iter(chunks), 175.0, 3.0))
+    assert len(results) == 7
+    np.testing.assert_array_equal(np.concatenate([pdf for pdf, _ in results]), norm_pdf(X, 175.0, 3.0))
+    np.testing.assert_array_equal(np.concatenate([cdf for _, cdf in results]), norm_cdf(X, 175.0, 3.0))
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from mae3403.continuation import track_roots
+from mae3403.equations import (DEFAULT_PARAMETERS, PARAMETER_NAMES, find_intersections, intersection_function,
+                               intersection_parameter_derivative, track_intersections)
+
+
+@pytest.mark.parametrize('parameter', ['a', 'b', 'c', 'd'])
+def test_parameter_derivative_matches_central_difference(parameter):
+    x = np.linspace(0.1, 4.0, 9)
+    index = PARAMETER_NAMES.index(parameter)
+    h = 1e-6
+    above, below = list(DEFAULT_PARAMETERS), list(DEFAULT_PARAMETERS)
+    above[index] += h
+    below[index] -= h
+    expected = (intersection_function(x, *above) - intersection_function(x, *below)) / (2 * h)
+    np.testing.assert_allclose(intersection_parameter_derivative(x, parameter, *DEFAULT_PARAMETERS), expected,
+                               atol=1e-6)
+
+
+def test_tracked_intersections_match_global_search():
+    values = np.linspace(0.5, 2.0, 31)
+    result = track_intersections('a', values)
+    for row, a in zip(result['roots'], values):
+        expected = find_intersections((a,) + DEFAULT_PARAMETERS[1:])
+        np.testing.assert_allclose(np.sort(row[np.isfinite(row)]), expected, atol=1e-8)
+
+
+@pytest.mark.parametrize('max_halvings', [0, 6])
+def test_branches_end_at_a_fold(max_halvings):
+    func = lambda x, p: x ** 2 - p
+    fprime = lambda x, p: 2 * x
+    values = np.linspace(1.0, -1.0, 21)
+    result = track_roots(func, fprime, [-1.0, 1.0], values, max_halvings=max_halvings)
+    assert np.isnan(result['roots'][-1]).all()
+    np.testing.assert_allclose(result['roots'][:10], np.sqrt(values[:10, None]) * [-1, 1], atol=1e-8)
+    assert len(result['folds']) == 1 and result['folds'][0]['kind'] == 'disappear'
+    np.testing.assert_allclose([result['folds'][0]['x'], result['folds'][0]['parameter']], 0.0, atol=1e-6)
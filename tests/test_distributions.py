@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from mae3403.distributions import generate_data, generate_data_batch
+
+
+def test_batch_matches_scipy_for_every_distribution():
+    means, stds, ranges = [0.0, 175.0, -3.0], [1.0, 3.0, 0.5], [(-5.0, 5.0), (160.0, 190.0), (-6.0, 0.0)]
+    x, pdf, cdf = generate_data_batch(means, stds, ranges, num_points=101)
+    assert x.shape == pdf.shape == cdf.shape == (3, 101)
+    for row, (mean, std, (lower, upper)) in enumerate(zip(means, stds, ranges)):
+        np.testing.assert_allclose(x[row], np.linspace(lower, upper, 101))
+        np.testing.assert_allclose(pdf[row], stats.norm.pdf(x[row], mean, std), rtol=1e-13)
+        np.testing.assert_allclose(cdf[row], stats.norm.cdf(x[row], mean, std), rtol=1e-13)
+
+
+def test_generate_data_keeps_the_original_layout():
+    x1, x2, pdf1, pdf2, cdf1, cdf2 = generate_data()
+    np.testing.assert_allclose(x1, np.linspace(-5, 5, 1000))
+    np.testing.assert_allclose(x2, np.linspace(160, 190, 1000))
+    np.testing.assert_allclose(pdf2, stats.norm.pdf(x2, 175, 3), rtol=1e-13)
+    np.testing.assert_allclose(cdf1, stats.norm.cdf(x1), rtol=1e-13)
+
+
+def test_invalid_batches_are_rejected():
+    with pytest.raises(ValueError):
+        generate_data_batch([0.0, 1.0], [1.0], [(-1.0, 1.0), (0.0, 2.0)])
+    with pytest.raises(ValueError):
+        generate_data_batch([0.0], [0.0], [(-1.0, 1.0)])
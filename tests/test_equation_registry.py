@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from mae3403.equation_registry import CompiledEquation, EquationRegistry, default_registry
+from mae3403.equations import equation1, equation1_derivative, equation2, equation2_derivative
+
+
+def test_compiled_kernels_match_the_hand_written_equations():
+    x = np.concatenate((np.linspace(-5.0, 5.0, 201), [0.0]))
+    np.testing.assert_allclose(default_registry['equation1'](x), equation1(x), rtol=1e-14, atol=1e-14)
+    np.testing.assert_allclose(default_registry['equation2'](x), equation2(x), rtol=1e-14, atol=1e-14)
+    np.testing.assert_allclose(default_registry['equation1'].derivative(x), equation1_derivative(x),
+                               rtol=1e-14, atol=1e-14)
+    np.testing.assert_allclose(default_registry['equation2'].derivative(x), equation2_derivative(x),
+                               rtol=1e-14, atol=1e-14)
+    assert default_registry['equation2'].derivative(0.0) == 0.0
+    assert default_registry['equation2'].derivative(0.0, e=1.0) == 1.0
+
+
+def test_parameters_may_shadow_sympy_names():
+    assert CompiledEquation('N*x - 1', parameters={'N': 2.0})(1.0) == 1.0
+    assert CompiledEquation('beta*x + gamma', parameters=['beta', 'gamma'])(2.0, 3.0, 1.0) == 7.0
+
+
+def test_undeclared_parameters_are_rejected():
+    with pytest.raises(ValueError, match='undeclared'):
+        CompiledEquation('a*x + b', parameters=['a'])
+
+
+def test_registered_pair_intersections():
+    registry = EquationRegistry()
+    registry.register('line', 'a*x', parameters={'a': 1.0})
+    registry.register('parabola', 'x**2 - 2')
+    np.testing.assert_allclose(registry.find_intersections('line', 'parabola'), [-1.0, 2.0], atol=1e-10)
+    roots, converged = registry.find_roots('parabola', [1.0, -1.0])
+    assert converged.all()
+    np.testing.assert_allclose(roots, [np.sqrt(2), -np.sqrt(2)])
@@ -0,0 +1,53 @@
+import numpy as np
+
+from mae3403.equations import equation1
+from mae3403.evaluation_cache import MemoizedFunction, memoize
+
+
+def test_values_match_and_repeats_hit_the_cache():
+    memoized = MemoizedFunction(equation1)
+    x = np.linspace(-5.0, 5.0, 101)
+    np.testing.assert_array_equal(memoized(x), equation1(x))
+    assert (memoized.hits, memoized.misses) == (0, 101)
+    np.testing.assert_array_equal(memoized(x[::-1]), equation1(x[::-1]))
+    assert (memoized.hits, memoized.misses) == (101, 101)
+
+
+def test_scalar_input_and_extra_arguments_are_part_of_the_key():
+    memoized = MemoizedFunction(equation1)
+    assert memoized(1.0) == equation1(1.0)
+    assert memoized(1.0, 2.0) == equation1(1.0, 2.0)
+    assert memoized.misses == 2
+
+
+def test_least_recently_used_value_is_evicted():
+    calls = []
+
+    @memoize(maxsize=2, vectorized=False)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    square(1.0)
+    square(2.0)
+    square(1.0)
+    square(3.0)
+    assert len(square) == 2
+    square(1.0)
+    square(2.0)
+    assert calls == [1.0, 2.0, 3.0, 2.0]
+
+
+def test_large_inputs_are_not_merged():
+    memoized = MemoizedFunction(lambda x: x)
+    x = np.array([1e300, 2e300, -1e300, 1e300])
+    np.testing.assert_array_equal(memoized(x), x)
+    assert memoized.misses == 3
+
+
+def test_non_finite_inputs_pass_through_and_hit_the_cache():
+    memoized = MemoizedFunction(lambda x: np.where(np.isnan(x), -1.0, x))
+    x = np.array([np.inf, -np.inf, np.nan, 0.0])
+    np.testing.assert_array_equal(memoized(x), [np.inf, -np.inf, -1.0, 0.0])
+    np.testing.assert_array_equal(memoized(x), [np.inf, -np.inf, -1.0, 0.0])
+    assert (memoized.hits, memoized.misses) == (4, 4)
@@ -0,0 +1,40 @@
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from mae3403.distributions import generate_data_batch
+from mae3403.figures import DistributionFigure
+
+
+def _title_pixels(figure):
+    canvas = figure.fig.canvas
+    pixels = np.asarray(canvas.buffer_rgba())
+    renderer = canvas.get_renderer()
+    crops = []
+    for ax in figure.fig.axes:
+        box = ax.title.get_window_extent(renderer)
+        top, bottom = pixels.shape[0] - int(np.ceil(box.y1)), pixels.shape[0] - int(box.y0)
+        crops.append(pixels[top:bottom, int(box.x0):int(np.ceil(box.x1))].copy())
+    return crops
+
+
+def test_blitted_refresh_redraws_changed_titles():
+    x_values, pdf, cdf = generate_data_batch([0.0], [1.0], [(-5.0, 5.0)], num_points=200)
+    first = [{'mean': 0, 'std': 1, 'tail': 'lower', 'threshold': -0.5}]
+    # Same curves and axis limits, but a different distribution name in the titles and legends
+    second = [{'mean': 1, 'std': 1, 'tail': 'lower', 'threshold': -0.5}]
+
+    figure = DistributionFigure(1, blit=True)
+    FigureCanvasAgg(figure.fig)
+    figure.update(x_values, pdf, cdf, first)
+    figure.refresh()
+    figure.update(x_values, pdf, cdf, second)
+    figure.refresh()
+
+    reference = DistributionFigure(1)
+    FigureCanvasAgg(reference.fig)
+    reference.update(x_values, pdf, cdf, second)
+    reference.fig.canvas.draw()
+
+    assert figure.fig.axes[0].get_title() == 'PDF - Equation 1: N(1, 1)'
+    for blitted, expected in zip(_title_pixels(figure), _title_pixels(reference)):
+        np.testing.assert_array_equal(blitted, expected)
@@ -0,0 +1,56 @@
+import json
+
+import numpy as np
+import pytest
+
+from mae3403 import instrumentation
+from mae3403.equations import find_intersections
+from mae3403.linear_solvers import solve_matrix_equation
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.enable()
+    yield instrumentation.metrics
+    instrumentation.disable()
+    instrumentation.metrics.reset()
+
+
+def test_disabled_instrumentation_records_nothing():
+    instrumentation.metrics.reset()
+    assert not instrumentation.is_enabled()
+    instrumentation.count('test.events')
+    with instrumentation.timer('test.block'):
+        pass
+    find_intersections()
+    assert instrumentation.metrics.as_dict()['timers'] == {}
+    assert instrumentation.metrics.as_dict()['counters'] == {}
+
+
+def test_timers_and_counters_of_the_solver_paths(enabled):
+    find_intersections()
+    find_intersections()
+    solve_matrix_equation(np.eye(3) * 2.0, np.ones(3))
+    with instrumentation.timer('plot.block'):
+        instrumentation.count('test.events', 3)
+    result = enabled.as_dict()
+    timer = result['timers']['numerics.find_intersections']
+    assert timer['count'] == 2 and 0 <= timer['min'] <= timer['mean'] <= timer['max']
+    assert result['timers']['numerics.solve_matrix_equation']['count'] == 1
+    assert result['timers']['plot.block']['count'] == 1
+    assert result['counters']['test.events'] == 3
+    assert result['counters']['bracket_search.function_evaluations'] == 2000
+
+
+def test_export_formats(enabled, tmp_path):
+    instrumentation.count('test.events', 2)
+    with instrumentation.timer('numerics.block'):
+        pass
+    instrumentation.write_metrics(tmp_path / 'metrics.json')
+    instrumentation.write_metrics(tmp_path / 'metrics.prom')
+    assert json.loads((tmp_path / 'metrics.json').read_text())['counters'] == {'test.events': 2}
+    text = (tmp_path / 'metrics.prom').read_text()
+    assert 'mae3403_events_total{event="test.events"} 2' in text
+    assert 'mae3403_stage_seconds_count{stage="numerics.block"} 1' in text
+    with pytest.raises(ValueError):
+        instrumentation.write_metrics(tmp_path / 'metrics.csv', format='csv')
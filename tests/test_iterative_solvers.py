@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from mae3403.iterative_solvers import solve_iterative
+from mae3403.linear_solvers import solve_matrix_equation
+
+A1 = np.array([[3.0, 1.0, -1.0], [1.0, 4.0, 1.0], [2.0, 1.0, 2.0]])
+B1 = np.array([2.0, 12.0, 10.0])
+
+
+def test_default_method_solves_non_symmetric_system():
+    solution, telemetry = solve_iterative(A1, B1)
+    assert telemetry['method'] == 'gmres' and telemetry['converged']
+    np.testing.assert_allclose(solution, [1.0, 2.0, 3.0], rtol=1e-6)
+
+
+def test_cg_rejects_non_symmetric_matrix():
+    with pytest.raises(ValueError):
+        solve_iterative(A1, B1, method='cg')
+
+
+@pytest.mark.parametrize('method', ['gmres', 'jacobi', 'gauss_seidel'])
+def test_iterative_method_through_solve_matrix_equation(method):
+    solution, telemetry = solve_matrix_equation(A1, B1, method=method)
+    assert telemetry['converged']
+    np.testing.assert_allclose(solution, [1.0, 2.0, 3.0], rtol=1e-6)
+
+
+def test_solve_matrix_equation_forwards_iterative_options():
+    residuals = []
+    solution, telemetry = solve_matrix_equation(A1, B1, method='gauss_seidel', x0=[1.0, 2.0, 3.0], tol=1e-12,
+                                                callback=lambda k, r: residuals.append(r))
+    assert telemetry['iterations'] == 1 and residuals == list(telemetry['residual_history'])
+    with pytest.raises(ValueError):
+        solve_matrix_equation(A1, B1, x0=[1.0, 2.0, 3.0])
+
+
+def test_gmres_maxiter_counts_inner_iterations():
+    rng = np.random.default_rng(0)
+    matrix = np.eye(60) + rng.standard_normal((60, 60)) / 2
+    _, telemetry = solve_iterative(matrix, np.ones(60), method='gmres', tol=1e-14, maxiter=30)
+    assert not telemetry['converged']
+    assert telemetry['iterations'] <= 40
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+from mae3403.linear_solvers import (FactorizationCache, analyze_matrix, matrix_bandwidth, solve_batched,
+                                    solve_matrix_equation, solve_structured, solve_with_diagnostics)
+
+
+def test_solve_matrix_equation_matches_example():
+    coeff_matrix = np.array([[3, 1, -1], [1, 4, 1], [2, 1, 2]])
+    constant_vector = np.array([2, 12, 10])
+    np.testing.assert_allclose(solve_matrix_equation(coeff_matrix, constant_vector), [1.0, 2.0, 3.0])
+
+
+def test_singular_matrix_raises():
+    cache = FactorizationCache()
+    with pytest.raises(np.linalg.LinAlgError):
+        solve_matrix_equation(np.array([[1.0, 2.0], [2.0, 4.0]]), np.array([1.0, 2.0]), cache=cache)
+    assert len(cache) == 0
+
+
+def test_non_finite_matrix_raises():
+    with pytest.raises((np.linalg.LinAlgError, ValueError)):
+        solve_matrix_equation(np.array([[np.inf, 0.0], [0.0, 1.0]]), np.array([1.0, 2.0]), cache=FactorizationCache())
+
+
+def test_float32_input_is_solved_in_double_precision():
+    rng = np.random.default_rng(0)
+    coeff_matrix = (rng.standard_normal((50, 50)) + 50 * np.eye(50)).astype(np.float32)
+    constant_vector = rng.standard_normal(50).astype(np.float32)
+    solution = solve_matrix_equation(coeff_matrix, constant_vector, cache=FactorizationCache())
+    residual = coeff_matrix.astype(float) @ solution - constant_vector
+    assert solution.dtype == np.float64
+    assert np.linalg.norm(residual) < 1e-12
+
+
+def test_mixed_precision_factors_are_cached_separately():
+    coeff_matrix = np.array([[3.0, 1.0, -1.0], [1.0, 4.0, 1.0], [2.0, 1.0, 2.0]])
+    cache = FactorizationCache()
+    solve_matrix_equation(coeff_matrix, np.array([2.0, 12.0, 10.0]), cache=cache)
+    solution, diagnostics = solve_matrix_equation(coeff_matrix, np.array([2.0, 12.0, 10.0]), cache=cache,
+                                                  diagnostics=True)
+    assert len(cache) == 2
+    assert diagnostics['precision'] == 'mixed' and diagnostics['converged']
+    np.testing.assert_allclose(solution, [1.0, 2.0, 3.0], rtol=1e-14)
+
+
+def test_batched_solve_matches_individual_solves():
+    rng = np.random.default_rng(1)
+    coeff_matrices = rng.standard_normal((20, 4, 4)) + 4 * np.eye(4)
+    constant_vectors = rng.standard_normal((20, 4))
+    solutions = solve_matrix_equation(coeff_matrices, constant_vectors)
+    assert solutions.shape == (20, 4)
+    for matrix, vector, solution in zip(coeff_matrices, constant_vectors, solutions):
+        np.testing.assert_allclose(solution, np.linalg.solve(matrix, vector), rtol=1e-12)
+    with pytest.raises(ValueError):
+        solve_batched(coeff_matrices, constant_vectors[:, :3])
+
+
+def test_factorization_is_reused_and_least_recently_used_is_evicted():
+    cache = FactorizationCache(maxsize=2)
+    first, second, third = (np.diag([1.0, 2.0, 3.0]) + k * np.ones((3, 3)) for k in range(3))
+    for vector in np.eye(3):
+        np.testing.assert_allclose(first @ cache.solve(first, vector), vector)
+    assert (cache.hits, cache.misses) == (2, 1)
+    cache.solve(second, np.ones(3))
+    cache.solve(first, np.ones(3))
+    cache.solve(third, np.ones(3))
+    assert len(cache) == 2
+    cache.solve(second, np.ones(3))
+    assert (cache.hits, cache.misses) == (3, 4)
+
+
+def _structured_matrices(n=300):
+    rng = np.random.default_rng(2)
+    dense = rng.standard_normal((n, n)) + n * np.eye(n)
+    tridiagonal = np.diag(np.full(n, 4.0)) + np.diag(np.ones(n - 1), 1) + np.diag(np.ones(n - 1), -1)
+    tridiagonal[0, 1] = 2.0
+    spd = dense @ dense.T
+    scattered = np.where(rng.random((n, n)) < 0.05, rng.standard_normal((n, n)), 0.0) + n * np.eye(n)
+    return {'triangular': np.tril(dense), 'banded': tridiagonal, 'cholesky': spd, 'sparse': scattered,
+            'dense': dense}
+
+
+@pytest.mark.parametrize('expected', ['triangular', 'banded', 'cholesky', 'sparse', 'dense'])
+def test_structure_is_detected_and_solved(expected):
+    coeff_matrix = _structured_matrices()[expected]
+    constant_vector = np.arange(coeff_matrix.shape[0], dtype=float)
+    assert analyze_matrix(coeff_matrix) == expected
+    solution, backend = solve_structured(coeff_matrix, constant_vector)
+    assert backend == expected
+    np.testing.assert_allclose(coeff_matrix @ solution, constant_vector, atol=1e-8)
+
+
+def test_scipy_sparse_input_stays_sparse():
+    from scipy import sparse
+    coeff_matrix = sparse.csr_matrix(_structured_matrices()['banded'])
+    solution, backend = solve_structured(coeff_matrix, np.ones(coeff_matrix.shape[0]))
+    assert backend == 'sparse'
+    np.testing.assert_allclose(coeff_matrix @ solution, 1.0)
+
+
+def test_cholesky_falls_back_to_dense_for_indefinite_matrices():
+    coeff_matrix = np.array([[1.0, 2.0, 0.5], [2.0, 1.0, 0.3], [0.5, 0.3, 1.0]])
+    solution, backend = solve_structured(coeff_matrix, np.ones(3), backend='cholesky')
+    assert backend == 'dense'
+    np.testing.assert_allclose(coeff_matrix @ solution, 1.0)
+    assert matrix_bandwidth(np.triu(coeff_matrix)) == (0, 2)
+
+
+def test_diagnostics_report_conditioning_and_accuracy():
+    rng = np.random.default_rng(3)
+    coeff_matrix = rng.standard_normal((40, 40)) + 10 * np.eye(40)
+    constant_vector = rng.standard_normal((40, 2))
+    solution, diagnostics = solve_with_diagnostics(coeff_matrix, constant_vector, cache=FactorizationCache())
+    exact_condition = np.linalg.cond(coeff_matrix, 1)
+    assert exact_condition / 10 <= diagnostics['condition_number'] <= exact_condition * 10
+    assert diagnostics['precision'] == 'mixed' and diagnostics['converged'] and not diagnostics['near_singular']
+    assert diagnostics['backward_error'].shape == (2,) and np.all(diagnostics['backward_error'] < 1e-15)
+    np.testing.assert_allclose(solution, np.linalg.solve(coeff_matrix, constant_vector), rtol=1e-12)
+
+
+def test_ill_conditioned_mixed_solve_falls_back_to_double():
+    n = 10
+    hilbert = 1.0 / (np.arange(n)[:, None] + np.arange(n) + 1.0)
+    constant_vector = hilbert @ np.ones(n)
+    solution, diagnostics = solve_with_diagnostics(hilbert, constant_vector, cache=FactorizationCache())
+    _, double = solve_with_diagnostics(hilbert, constant_vector, precision='double', cache=FactorizationCache())
+    assert diagnostics['precision'] == 'double'
+    assert diagnostics['condition_number'] > 1e12
+    assert diagnostics['backward_error'] <= 10 * double['backward_error'] + 1e-16
+    np.testing.assert_allclose(solution, np.ones(n), rtol=1e-3)
+    with pytest.raises(ValueError):
+        solve_with_diagnostics(hilbert, constant_vector, precision='half')
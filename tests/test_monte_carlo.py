@@ -0,0 +1,46 @@
+import numpy as np
+from scipy import stats
+
+from mae3403.monte_carlo import StreamingHistogram, goodness_of_fit, run_monte_carlo
+
+
+def test_streaming_moments_match_numpy_on_shifted_data():
+    rng = np.random.default_rng(1)
+    samples = 1e8 + rng.normal(0.0, 3.0, 200_000)
+    histogram = StreamingHistogram(np.linspace(1e8 - 15, 1e8 + 15, 31))
+    for batch in np.array_split(samples, 7):
+        histogram.add(batch)
+    np.testing.assert_allclose(histogram.mean, samples.mean(), rtol=1e-15)
+    np.testing.assert_allclose(histogram.std, np.std(samples, ddof=1), rtol=1e-9)
+
+
+def test_merged_histograms_equal_one_histogram():
+    rng = np.random.default_rng(2)
+    samples = rng.normal(175.0, 3.0, 10_000)
+    edges = np.linspace(160.0, 190.0, 61)
+    whole, left, right = StreamingHistogram(edges), StreamingHistogram(edges), StreamingHistogram(edges)
+    whole.add(samples)
+    left.add(samples[:3000])
+    right.add(samples[3000:])
+    left.merge(right)
+    np.testing.assert_array_equal(left.counts, whole.counts)
+    np.testing.assert_allclose(left.std, np.std(samples, ddof=1), rtol=1e-12)
+    assert left.counts.sum() == samples.size
+
+
+def test_exact_statistics_match_scipy():
+    samples = np.random.default_rng(3).normal(175.0, 3.0, 2000)
+    result = goodness_of_fit(samples, 175.0, 3.0)
+    np.testing.assert_allclose(result['ks'], stats.kstest(samples, 'norm', args=(175.0, 3.0)).statistic)
+    z = np.sort((samples - 175.0) / 3.0)
+    i = np.arange(1, z.size + 1)
+    expected = -z.size - np.sum((2 * i - 1) * (np.log(stats.norm.cdf(z)) + np.log(stats.norm.sf(z[::-1])))) / z.size
+    np.testing.assert_allclose(result['anderson_darling'], expected)
+
+
+def test_run_is_reproducible_and_independent_of_the_process_count():
+    edges = np.linspace(-5.0, 5.0, 41)
+    first, fit = run_monte_carlo(0.0, 1.0, 50_000, edges, num_streams=4, seed=7, batch_size=4096, processes=1)
+    second, _ = run_monte_carlo(0.0, 1.0, 50_000, edges, num_streams=4, seed=7, batch_size=10_000, processes=2)
+    np.testing.assert_array_equal(first.counts, second.counts)
+    assert fit['n'] == 50_000 and fit['ks'] < 0.01
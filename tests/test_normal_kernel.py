@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from mae3403.normal_kernel import norm_cdf, norm_logpdf, norm_pdf, norm_sf
+
+X = np.linspace(150.0, 200.0, 1001)
+
+
+@pytest.mark.parametrize('kernel, reference', [(norm_pdf, stats.norm.pdf), (norm_logpdf, stats.norm.logpdf),
+                                               (norm_cdf, stats.norm.cdf), (norm_sf, stats.norm.sf)])
+def test_kernels_match_scipy(kernel, reference):
+    np.testing.assert_allclose(kernel(X, 175.0, 3.0), reference(X, 175.0, 3.0), rtol=1e-13, atol=1e-300)
+
+
+def test_tails_keep_relative_accuracy():
+    x = np.array([-40.0, -10.0, 10.0, 40.0])
+    np.testing.assert_allclose(norm_cdf(x), stats.norm.cdf(x), rtol=1e-12)
+    np.testing.assert_allclose(norm_sf(x), stats.norm.sf(x), rtol=1e-12)
+
+
+def test_parameters_broadcast_against_x():
+    means, stds = np.array([[0.0], [175.0]]), np.array([[1.0], [3.0]])
+    x = np.stack((np.linspace(-5.0, 5.0, 7), np.linspace(160.0, 190.0, 7)))
+    np.testing.assert_allclose(norm_pdf(x, means, stds), stats.norm.pdf(x, means, stds), rtol=1e-13)
+
+
+def test_output_buffer_is_filled_in_place():
+    out = np.empty_like(X)
+    assert norm_cdf(X, 175.0, 3.0, out=out) is out
+    np.testing.assert_allclose(out, stats.norm.cdf(X, 175.0, 3.0), rtol=1e-13)
+
+
+def test_float32_path():
+    pdf = norm_pdf(X, 175.0, 3.0, dtype=np.float32)
+    cdf = norm_cdf(X, 175.0, 3.0, dtype=np.float32)
+    assert pdf.dtype == cdf.dtype == np.float32
+    np.testing.assert_allclose(pdf, stats.norm.pdf(X, 175.0, 3.0), rtol=1e-4, atol=1e-7)
+    np.testing.assert_allclose(cdf, stats.norm.cdf(X, 175.0, 3.0), rtol=1e-4, atol=1e-7)
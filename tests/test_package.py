@@ -0,0 +1,33 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import mae3403
+
+REPO = Path(__file__).resolve().parents[1]
+HEAVY = ('scipy', 'sympy', 'matplotlib', 'pyarrow', 'h5py')
+
+
+def _loaded_after(statement):
+    code = f"import sys; {statement}; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=REPO)
+    return result.stdout.split()
+
+
+@pytest.mark.parametrize('statement', [
+    'import mae3403',
+    'from mae3403 import equation1, norm_pdf, generate_data, probability_below',
+    'from mae3403 import monte_carlo, iterative_solvers, equation_registry, linear_solvers, root_finding',
+])
+def test_imports_do_not_load_heavy_dependencies(statement):
+    assert _loaded_after(statement) == []
+
+
+def test_every_export_resolves():
+    for name in mae3403.__all__:
+        assert getattr(mae3403, name) is not None
+    assert set(mae3403.__all__) <= set(dir(mae3403))
+    with pytest.raises(AttributeError):
+        mae3403.not_a_name
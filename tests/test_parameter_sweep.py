@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from mae3403.equations import DEFAULT_PARAMETERS, equation1, equation2, find_intersections
+from mae3403.parameter_sweep import make_parameter_grid, run_sweep, write_sweep
+from mae3403.result_sinks import load_results, open_sink
+
+
+def test_parameterized_equations_default_to_the_original_ones():
+    x = np.linspace(-5.0, 5.0, 11)
+    np.testing.assert_array_equal(equation1(x), x - 3 * np.cos(x))
+    np.testing.assert_array_equal(equation2(x), np.cos(2 * x) * x ** 3)
+
+
+def test_parameter_grid():
+    grid = make_parameter_grid(b=[1.0, 2.0, 3.0], d=[1.5, 2.5])
+    assert grid.shape == (6, 5)
+    np.testing.assert_array_equal(grid[:, 0], 1.0)
+    np.testing.assert_array_equal(grid[:, 1], [1.0, 1.0, 2.0, 2.0, 3.0, 3.0])
+    np.testing.assert_array_equal(grid[:, 3], [1.5, 2.5] * 3)
+    with pytest.raises(ValueError):
+        make_parameter_grid(f=[1.0])
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_sweep_matches_individual_searches(processes):
+    grid = make_parameter_grid(b=np.linspace(1.0, 4.0, 7), c=[0.5, 1.0])
+    table = run_sweep(grid, processes=processes, chunksize=3)
+    assert table['root_offsets'][-1] == table['roots'].size
+    for i, row in enumerate(grid):
+        roots = table['roots'][table['root_offsets'][i]:table['root_offsets'][i + 1]]
+        np.testing.assert_array_equal(roots, find_intersections(tuple(row)))
+        assert table['n_roots'][i] == roots.size
+
+
+def test_sweep_written_to_a_sink(tmp_path):
+    grid = make_parameter_grid(a=np.linspace(0.5, 2.0, 5))
+    with open_sink(tmp_path / 'sweep.npz') as sink:
+        assert write_sweep(grid, sink, processes=1, chunksize=2) == 5
+    columns, metadata = load_results(tmp_path / 'sweep.npz')
+    assert metadata['num_points'] == 1000
+    np.testing.assert_array_equal(columns['index'], np.arange(5))
+    np.testing.assert_array_equal(columns['a'], grid[:, 0])
+    first = columns['roots'][columns['roots_offsets'][0]:columns['roots_offsets'][1]]
+    np.testing.assert_array_equal(first, find_intersections((0.5,) + DEFAULT_PARAMETERS[1:]))
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from mae3403.probability_queries import (probability_above, probability_below, probability_between, quantile,
+                                         resolve_tail_annotations, upper_quantile)
+
+
+def test_tail_probabilities_of_the_original_annotations():
+    np.testing.assert_allclose(probability_below(-0.5), stats.norm.cdf(-0.5), rtol=1e-14)
+    np.testing.assert_allclose(probability_above(181.5, 175, 3), stats.norm.sf(181.5, 175, 3), rtol=1e-14)
+
+
+def test_interval_probability_keeps_upper_tail_accuracy():
+    a, b = np.array([-1.0, 9.0, 2.0]), np.array([1.0, 10.0, 1.0])
+    np.testing.assert_allclose(probability_between(a, b), [stats.norm.cdf(1) - stats.norm.cdf(-1),
+                                                          stats.norm.sf(9) - stats.norm.sf(10), 0.0], rtol=1e-12)
+
+
+def test_quantiles_invert_the_tail_probabilities():
+    p = np.array([1e-20, 0.01, 0.5, 0.9])
+    np.testing.assert_allclose(probability_below(quantile(p, 175, 3), 175, 3), p, rtol=1e-12)
+    np.testing.assert_allclose(probability_above(upper_quantile(p, 175, 3), 175, 3), p, rtol=1e-12)
+
+
+def test_annotations_are_resolved_from_thresholds_or_probabilities():
+    notes = resolve_tail_annotations([{'mean': 0, 'std': 1, 'tail': 'lower', 'threshold': -0.5},
+                                      {'mean': 175, 'std': 3, 'tail': 'upper', 'probability': 0.05}])
+    np.testing.assert_allclose(notes[0]['probability'], stats.norm.cdf(-0.5), rtol=1e-14)
+    np.testing.assert_allclose(notes[1]['threshold'], stats.norm.isf(0.05, 175, 3), rtol=1e-14)
+    np.testing.assert_allclose(notes[1]['probability'], 0.05, rtol=1e-12)
+    with pytest.raises(ValueError):
+        resolve_tail_annotations([{'mean': 0, 'std': 1, 'tail': 'lower'}])
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mae3403.distributions import generate_data
+from mae3403.figures import plot_distributions, plot_equations_with_intersections, plot_solution_tables
+from mae3403.rendering import render_figure, render_many
+
+
+@pytest.mark.parametrize('format, magic', [('png', b'\x89PNG'), ('svg', b'<?xml'), ('pdf', b'%PDF')])
+def test_render_to_bytes(format, magic):
+    assert render_figure(plot_solution_tables([np.array([1.0, 2.0, 3.0])]), format=format).startswith(magic)
+
+
+def test_render_to_a_file_uses_the_extension(tmp_path):
+    path = render_figure(plot_equations_with_intersections(), tmp_path / 'intersections.svg')
+    assert path == str(tmp_path / 'intersections.svg')
+    assert (tmp_path / 'intersections.svg').read_bytes().startswith(b'<?xml')
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_render_many(tmp_path, processes):
+    data = generate_data()
+    tasks = [(plot_distributions, {'data': data}, 'distributions.png'),
+             (plot_solution_tables, {'solutions': [np.ones(3)]}, None)]
+    path, image = render_many(tasks, output_dir=tmp_path / 'out', processes=processes)
+    assert path == str(tmp_path / 'out' / 'distributions.png')
+    assert (tmp_path / 'out' / 'distributions.png').read_bytes().startswith(b'\x89PNG')
+    assert image.startswith(b'\x89PNG')
+
+
+def test_rendering_does_not_load_pyplot():
+    code = ("import sys; from mae3403.figures import plot_solution_tables; from mae3403.rendering import render_figure;"
+            "render_figure(plot_solution_tables([[1.0]])); print('matplotlib.pyplot' in sys.modules)")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).resolve().parents[1])
+    assert result.stdout.strip() == 'False'
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from mae3403.result_sinks import ResultSink, load_results, open_sink
+
+
+def test_incomplete_sink_fails_on_construction(tmp_path):
+    class IncompleteSink(ResultSink):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteSink(tmp_path / 'results.npz')
+
+
+@pytest.mark.parametrize('compress', [True, False])
+def test_npz_round_trip_with_chunks(tmp_path, compress):
+    path = tmp_path / 'results.npz'
+    with open_sink(path, metadata={'solver': 'brentq'}, compress=compress) as sink:
+        sink.append(index=np.arange(2), roots=[np.array([1.0, 2.0]), np.array([3.0])])
+        sink.append(index=np.arange(2, 3), roots=[np.array([4.0, 5.0, 6.0])])
+    columns, metadata = load_results(path)
+    assert metadata == {'solver': 'brentq'}
+    np.testing.assert_array_equal(columns['index'], [0, 1, 2])
+    np.testing.assert_array_equal(columns['roots'], [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    np.testing.assert_array_equal(columns['roots_offsets'], [0, 2, 3, 6])
+    assert isinstance(columns['roots'], np.memmap) != compress
+
+
+@pytest.mark.parametrize('path', ['results.npz', 'results.parquet', 'results.h5'])
+def test_empty_chunk_of_a_ragged_column(tmp_path, path):
+    with open_sink(tmp_path / path) as sink:
+        sink.append(index=np.arange(1), roots=[np.array([1, 2])])
+        sink.append(index=[], roots=[])
+        sink.append(index=np.arange(1, 2), roots=[np.array([3])])
+    columns, _ = load_results(tmp_path / path)
+    np.testing.assert_array_equal(columns['index'], [0, 1])
+    np.testing.assert_array_equal(columns['roots'], [1, 2, 3])
+    assert columns['roots'].dtype == np.int64
+    np.testing.assert_array_equal(columns['roots_offsets'], [0, 2, 3])
+
+
+def test_unclosed_npz_sink_is_recovered_from_its_chunks(tmp_path):
+    path = tmp_path / 'results.npz'
+    sink = open_sink(path, metadata={'run': 1})
+    sink.append(index=np.arange(2), roots=[np.array([1.0, 2.0]), np.array([3.0])])
+    sink.append(index=np.arange(2, 3), roots=[np.array([4.0])])
+    # Simulate a crash in the middle of the third chunk
+    (tmp_path / 'results.npz.parts' / '00000002.tmp').mkdir()
+    assert not path.exists()
+    columns, metadata = load_results(path)
+    assert metadata == {'run': 1}
+    np.testing.assert_array_equal(columns['index'], [0, 1, 2])
+    np.testing.assert_array_equal(columns['roots'], [1.0, 2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(columns['roots_offsets'], [0, 2, 3, 4])
@@ -0,0 +1,53 @@
+import numpy as np
+
+from mae3403.equations import equation1, equation1_derivative, equation2, find_intersections, intersection_function
+from mae3403.root_finding import batch_newton, find_roots_bracketed, find_sign_change_brackets, merge_roots
+
+
+def test_brackets_skip_non_finite_samples_and_report_exact_zeros():
+    x = np.arange(6.0)
+    left, right, exact = find_sign_change_brackets(x, [-1.0, 1.0, 0.0, np.nan, -1.0, 2.0])
+    np.testing.assert_array_equal(left, [0.0, 4.0])
+    np.testing.assert_array_equal(right, [1.0, 5.0])
+    np.testing.assert_array_equal(exact, [2.0])
+
+
+def test_merge_roots_collapses_near_duplicates():
+    np.testing.assert_allclose(merge_roots([2.0, 1.0, 1.0 + 1e-12, 3.0]), [1.0, 2.0, 3.0])
+    assert merge_roots([]).size == 0
+
+
+def test_all_roots_of_a_polynomial():
+    roots = find_roots_bracketed(lambda x: (x + 2) * (x - 0.5) * (x - 3), -5.0, 5.0, num_points=100)
+    np.testing.assert_allclose(roots, [-2.0, 0.5, 3.0], atol=1e-12)
+
+
+def test_intersections_are_roots_and_none_is_missed_on_a_fine_grid():
+    roots = find_intersections()
+    np.testing.assert_allclose(intersection_function(roots), 0.0, atol=1e-9)
+    np.testing.assert_allclose(roots, find_intersections(num_points=100_000), atol=1e-10)
+    assert roots.size == 5
+
+
+def test_batch_newton_solves_every_lane():
+    roots, converged = batch_newton(lambda x, c: x ** 2 - c, [1.0, 1.0, 3.0], fprime=lambda x, c: 2 * x,
+                                    args=([2.0, 9.0, 16.0],))
+    assert converged.all()
+    np.testing.assert_allclose(roots, [np.sqrt(2.0), 3.0, 4.0])
+
+
+def test_batch_newton_with_finite_differences_matches_analytic_derivative():
+    x0 = [0.0, 1.0, 2.0, 3.0, 4.0]
+    analytic, converged = batch_newton(equation1, x0, fprime=equation1_derivative)
+    numeric, converged_fd = batch_newton(equation1, x0)
+    assert converged.all() and converged_fd.all()
+    np.testing.assert_allclose(numeric, analytic, atol=1e-9)
+    np.testing.assert_allclose(equation1(analytic), 0.0, atol=1e-12)
+
+
+def test_batch_newton_marks_failed_lanes():
+    roots, converged = batch_newton(lambda x: x ** 2 + 1.0, [0.0, 1.0], fprime=lambda x: 2 * x, maxiter=20)
+    assert not converged.any()
+    roots, converged = batch_newton(equation2, [0.0, 0.7])
+    assert converged.all()
+    np.testing.assert_allclose(roots[1], np.pi / 4)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from mae3403.equations import (DEFAULT_PARAMETERS, find_intersections, find_intersections_certified,
+                               intersection_derivative, intersection_derivative_bounds)
+from mae3403.root_finding import find_roots_bracketed
+from mae3403.root_isolation import (interval_add, interval_cos, interval_mul, interval_power, interval_scale,
+                                    interval_sin, isolate_roots)
+
+RNG = np.random.default_rng(0)
+LO = RNG.uniform(-6.0, 6.0, 500)
+HI = LO + RNG.uniform(0.0, 3.0, 500)
+SAMPLES = LO + (HI - LO) * np.linspace(0.0, 1.0, 41)[:, None]
+
+
+def assert_encloses(bounds, values):
+    assert np.all(bounds[0] <= values.min(axis=0)) and np.all(values.max(axis=0) <= bounds[1])
+
+
+@pytest.mark.parametrize('operation, exact', [
+    (lambda lo, hi: interval_sin(lo, hi), np.sin),
+    (lambda lo, hi: interval_cos(lo, hi), np.cos),
+    (lambda lo, hi: interval_scale(lo, hi, -2.5), lambda x: -2.5 * x),
+    (lambda lo, hi: interval_power(lo, hi, 2), lambda x: x ** 2),
+    (lambda lo, hi: interval_power(lo, hi, 3), lambda x: x ** 3),
+    (lambda lo, hi: interval_mul((lo, hi), interval_cos(lo, hi)), lambda x: x * np.cos(x)),
+    (lambda lo, hi: interval_add((lo, hi), interval_sin(lo, hi)), lambda x: x + np.sin(x)),
+])
+def test_interval_operations_enclose_their_range(operation, exact):
+    assert_encloses(operation(LO, HI), exact(SAMPLES))
+
+
+def test_derivative_bounds_enclose_the_derivative():
+    assert_encloses(intersection_derivative_bounds(LO, HI, *DEFAULT_PARAMETERS), intersection_derivative(SAMPLES))
+
+
+def test_certified_intersections_match_a_dense_search():
+    roots, unresolved, evaluations = find_intersections_certified()
+    assert unresolved == []
+    np.testing.assert_allclose(roots, find_intersections(num_points=200_000), atol=1e-10)
+    assert evaluations < 1000
+
+
+def test_close_pair_missed_by_the_grid_is_found():
+    func = lambda x: (x - 1.0) * (x - 1.0 - 1e-6)
+    bounds = lambda lo, hi: (2 * lo - 2.0 - 1e-6, 2 * hi - 2.0 - 1e-6)
+    assert find_roots_bracketed(func, -5.0, 5.0).size == 0
+    roots, unresolved, _ = isolate_roots(func, bounds, -5.0, 5.0)
+    np.testing.assert_allclose(roots, [1.0, 1.0 + 1e-6], atol=1e-12)
+    assert unresolved == []
+
+
+def test_double_root_is_reported_as_unresolved():
+    roots, unresolved, _ = isolate_roots(lambda x: (x - 0.3) ** 2, lambda lo, hi: (2 * lo - 0.6, 2 * hi - 0.6),
+                                         -1.0, 1.0, min_width=1e-6)
+    assert roots.size == 0 or np.allclose(roots, 0.3)
+    assert unresolved and all(lo <= 0.3 <= hi for lo, hi in unresolved)